@@ -0,0 +1,44 @@
+"""world memory halfvec hnsw
+
+Revision ID: 3f1c9a7e5b20
+Revises: d7e8f9a0b1c2
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c9a7e5b20"
+down_revision: str | Sequence[str] | None = "d7e8f9a0b1c2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The ivfflat index uses vector_cosine_ops, which cannot follow the column to halfvec
+    op.execute("DROP INDEX IF EXISTS idx_world_embedding")
+    op.execute(
+        "ALTER TABLE world_memories "
+        "ALTER COLUMN embedding TYPE halfvec(768) USING embedding::halfvec(768)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_world_embedding ON world_memories "
+        "USING hnsw (embedding halfvec_cosine_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS idx_world_embedding")
+    op.execute(
+        "ALTER TABLE world_memories "
+        "ALTER COLUMN embedding TYPE vector(768) USING embedding::vector(768)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_world_embedding ON world_memories "
+        "USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100)"
+    )
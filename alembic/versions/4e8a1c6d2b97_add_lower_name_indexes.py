@@ -0,0 +1,39 @@
+"""add lower name indexes
+
+Revision ID: 4e8a1c6d2b97
+Revises: 9b3f5d7a2c61
+Create Date: 2026-10-19 03:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4e8a1c6d2b97"
+down_revision: str | Sequence[str] | None = "9b3f5d7a2c61"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index, table, column) for lookups through get_by_field(case_sensitive=False)
+LOWER_INDEXES: list[tuple[str, str, str]] = [
+    ("ix_characters_name_lower", "characters", "name"),
+    ("ix_item_templates_name_lower", "item_templates", "name"),
+    ("ix_location_nodes_location_name_lower", "location_nodes", "location_name"),
+    ("ix_location_facts_location_name_lower", "location_facts", "location_name"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for index, table, column in LOWER_INDEXES:
+        op.create_index(index, table, [sa.text(f"lower({column})")], if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for index, table, _ in LOWER_INDEXES:
+        op.drop_index(index, table_name=table, if_exists=True)
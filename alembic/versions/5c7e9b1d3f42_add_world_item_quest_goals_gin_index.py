@@ -0,0 +1,29 @@
+"""add world item quest goals gin index
+
+Revision ID: 5c7e9b1d3f42
+Revises: 8a2d4e6f1b93
+Create Date: 2026-10-19 01:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c7e9b1d3f42"
+down_revision: str | Sequence[str] | None = "8a2d4e6f1b93"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_world_items_quest_goals", "world_items", ["quest_goals"], postgresql_using="gin"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_world_items_quest_goals", table_name="world_items")
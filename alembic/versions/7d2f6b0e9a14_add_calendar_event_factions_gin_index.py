@@ -0,0 +1,32 @@
+"""add calendar event factions gin index
+
+Revision ID: 7d2f6b0e9a14
+Revises: 4e8a1c6d2b97
+Create Date: 2026-10-19 04:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2f6b0e9a14"
+down_revision: str | Sequence[str] | None = "4e8a1c6d2b97"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_calendar_events_affected_factions",
+        "calendar_events",
+        ["affected_factions"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_calendar_events_affected_factions", table_name="calendar_events")
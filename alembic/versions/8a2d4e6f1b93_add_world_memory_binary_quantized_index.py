@@ -0,0 +1,30 @@
+"""add world memory binary quantized index
+
+Revision ID: 8a2d4e6f1b93
+Revises: 3f1c9a7e5b20
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8a2d4e6f1b93"
+down_revision: str | Sequence[str] | None = "3f1c9a7e5b20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_world_embedding_bq ON world_memories "
+        "USING hnsw ((binary_quantize(embedding)::bit(768)) bit_hamming_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS idx_world_embedding_bq")
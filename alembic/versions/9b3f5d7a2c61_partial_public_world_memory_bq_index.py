@@ -0,0 +1,37 @@
+"""partial public world memory bq index
+
+Revision ID: 9b3f5d7a2c61
+Revises: 5c7e9b1d3f42
+Create Date: 2026-10-19 02:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b3f5d7a2c61"
+down_revision: str | Sequence[str] | None = "5c7e9b1d3f42"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DROP INDEX IF EXISTS idx_world_embedding_bq")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_world_embedding_bq_public ON world_memories "
+        "USING hnsw ((binary_quantize(embedding)::bit(768)) bit_hamming_ops) WHERE is_public"
+    )
+    op.drop_index("ix_world_memories_is_public", table_name="world_memories", if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_world_memories_is_public", "world_memories", ["is_public"])
+    op.execute("DROP INDEX IF EXISTS idx_world_embedding_bq_public")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_world_embedding_bq ON world_memories "
+        "USING hnsw ((binary_quantize(embedding)::bit(768)) bit_hamming_ops)"
+    )
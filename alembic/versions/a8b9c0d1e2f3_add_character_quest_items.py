@@ -0,0 +1,65 @@
+"""add character quest items
+
+Revision ID: a8b9c0d1e2f3
+Revises: f7a8b9c0d1e2
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8b9c0d1e2f3"
+down_revision: str | Sequence[str] | None = "f7a8b9c0d1e2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "character_quest_items",
+        sa.Column("character_id", sa.Uuid(), nullable=False),
+        sa.Column("quest_id", sa.Uuid(), nullable=False),
+        sa.Column("instance_id", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["character_id", "quest_id"],
+            ["character_quests.character_id", "character_quests.quest_id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("character_id", "quest_id", "instance_id"),
+    )
+    op.execute(
+        "INSERT INTO character_quest_items (character_id, quest_id, instance_id, name, quantity)"
+        " SELECT cq.character_id, cq.quest_id,"
+        " COALESCE(item->>'instance_id', gen_random_uuid()::text),"
+        " COALESCE(item->>'name', ''), COALESCE((item->>'quantity')::int, 1)"
+        " FROM character_quests cq, jsonb_array_elements(cq.items_given) AS item"
+        " WHERE jsonb_typeof(cq.items_given) = 'array'"
+        " ON CONFLICT DO NOTHING"
+    )
+    op.drop_column("character_quests", "items_given")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column(
+        "character_quests",
+        sa.Column("items_given", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.execute(
+        "UPDATE character_quests cq SET items_given = COALESCE("
+        "(SELECT jsonb_agg(jsonb_build_object("
+        "'name', i.name, 'quantity', i.quantity, 'instance_id', i.instance_id))"
+        " FROM character_quest_items i"
+        " WHERE i.character_id = cq.character_id AND i.quest_id = cq.quest_id), '[]'::jsonb)"
+    )
+    op.drop_table("character_quest_items")
@@ -0,0 +1,53 @@
+"""convert npc and memory json columns to jsonb
+
+Revision ID: b5c6d7e8f9a0
+Revises: a4b5c6d7e8f9
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5c6d7e8f9a0"
+down_revision: str | Sequence[str] | None = "a4b5c6d7e8f9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+JSONB_COLUMNS: dict[str, list[str]] = {
+    "npcs": ["stats", "effects"],
+    "session_memories": ["content"],
+    "npc_memories": ["meta_data"],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            # The columns now map None to SQL NULL, so fold stored JSON nulls into it
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSONB(astext_type=sa.Text()),
+                existing_type=postgresql.JSON(astext_type=sa.Text()),
+                postgresql_using=f"NULLIF({column}::jsonb, 'null'::jsonb)",
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSON(astext_type=sa.Text()),
+                existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                postgresql_using=f"{column}::json",
+            )
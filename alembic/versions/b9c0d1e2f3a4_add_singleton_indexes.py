@@ -0,0 +1,39 @@
+"""add singleton indexes
+
+Revision ID: b9c0d1e2f3a4
+Revises: a8b9c0d1e2f3
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b9c0d1e2f3a4"
+down_revision: str | Sequence[str] | None = "a8b9c0d1e2f3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SINGLETON_TABLES = ["game_settings", "game_time", "memory_settings"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in SINGLETON_TABLES:
+        # Each table was read as "any row", so keep the most recently updated one;
+        # the unique index cannot be built while duplicates remain
+        op.execute(
+            f"DELETE FROM {table} WHERE id NOT IN "
+            f"(SELECT id FROM {table} ORDER BY updated_at DESC LIMIT 1)"
+        )
+        op.create_index(f"uq_{table}_singleton", table, [sa.text("(true)")], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in SINGLETON_TABLES:
+        op.drop_index(f"uq_{table}_singleton", table_name=table)
@@ -0,0 +1,72 @@
+"""convert low cardinality columns to enums
+
+Revision ID: c0d1e2f3a4b5
+Revises: b9c0d1e2f3a4
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c0d1e2f3a4b5"
+down_revision: str | Sequence[str] | None = "b9c0d1e2f3a4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, enum type, enum labels); labels are the Python enum member names
+ENUM_COLUMNS: list[tuple[str, str, str, tuple[str, ...]]] = [
+    ("game_time", "season", "seasonname", ("SPRING", "SUMMER", "FALL", "WINTER")),
+    (
+        "game_time",
+        "day_of_week",
+        "dayofweek",
+        ("MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"),
+    ),
+    (
+        "item_templates",
+        "rarity",
+        "itemrarity",
+        ("COMMON", "UNCOMMON", "RARE", "EPIC", "LEGENDARY"),
+    ),
+    ("memory_snapshots", "snapshot_type", "snapshottype", ("WORLD_CHANGE", "EPISODE_PROMOTION")),
+]
+
+# Columns whose stored strings were the lowercase enum values rather than the names
+LOWERCASE_COLUMNS = {"rarity", "snapshot_type"}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    for table, column, type_name, labels in ENUM_COLUMNS:
+        enum_type = postgresql.ENUM(*labels, name=type_name)
+        enum_type.create(bind, checkfirst=True)
+        source = f"upper({column})" if column in LOWERCASE_COLUMNS else column
+        op.alter_column(
+            table,
+            column,
+            type_=enum_type,
+            existing_type=sa.String(),
+            postgresql_using=f"{source}::{type_name}",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    for table, column, type_name, labels in ENUM_COLUMNS:
+        target = f"lower({column}::text)" if column in LOWERCASE_COLUMNS else f"{column}::text"
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(),
+            existing_type=postgresql.ENUM(*labels, name=type_name),
+            postgresql_using=target,
+        )
+        postgresql.ENUM(name=type_name).drop(bind, checkfirst=True)
@@ -0,0 +1,72 @@
+"""convert json columns to jsonb
+
+Revision ID: c4d5e6f7a8b9
+Revises: 9bb9deb3daf9
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d5e6f7a8b9"
+down_revision: str | Sequence[str] | None = "9bb9deb3daf9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+JSONB_COLUMNS: dict[str, list[str]] = {
+    "item_templates": [
+        "equippable_slots",
+        "stat_bonuses",
+        "stat_multipliers",
+        "resource_bonuses",
+        "resource_regeneration_modifiers",
+        "damage_bonuses",
+        "damage_multipliers",
+        "healing_bonuses",
+    ],
+    "game_time": ["game_time_config"],
+    "location_nodes": ["atmosphere", "physical_properties", "character_associations"],
+    "location_edges": ["requirements", "conditions"],
+    "location_facts": [
+        "facts",
+        "connections",
+        "travel_requirements",
+        "physical_properties",
+        "constraints",
+    ],
+    "memory_snapshots": ["snapshot_data"],
+    "character_quests": ["items_given"],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            # The columns now map None to SQL NULL, so fold stored JSON nulls into it
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSONB(astext_type=sa.Text()),
+                existing_type=postgresql.JSON(astext_type=sa.Text()),
+                postgresql_using=f"NULLIF({column}::jsonb, 'null'::jsonb)",
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSON(astext_type=sa.Text()),
+                existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                postgresql_using=f"{column}::json",
+            )
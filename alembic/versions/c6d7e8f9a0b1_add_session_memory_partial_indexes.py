@@ -0,0 +1,46 @@
+"""add session memory partial indexes
+
+Revision ID: c6d7e8f9a0b1
+Revises: b5c6d7e8f9a0
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c6d7e8f9a0b1"
+down_revision: str | Sequence[str] | None = "b5c6d7e8f9a0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_session_memories_unprocessed",
+        "session_memories",
+        ["session_id", "timestamp"],
+        postgresql_where=sa.text("processed = false"),
+    )
+    op.create_index(
+        "ix_session_memories_expiry",
+        "session_memories",
+        ["expires_at"],
+        postgresql_where=sa.text("processed = true AND expires_at IS NOT NULL"),
+    )
+    # Superseded by the partial indexes above
+    op.drop_index("ix_session_memories_processed", table_name="session_memories", if_exists=True)
+    op.drop_index("ix_session_memories_expires_at", table_name="session_memories", if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_session_memories_expires_at", "session_memories", ["expires_at"])
+    op.create_index("ix_session_memories_processed", "session_memories", ["processed"])
+    op.drop_index("ix_session_memories_expiry", table_name="session_memories")
+    op.drop_index("ix_session_memories_unprocessed", table_name="session_memories")
@@ -0,0 +1,39 @@
+"""add covering indexes
+
+Revision ID: d1e2f3a4b5c6
+Revises: c0d1e2f3a4b5
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d1e2f3a4b5c6"
+down_revision: str | Sequence[str] | None = "c0d1e2f3a4b5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_items_by_category",
+        "item_templates",
+        ["category_id"],
+        postgresql_include=["name", "rarity", "value"],
+    )
+    op.create_index(
+        "ix_edges_to",
+        "location_edges",
+        ["to_location_id"],
+        postgresql_include=["from_location_id", "edge_type"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_edges_to", table_name="location_edges")
+    op.drop_index("ix_items_by_category", table_name="item_templates")
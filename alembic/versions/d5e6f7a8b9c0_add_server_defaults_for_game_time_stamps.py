@@ -0,0 +1,51 @@
+"""add server defaults for game time stamps
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7a8b9
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e6f7a8b9c0"
+down_revision: str | Sequence[str] | None = "c4d5e6f7a8b9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "game_time",
+        "current_game_time",
+        existing_type=sa.DateTime(timezone=True),
+        server_default=sa.func.now(),
+    )
+    op.alter_column(
+        "game_settings",
+        "game_epoch_start",
+        existing_type=sa.DateTime(timezone=True),
+        server_default=sa.func.now(),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "game_settings",
+        "game_epoch_start",
+        existing_type=sa.DateTime(timezone=True),
+        server_default=None,
+    )
+    op.alter_column(
+        "game_time",
+        "current_game_time",
+        existing_type=sa.DateTime(timezone=True),
+        server_default=None,
+    )
@@ -0,0 +1,66 @@
+"""convert world json columns to jsonb
+
+Revision ID: d7e8f9a0b1c2
+Revises: c6d7e8f9a0b1
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7e8f9a0b1c2"
+down_revision: str | Sequence[str] | None = "c6d7e8f9a0b1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+JSONB_COLUMNS: dict[str, list[str]] = {
+    "world_events": [
+        "start_conditions",
+        "end_conditions",
+        "start_game_time",
+        "end_game_time",
+        "recurrence_pattern",
+        "regional_scope",
+    ],
+    "world_items": ["collection_condition", "collected_at_game_time", "regional_availability"],
+    "world_memories": [
+        "related_entities",
+        "discovery_requirements",
+        "regional_context",
+        "game_time_context",
+    ],
+    "world_regions": ["custom_boundaries", "regional_variations"],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            # The columns now map None to SQL NULL, so fold stored JSON nulls into it
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSONB(astext_type=sa.Text()),
+                existing_type=postgresql.JSON(astext_type=sa.Text()),
+                postgresql_using=f"NULLIF({column}::jsonb, 'null'::jsonb)",
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSON(astext_type=sa.Text()),
+                existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                postgresql_using=f"{column}::json",
+            )
@@ -0,0 +1,39 @@
+"""add location graph delete rules
+
+Revision ID: e2f3a4b5c6d7
+Revises: d1e2f3a4b5c6
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2f3a4b5c6d7"
+down_revision: str | Sequence[str] | None = "d1e2f3a4b5c6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (constraint, table, column, ON DELETE action); the parent FK was named explicitly by
+# 20e59196ebcb, the edge FKs were left to Postgres' default names
+LOCATION_FOREIGN_KEYS = [
+    ("fk_location_nodes_parent_location", "location_nodes", "parent_location_id", "SET NULL"),
+    ("location_edges_from_location_id_fkey", "location_edges", "from_location_id", "CASCADE"),
+    ("location_edges_to_location_id_fkey", "location_edges", "to_location_id", "CASCADE"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, column, ondelete in LOCATION_FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(name, table, "location_nodes", [column], ["id"], ondelete=ondelete)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, column, _ in LOCATION_FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(name, table, "location_nodes", [column], ["id"])
@@ -0,0 +1,44 @@
+"""add reverse indexes to junction tables
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6f7a8b9c0d1"
+down_revision: str | Sequence[str] | None = "d5e6f7a8b9c0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Composite primary keys only cover lookups on their leading column, so index
+# the trailing column of each junction table (plus character_quests.session_id,
+# used to clean up quest items when a session ends).
+JUNCTION_INDEXES: list[tuple[str, str]] = [
+    ("player_characters", "character_id"),
+    ("game_session_players", "player_id"),
+    ("game_session_characters", "character_id"),
+    ("character_class_stats", "character_stat_id"),
+    ("character_quests", "quest_id"),
+    ("character_quests", "session_id"),
+    ("encounter_characters", "character_id"),
+    ("encounter_npcs", "npc_id"),
+    ("character_class_starting_equipment", "item_template_id"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in JUNCTION_INDEXES:
+        op.create_index(op.f(f"ix_{table}_{column}"), table, [column], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in reversed(JUNCTION_INDEXES):
+        op.drop_index(op.f(f"ix_{table}_{column}"), table_name=table)
@@ -0,0 +1,38 @@
+"""npc memory halfvec hnsw
+
+Revision ID: f3a4b5c6d7e8
+Revises: e2f3a4b5c6d7
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a4b5c6d7e8"
+down_revision: str | Sequence[str] | None = "e2f3a4b5c6d7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "ALTER TABLE npc_memories "
+        "ALTER COLUMN embedding TYPE halfvec(768) USING embedding::halfvec(768)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_npc_memory_embedding ON npc_memories "
+        "USING hnsw (embedding halfvec_cosine_ops) WITH (m = 12, ef_construction = 24)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS idx_npc_memory_embedding")
+    op.execute(
+        "ALTER TABLE npc_memories "
+        "ALTER COLUMN embedding TYPE vector(768) USING embedding::vector(768)"
+    )
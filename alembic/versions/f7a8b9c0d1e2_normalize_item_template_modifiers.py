@@ -0,0 +1,107 @@
+"""normalize item template modifiers
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a8b9c0d1e2"
+down_revision: str | Sequence[str] | None = "e6f7a8b9c0d1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+MODIFIER_KINDS = ("STAT", "RESOURCE", "RESOURCE_REGENERATION", "DAMAGE", "HEALING")
+
+# (JSON column, modifier kind, modifier column) for the flat {target: number} dicts
+FLAT_COLUMNS: list[tuple[str, str, str]] = [
+    ("stat_bonuses", "STAT", "bonus"),
+    ("stat_multipliers", "STAT", "multiplier"),
+    ("resource_bonuses", "RESOURCE", "bonus"),
+    ("damage_bonuses", "DAMAGE", "bonus"),
+    ("damage_multipliers", "DAMAGE", "multiplier"),
+    ("healing_bonuses", "HEALING", "bonus"),
+]
+REGENERATION_COLUMN = "resource_regeneration_modifiers"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "item_template_modifiers",
+        sa.Column("item_template_id", sa.Uuid(), nullable=False),
+        sa.Column("kind", sa.Enum(*MODIFIER_KINDS, name="itemmodifierkind"), nullable=False),
+        sa.Column("target", sa.String(), nullable=False),
+        sa.Column("bonus", sa.Float(), nullable=False),
+        sa.Column("multiplier", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["item_template_id"], ["item_templates.id"]),
+        sa.PrimaryKeyConstraint("item_template_id", "kind", "target"),
+    )
+
+    values = {
+        "bonus": "value::float AS bonus, NULL::float AS multiplier",
+        "multiplier": "NULL::float AS bonus, value::float AS multiplier",
+    }
+    sources = [
+        f"SELECT id, '{kind}' AS kind, key AS target, {values[attr]}"
+        f" FROM item_templates, jsonb_each_text({column})"
+        f" WHERE jsonb_typeof({column}) = 'object'"
+        for column, kind, attr in FLAT_COLUMNS
+    ]
+    sources.append(
+        "SELECT id, 'RESOURCE_REGENERATION' AS kind, key AS target,"
+        " (value->>'bonus')::float AS bonus, (value->>'multiplier')::float AS multiplier"
+        f" FROM item_templates, jsonb_each({REGENERATION_COLUMN})"
+        f" WHERE jsonb_typeof({REGENERATION_COLUMN}) = 'object'"
+    )
+    op.execute(
+        "INSERT INTO item_template_modifiers (item_template_id, kind, target, bonus, multiplier)"
+        " SELECT id, kind::itemmodifierkind, target,"
+        " COALESCE(SUM(bonus), 0), COALESCE(MAX(multiplier), 1)"
+        f" FROM ({' UNION ALL '.join(sources)}) AS src"
+        " GROUP BY id, kind, target"
+    )
+
+    for column, _kind, _attr in FLAT_COLUMNS:
+        op.drop_column("item_templates", column)
+    op.drop_column("item_templates", REGENERATION_COLUMN)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column, _kind, _attr in FLAT_COLUMNS:
+        op.add_column(
+            "item_templates",
+            sa.Column(column, postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        )
+    op.add_column(
+        "item_templates",
+        sa.Column(REGENERATION_COLUMN, postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+    for column, kind, attr in FLAT_COLUMNS:
+        neutral = 0 if attr == "bonus" else 1
+        op.execute(
+            f"UPDATE item_templates t SET {column} = COALESCE("
+            f"(SELECT jsonb_object_agg(m.target, m.{attr}) FROM item_template_modifiers m"
+            f" WHERE m.item_template_id = t.id AND m.kind = '{kind}'"
+            f" AND m.{attr} <> {neutral}), '{{}}'::jsonb)"
+        )
+    op.execute(
+        f"UPDATE item_templates t SET {REGENERATION_COLUMN} = COALESCE("
+        "(SELECT jsonb_object_agg(m.target,"
+        " jsonb_build_object('bonus', m.bonus, 'multiplier', m.multiplier))"
+        " FROM item_template_modifiers m"
+        " WHERE m.item_template_id = t.id AND m.kind = 'RESOURCE_REGENERATION'), '{}'::jsonb)"
+    )
+
+    op.drop_table("item_template_modifiers")
+    sa.Enum(name="itemmodifierkind").drop(op.get_bind(), checkfirst=True)
@@ -24,6 +24,7 @@ from ds_common.combat.models import (
 from ds_common.combat.resource_calculator import (
     calculate_max_armor,
     calculate_max_health,
+    calculate_max_resources,
     calculate_max_stamina,
     calculate_max_tech_power,
 )
@@ -48,6 +49,7 @@ __all__ = [
     "calculate_equipment_restoration_modifiers",
     "calculate_max_armor",
     "calculate_max_health",
+    "calculate_max_resources",
     "calculate_max_stamina",
     "calculate_max_tech_power",
     "calculate_restoration_rates",
@@ -60,7 +60,6 @@ async def get_profession_item_pool(
     Returns:
         List of item template names that match the profession and level
     """
-    from ds_common.repository.item_category import ItemCategoryRepository
     from ds_common.repository.item_template import ItemTemplateRepository
 
     # Get categories for this profession
@@ -80,28 +79,9 @@ async def get_profession_item_pool(
     max_rarity_index = rarity_order.index(max_rarity)
     allowed_rarities = rarity_order[: max_rarity_index + 1]
 
-    # Query item templates
-    category_repo = ItemCategoryRepository(postgres_manager)
+    # Query item template names matching category and rarity
     template_repo = ItemTemplateRepository(postgres_manager)
-
-    item_names = []
-
-    # Get all templates and filter
-    all_templates = await template_repo.get_all()
-
-    for template in all_templates:
-        # Check category
-        category = await category_repo.get_by_id(template.category_id)
-        if not category or category.name not in categories:
-            continue
-
-        # Check rarity
-        if template.rarity not in allowed_rarities:
-            continue
-
-        item_names.append(template.name)
-
-    return item_names
+    return await template_repo.get_names_by_category(categories, allowed_rarities)
 
 
 async def select_random_items(
@@ -27,7 +27,7 @@ class CombatStatus(str, Enum):
     UNCONSCIOUS = "unconscious"
 
 
-@dataclass
+@dataclass(slots=True)
 class CombatResult:
     """Result of a combat action"""
 
@@ -44,7 +44,7 @@ class CombatResult:
     is_incapacitated: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class RestorationModifiers:
     """Equipment and buff modifiers for restoration rates"""
 
@@ -58,7 +58,7 @@ class RestorationModifiers:
     armor_multiplier: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class RestorationRates:
     """Per-second restoration rates for each resource"""
 
@@ -68,7 +68,7 @@ class RestorationRates:
     armor_per_second: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class RestorationResult:
     """Result of resource restoration"""
 
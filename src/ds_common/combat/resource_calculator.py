@@ -240,3 +240,61 @@ def calculate_max_armor(
     )
 
     return base_armor + equipment_bonus
+
+
+def calculate_max_resources(
+    character: "Character | NPC",
+    character_class: "CharacterClass | None" = None,
+    equipment_resource_bonuses: dict[str, float] | None = None,
+) -> tuple[float, float, float, float]:
+    """
+    Calculate all maximum resources in one pass.
+
+    Equivalent to calling calculate_max_health, calculate_max_stamina,
+    calculate_max_tech_power and calculate_max_armor, but reads the stats,
+    level and class modifiers only once.
+
+    Args:
+        character: Character or NPC instance
+        character_class: Optional character class (for characters)
+        equipment_resource_bonuses: Optional dict of equipment resource bonuses
+
+    Returns:
+        Tuple of (max_health, max_stamina, max_tech_power, max_armor)
+    """
+    stats = character.stats
+    str_val = float(stats.get("STR", 0))
+    dex_val = float(stats.get("DEX", 0))
+    int_val = float(stats.get("INT", 0))
+    level = float(character.level)
+
+    class_id = character.character_class_id if hasattr(character, "character_class_id") else None
+    modifiers = _get_class_modifiers(class_id, character.level)
+    bonuses = equipment_resource_bonuses or {}
+
+    max_health = (
+        (str_val * 8.0)
+        + (dex_val * 2.0)
+        + (level * 10.0)
+        + modifiers["health_base"]
+        + (modifiers["health_per_level"] * level)
+        + float(bonuses.get("max_health", 0.0))
+    )
+    max_stamina = (
+        (dex_val * 5.0)
+        + (str_val * 2.0)
+        + (level * 5.0)
+        + modifiers["stamina_base"]
+        + (modifiers["stamina_per_level"] * level)
+        + float(bonuses.get("max_stamina", 0.0))
+    )
+    max_tech_power = (
+        (int_val * 10.0)
+        + (level * 8.0)
+        + modifiers["tech_power_base"]
+        + (modifiers["tech_power_per_level"] * level)
+        + float(bonuses.get("max_tech_power", 0.0))
+    )
+    max_armor = (dex_val * 3.0) + (level * 2.0) + float(bonuses.get("max_armor", 0.0))
+
+    return max_health, max_stamina, max_tech_power, max_armor
@@ -10,6 +10,7 @@ from ds_common.equipment.effect_calculator import (
     calculate_stat_bonuses,
     calculate_stat_multipliers,
     get_inventory_slots_bonus,
+    sum_equipped_bonuses,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "calculate_stat_bonuses",
     "calculate_stat_multipliers",
     "get_inventory_slots_bonus",
+    "sum_equipped_bonuses",
 ]
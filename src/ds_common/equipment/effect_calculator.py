@@ -3,14 +3,77 @@ Equipment effect calculator for aggregating item effects on characters.
 """
 
 from typing import TYPE_CHECKING
+from uuid import UUID
 
 if TYPE_CHECKING:
     from ds_common.models.character import Character
     from ds_common.models.item_template import ItemTemplate
+    from ds_common.models.item_template_modifier import ItemModifierKind
     from ds_common.models.npc import NPC
     from ds_discord_bot.postgres_manager import PostgresManager
 
 
+def _get_equipped_item_template_ids(character: "Character | NPC") -> list[UUID]:
+    """
+    Get the item template IDs of all equipped items, one entry per item.
+
+    Items without a template or with a malformed template ID are skipped.
+
+    Args:
+        character: Character or NPC to check
+
+    Returns:
+        List of item template IDs, repeated when the same template is equipped twice
+    """
+    if not hasattr(character, "inventory") or not character.inventory:
+        return []
+
+    template_ids = []
+    for item in character.inventory:
+        if not isinstance(item, dict):
+            continue
+
+        # Check if item is equipped
+        is_equipped = item.get("equipped", False) or item.get("equipment_slot") is not None
+
+        if not is_equipped:
+            continue
+
+        item_template_id = item.get("item_template_id")
+        if item_template_id:
+            try:
+                template_ids.append(UUID(str(item_template_id)))
+            except ValueError:
+                continue
+
+    return template_ids
+
+
+async def sum_equipped_bonuses(
+    character: "Character | NPC",
+    kind: "ItemModifierKind",
+    postgres_manager: "PostgresManager",
+) -> dict[str, float]:
+    """
+    Sum one kind of additive bonus across equipped items in the database.
+
+    Unlike the calculate_* helpers this needs no loaded templates: the bonuses are
+    summed from the item_template_modifiers rows by one grouped query.
+
+    Args:
+        character: Character or NPC
+        kind: Modifier kind to sum (e.g., ItemModifierKind.RESOURCE)
+        postgres_manager: Postgres manager for the query
+
+    Returns:
+        Dictionary mapping target to total bonus (e.g., {'max_health': 20.0})
+    """
+    from ds_common.repository.item_template import ItemTemplateRepository
+
+    template_ids = _get_equipped_item_template_ids(character)
+    return await ItemTemplateRepository(postgres_manager).sum_modifier_bonuses(template_ids, kind)
+
+
 async def _get_equipped_item_templates(
     character: "Character | NPC",
     postgres_manager: "PostgresManager | None" = None,
@@ -25,9 +88,6 @@ async def _get_equipped_item_templates(
     Returns:
         List of ItemTemplate instances for equipped items
     """
-    if not hasattr(character, "inventory") or not character.inventory:
-        return []
-
     equipped_templates = []
 
     if postgres_manager:
@@ -35,27 +95,15 @@ async def _get_equipped_item_templates(
 
         template_repo = ItemTemplateRepository(postgres_manager)
 
-        for item in character.inventory:
-            if not isinstance(item, dict):
+        for item_template_id in _get_equipped_item_template_ids(character):
+            try:
+                template = await template_repo.get_by_id(item_template_id)
+                if template:
+                    equipped_templates.append(template)
+            except Exception:
+                # Skip if template not found or error loading
                 continue
 
-            # Check if item is equipped
-            is_equipped = item.get("equipped", False) or item.get("equipment_slot") is not None
-
-            if not is_equipped:
-                continue
-
-            # Get item_template_id
-            item_template_id = item.get("item_template_id")
-            if item_template_id:
-                try:
-                    template = await template_repo.get_by_id(item_template_id)
-                    if template:
-                        equipped_templates.append(template)
-                except Exception:
-                    # Skip if template not found or error loading
-                    continue
-
     return equipped_templates
 
 
@@ -88,8 +88,8 @@ class CleanupService:
             self.logger.info("Auto cleanup is disabled")
             return {"enabled": False}
 
-        # Get all snapshots
-        all_snapshots = await self.snapshot_repo.get_all_snapshots()
+        # Only unwound snapshots are eligible for archiving
+        unwound_snapshots = await self.snapshot_repo.get_snapshot_summaries(unwound=True)
         # Convert to naive UTC for comparison (database stores as TIMESTAMP WITHOUT TIME ZONE)
         cutoff_date = (
             datetime.now(UTC) - timedelta(days=settings.snapshot_retention_days)
@@ -97,7 +97,7 @@ class CleanupService:
 
         stats = {"snapshots_archived": 0}
 
-        for snapshot in all_snapshots:
+        for snapshot in unwound_snapshots:
             # Only archive unwound snapshots older than retention period
             # unwound_at is stored as naive datetime, so compare with naive cutoff_date
             if snapshot.unwound_at and snapshot.unwound_at < cutoff_date:
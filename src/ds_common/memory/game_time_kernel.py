@@ -0,0 +1,52 @@
+"""
+Pure arithmetic for deriving the game clock from elapsed real time.
+
+Kept free of models and I/O so the hot conversion path is plain integer math on scalars.
+"""
+
+from datetime import datetime, timedelta
+
+_MICROSECOND = timedelta(microseconds=1)
+_MICROSECONDS_PER_SECOND = 1_000_000
+
+
+def elapsed_microseconds(epoch_start: datetime, now: datetime) -> int:
+    """
+    Get the exact real time elapsed between two datetimes in microseconds.
+
+    Args:
+        epoch_start: Game epoch start (real datetime)
+        now: Real datetime to measure to
+
+    Returns:
+        Elapsed microseconds (negative if now is before the epoch)
+    """
+    return (now - epoch_start) // _MICROSECOND
+
+
+def derive_game_clock(
+    elapsed_us: int,
+    multiplier: float,
+    hours_per_day: int,
+    days_per_year: int,
+) -> tuple[int, int, int, int]:
+    """
+    Derive the game clock from real time elapsed since the game epoch.
+
+    One real minute advances the game by ``multiplier`` game hours, so one real second is
+    ``multiplier`` game minutes.
+
+    Args:
+        elapsed_us: Real microseconds since the game epoch
+        multiplier: Game hours per real minute
+        hours_per_day: Game hours per game day
+        days_per_year: Game days per game year
+
+    Returns:
+        Tuple of (game_year, year_day, game_hour, game_minute); year and year_day are 1-based
+    """
+    total_minutes = int(elapsed_us * multiplier / _MICROSECONDS_PER_SECOND)
+    total_hours, minute = divmod(total_minutes, 60)
+    total_days, hour = divmod(total_hours, hours_per_day)
+    years, day_index = divmod(total_days, days_per_year)
+    return years + 1, day_index + 1, hour, minute
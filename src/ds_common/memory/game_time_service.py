@@ -1,7 +1,8 @@
 import logging
 from datetime import UTC, datetime, timedelta
 
-from ds_common.models.game_time import GameTime, Season
+from ds_common.memory.game_time_kernel import derive_game_clock, elapsed_microseconds
+from ds_common.models.game_time import DayOfWeek, GameTime, Season, SeasonName
 from ds_common.repository.game_settings import GameSettingsRepository
 from ds_common.repository.game_time import GameTimeRepository
 from ds_discord_bot.postgres_manager import PostgresManager
@@ -33,14 +34,16 @@ class GameTimeService:
         Returns:
             Tuple of (day_start_hour, night_start_hour) for current season
         """
-        # Get seasonal day/night configuration
-        seasonal_config = game_time.game_time_config.get("seasonal_day_night", {})
-        current_season = game_time.season or "SPRING"
+        config = game_time.parsed_config
+        current_season = Season[game_time.season or "SPRING"]
 
         # Get seasonal hours if configured, otherwise use base settings
-        season_hours = seasonal_config.get(current_season, {})
-        day_start = season_hours.get("day_start", settings.game_day_start_hour)
-        night_start = season_hours.get("night_start", settings.game_night_start_hour)
+        day_start = config.season_day_start[current_season]
+        night_start = config.season_night_start[current_season]
+        if day_start is None:
+            day_start = settings.game_day_start_hour
+        if night_start is None:
+            night_start = settings.game_night_start_hour
 
         return day_start, night_start
 
@@ -87,7 +90,7 @@ class GameTimeService:
 
         return game_time
 
-    async def get_season(self) -> Season:
+    async def get_season(self) -> SeasonName:
         """
         Get the current season.
 
@@ -184,11 +187,9 @@ class GameTimeService:
         # Get config values from settings and game_time_config
         hours_per_day = settings.game_hours_per_day
         days_per_year = settings.game_days_per_year
-        months_per_year = game_time.game_time_config.get("months_per_year", 20)
-        days_per_month = game_time.game_time_config.get("days_per_month", 20)
-        season_days = game_time.game_time_config.get(
-            "season_days", {"SPRING": 100, "SUMMER": 100, "FALL": 100, "WINTER": 100}
-        )
+        config = game_time.parsed_config
+        months_per_year = config.months_per_year
+        days_per_month = config.days_per_month
 
         # Calculate game hours to advance
         game_hours_to_advance = real_minutes * multiplier
@@ -231,18 +232,7 @@ class GameTimeService:
         game_time.current_game_time = datetime.now(UTC)
 
         # Update season (based on year_day) - do this before calculating day/night
-        spring_days = season_days.get("SPRING", 100)
-        summer_days = season_days.get("SUMMER", 100)
-        fall_days = season_days.get("FALL", 100)
-
-        if new_year_day <= spring_days:
-            game_time.season = "SPRING"
-        elif new_year_day <= spring_days + summer_days:
-            game_time.season = "SUMMER"
-        elif new_year_day <= spring_days + summer_days + fall_days:
-            game_time.season = "FALL"
-        else:
-            game_time.season = "WINTER"
+        game_time.season = SeasonName[config.season_for_day(new_year_day).name]
 
         # Update day/night using seasonal hours
         day_start, night_start = self._get_seasonal_day_night_hours(game_time, settings)
@@ -251,8 +241,7 @@ class GameTimeService:
         # Update day of week (simplified - 7 day week)
         days_since_epoch = (new_year - 1) * days_per_year + (new_year_day - 1)
         day_of_week_num = days_since_epoch % 7
-        days = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]
-        game_time.day_of_week = days[day_of_week_num]
+        game_time.day_of_week = list(DayOfWeek)[day_of_week_num]
 
         # Get month definitions from database
         from ds_common.repository.calendar_month import CalendarMonthRepository
@@ -311,58 +300,31 @@ class GameTimeService:
         # Get config values from settings
         hours_per_day = settings.game_hours_per_day
         days_per_year = settings.game_days_per_year
-        months_per_year = game_time.game_time_config.get("months_per_year", 20)
-        days_per_month = game_time.game_time_config.get("days_per_month", 20)
-        season_days = game_time.game_time_config.get(
-            "season_days", {"SPRING": 100, "SUMMER": 100, "FALL": 100, "WINTER": 100}
-        )
+        config = game_time.parsed_config
 
         # Normalize real_time to be timezone-aware (UTC)
         if real_time.tzinfo is None:
             real_time = real_time.replace(tzinfo=UTC)
 
-        # Calculate elapsed real time
-        elapsed = real_time - epoch_start
-        elapsed_minutes = elapsed.total_seconds() / 60.0
-
-        # Convert to game time
-        game_hours_elapsed = elapsed_minutes * multiplier
-
-        total_game_minutes = int(game_hours_elapsed * 60)
-        game_minute = total_game_minutes % 60
-        total_game_hours = total_game_minutes // 60
-        game_hour = total_game_hours % hours_per_day
-        total_game_days = total_game_hours // hours_per_day
-        year_day = (total_game_days % days_per_year) + 1
-        game_year = (total_game_days // days_per_year) + 1
+        # Convert elapsed real time to game time
+        game_year, year_day, game_hour, game_minute = derive_game_clock(
+            elapsed_microseconds(epoch_start, real_time),
+            multiplier,
+            hours_per_day,
+            days_per_year,
+        )
 
         # Calculate month and day of month
-        months_per_year = game_time.game_time_config.get("months_per_year", 20)
-        days_per_month = game_time.game_time_config.get("days_per_month", 20)
-        game_month = ((year_day - 1) // days_per_month) + 1
-        if game_month > months_per_year:
-            game_month = months_per_year
-        game_day = ((year_day - 1) % days_per_month) + 1
+        game_month = ((year_day - 1) // config.days_per_month) + 1
+        if game_month > config.months_per_year:
+            game_month = config.months_per_year
+        game_day = ((year_day - 1) % config.days_per_month) + 1
 
         # Calculate cycle year (1-12)
         cycle_year = ((game_year - 1) % 12) + 1
 
         # Calculate season
-        season_days = game_time.game_time_config.get(
-            "season_days", {"SPRING": 100, "SUMMER": 100, "FALL": 100, "WINTER": 100}
-        )
-        spring_days = season_days.get("SPRING", 100)
-        summer_days = season_days.get("SUMMER", 100)
-        fall_days = season_days.get("FALL", 100)
-
-        if year_day <= spring_days:
-            season = "SPRING"
-        elif year_day <= spring_days + summer_days:
-            season = "SUMMER"
-        elif year_day <= spring_days + summer_days + fall_days:
-            season = "FALL"
-        else:
-            season = "WINTER"
+        season = config.season_for_day(year_day).name
 
         return {
             "year": game_year,
@@ -414,7 +376,7 @@ class GameTimeService:
 
         return real_time
 
-    async def get_season_start(self, season: Season) -> dict:
+    async def get_season_start(self, season: SeasonName) -> dict:
         """
         Get when the current season started (game time).
 
@@ -427,9 +389,7 @@ class GameTimeService:
         game_time = await self.get_current_game_time()
         settings = await self._get_settings()
         # Season days are still in game_time_config (not duplicated in GameSettings)
-        season_days = game_time.game_time_config.get(
-            "season_days", {"SPRING": 100, "SUMMER": 100, "FALL": 100, "WINTER": 100}
-        )
+        season_days = game_time.parsed_config.season_days
 
         current_year_day = (
             game_time.year_day
@@ -440,18 +400,8 @@ class GameTimeService:
         )
         current_year = game_time.game_year
 
-        spring_days = season_days.get("SPRING", 100)
-        summer_days = season_days.get("SUMMER", 100)
-        fall_days = season_days.get("FALL", 100)
-
-        if season == "SPRING":
-            season_start_day = 1
-        elif season == "SUMMER":
-            season_start_day = spring_days + 1
-        elif season == "FALL":
-            season_start_day = spring_days + summer_days + 1
-        else:  # WINTER
-            season_start_day = spring_days + summer_days + fall_days + 1
+        # Season starts the day after all earlier seasons have elapsed
+        season_start_day = sum(season_days[: Season[season]]) + 1
 
         # Calculate which year and day
         days_per_year = settings.game_days_per_year
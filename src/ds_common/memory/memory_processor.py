@@ -18,7 +18,7 @@ from ds_common.models.episode_memory import EpisodeMemory
 from ds_common.models.memory_settings import MemorySettings
 from ds_common.models.memory_snapshot import MemorySnapshot, SnapshotType
 from ds_common.models.session_memory import MemoryType, SessionMemory
-from ds_common.models.world_memory import WorldMemory
+from ds_common.models.world_memory import HIGH_IMPACT_LEVELS, WorldMemory
 from ds_common.repository.episode_memory import EpisodeMemoryRepository
 from ds_common.repository.memory_settings import MemorySettingsRepository
 from ds_common.repository.memory_snapshot import MemorySnapshotRepository
@@ -519,9 +519,9 @@ class MemoryProcessor:
             self.logger.error(f"Failed to run safeguard analysis: {e}")
             # Default to requiring snapshot for high impact
             analysis = SafeguardAnalysis(
-                requires_snapshot=proposed_narrative.impact_level in ["major", "world_changing"],
+                requires_snapshot=proposed_narrative.impact_level in HIGH_IMPACT_LEVELS,
                 risk_level="high"
-                if proposed_narrative.impact_level in ["major", "world_changing"]
+                if proposed_narrative.impact_level in HIGH_IMPACT_LEVELS
                 else "medium",
                 detected_threats=[],
                 reasoning="Error during analysis, using default",
@@ -552,9 +552,8 @@ class MemoryProcessor:
         self.logger.info(f"Creating snapshot for {snapshot_type}")
 
         # Get current world state
-        world_memories = await self.world_repo.get_all()
         snapshot_data = {
-            "world_memories": [wm.model_dump() for wm in world_memories],
+            "world_memories": [wm.model_dump() async for wm in self.world_repo.iter_all()],
             "timestamp": datetime.now(UTC).isoformat(),
             "world_memory_id": str(world_memory_id) if world_memory_id else None,
             "episode_id": str(episode_id) if episode_id else None,
@@ -645,8 +644,7 @@ class MemoryProcessor:
 
         # Create snapshot if required
         if require_snapshot and (
-            safeguard_analysis.requires_snapshot
-            or narrative.impact_level in ["major", "world_changing"]
+            safeguard_analysis.requires_snapshot or narrative.impact_level in HIGH_IMPACT_LEVELS
         ):
             await self.create_snapshot(
                 snapshot_type="episode_promotion",
@@ -270,9 +270,8 @@ class MemoryRetriever:
         self.logger.debug(f"Getting lore for location {location_id}")
 
         # This would use related_entities filtering
-        # For now, return all public memories
-        all_memories = await self.world_repo.get_all()
-        return [wm for wm in all_memories if wm.is_public][:limit]
+        # For now, return the most recent public memories
+        return await self.world_repo.get_public(limit)
 
     async def get_episode_history(
         self,
@@ -52,14 +52,12 @@ class UnwindService:
             return False, "Snapshot cannot be unwound"
 
         # Check for dependent world memories created after snapshot
-        snapshot_timestamp = snapshot.created_at
-        all_memories = await self.world_repo.get_all()
-        dependent_memories = [wm for wm in all_memories if wm.created_at > snapshot_timestamp]
+        dependent_count = await self.world_repo.count_created_after(snapshot.created_at)
 
-        if dependent_memories:
+        if dependent_count:
             return (
                 False,
-                f"Found {len(dependent_memories)} world memories created after snapshot. Unwinding may cause inconsistencies.",
+                f"Found {dependent_count} world memories created after snapshot. Unwinding may cause inconsistencies.",
             )
 
         return True, "Snapshot is valid for unwinding"
@@ -79,7 +77,7 @@ class UnwindService:
         """
         self.logger.debug(f"Getting unwind preview for snapshot {snapshot_id}")
 
-        snapshot = await self.snapshot_repo.get_by_id(snapshot_id)
+        snapshot = await self.snapshot_repo.get_with_data(snapshot_id)
         if not snapshot:
             raise ValueError(f"Snapshot {snapshot_id} not found")
 
@@ -122,24 +120,22 @@ class UnwindService:
         if not is_valid:
             raise ValueError(f"Cannot unwind snapshot: {reason}")
 
-        snapshot = await self.snapshot_repo.get_by_id(snapshot_id)
+        snapshot = await self.snapshot_repo.get_with_data(snapshot_id)
         if not snapshot:
             raise ValueError(f"Snapshot {snapshot_id} not found")
 
         snapshot_data = snapshot.snapshot_data
         world_memories_data = snapshot_data.get("world_memories", [])
 
-        # Delete current world memories
-        current_memories = await self.world_repo.get_all()
-        for memory in current_memories:
-            await self.world_repo.delete(memory.id)
+        # Delete current world memories without loading them
+        removed_count = await self.world_repo.delete_all()
 
         # Restore world memories from snapshot
         restored_count = 0
         for memory_data in world_memories_data:
             try:
-                # Recreate world memory from snapshot data
-                memory = WorldMemory(**memory_data)
+                # Recreate world memory from snapshot data (trusted, written by us)
+                memory = WorldMemory.construct_trusted(**memory_data)
                 await self.world_repo.create(memory)
                 restored_count += 1
             except Exception as e:
@@ -151,7 +147,7 @@ class UnwindService:
         result = {
             "snapshot_id": str(snapshot_id),
             "restored_memories": restored_count,
-            "removed_memories": len(current_memories),
+            "removed_memories": removed_count,
         }
 
         self.logger.info(f"Unwound snapshot {snapshot_id}: restored {restored_count} memories")
@@ -312,9 +312,11 @@ class MetricsService:
         """Record character action."""
         self.game_character_actions_total.labels(action_type=action_type).inc()
 
-    def record_world_state_change(self, asset_type: str, action: str = "created") -> None:
-        """Record world state change (NPC, quest, location, etc.)."""
-        self.world_state_changes_total.labels(asset_type=asset_type, action=action).inc()
+    def record_world_state_change(
+        self, asset_type: str, action: str = "created", count: int = 1
+    ) -> None:
+        """Record world state changes (NPC, quest, location, etc.), count at a time."""
+        self.world_state_changes_total.labels(asset_type=asset_type, action=action).inc(count)
 
     def record_background_task(
         self,
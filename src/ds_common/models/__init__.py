@@ -30,12 +30,14 @@ from ds_common.models.game_time import GameTime  # noqa: F401
 # Import item models before character_class (since CharacterClass has relationship to ItemTemplate)
 from ds_common.models.item_category import ItemCategory  # noqa: F401
 from ds_common.models.item_template import ItemTemplate  # noqa: F401
+from ds_common.models.item_template_modifier import ItemTemplateModifier  # noqa: F401
 
 # Import junction tables (they reference models, so models should be imported first)
 from ds_common.models.junction_tables import (  # noqa: F401
     CharacterClassStartingEquipment,
     CharacterClassStat,
     CharacterQuest,
+    CharacterQuestItem,
     EncounterCharacter,
     EncounterNPC,
     GameSessionCharacter,
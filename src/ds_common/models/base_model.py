@@ -1,11 +1,65 @@
-import uuid
+import os
+import time
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Self, get_args
 from uuid import UUID
 
+from pydantic import ConfigDict, ValidationInfo, field_validator
 from sqlalchemy import DateTime
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 
+# Column type for JSON document fields. Stored as JSONB (None maps to SQL NULL);
+# encoding/decoding goes through the orjson serializers configured on the engine.
+JSONB_ORJSON = JSONB(none_as_null=True)
+
+# Config for read-heavy table models: the pydantic-core schema is built on first validation
+# rather than at import, so models a process never validates never pay for it.
+DEFERRED_BUILD_CONFIG = ConfigDict(defer_build=True, validate_assignment=False, extra="ignore")
+
+# UUIDv7 version (0b0111) and RFC 4122 variant (0b10) fields, applied with one mask and one OR
+_UUID7_FIELD_MASK = ~(0xF << 76 | 0x3 << 62)
+_UUID7_FIELD_BITS = 0x7 << 76 | 0x2 << 62
+
+
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds, so IDs created later sort
+    later and primary key inserts land on the right-hand edge of the B-tree.
+
+    Returns:
+        A new version 7 UUID
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10))
+    return UUID(int=value & _UUID7_FIELD_MASK | _UUID7_FIELD_BITS)
+
+
+def allowed_values_validator(fields: dict[str, Any]) -> Any:
+    """
+    Build a validator restricting str fields to the values of their Literal aliases.
+
+    Assign the result in the model body. Table models are not validated on __init__,
+    so the check only applies to model_validate input.
+
+    Args:
+        fields: Field name mapped to the Literal alias constraining it
+
+    Returns:
+        Pydantic field validator for the given fields
+    """
+    allowed_values = {name: frozenset(get_args(alias)) for name, alias in fields.items()}
+
+    def check(value: str | None, info: ValidationInfo) -> str | None:
+        allowed = allowed_values[info.field_name]
+        if value is not None and value not in allowed:
+            raise ValueError(f"{info.field_name} must be one of {sorted(allowed)}, got {value!r}")
+        return value
+
+    return field_validator(*allowed_values)(check)
+
 
 class BaseSQLModel(SQLModel, table=False):
     """
@@ -17,7 +71,7 @@ class BaseSQLModel(SQLModel, table=False):
     """
 
     id: UUID | None = Field(
-        default_factory=uuid.uuid4,
+        default_factory=uuid7,
         primary_key=True,
         description="Unique identifier for the record",
     )
@@ -38,10 +92,34 @@ class BaseSQLModel(SQLModel, table=False):
 
         If no ID is provided, a UUID will be generated automatically.
         """
-        if "id" not in data or data["id"] is None:
-            data["id"] = uuid.uuid4()
-        if "created_at" not in data or data["created_at"] is None:
-            data["created_at"] = datetime.now(UTC)
-        if "updated_at" not in data or data["updated_at"] is None:
-            data["updated_at"] = datetime.now(UTC)
+        if data.get("id") is None:
+            data["id"] = uuid7()
+        if data.get("created_at") is None or data.get("updated_at") is None:
+            # One clock read, so new records start with created_at == updated_at
+            now = datetime.now(UTC)
+            if data.get("created_at") is None:
+                data["created_at"] = now
+            if data.get("updated_at") is None:
+                data["updated_at"] = now
         super().__init__(**data)
+
+    @classmethod
+    def construct_trusted(cls, **data: Any) -> Self:
+        """
+        Build an instance from trusted, already-persisted data without validation.
+
+        Use this when rehydrating rows we wrote ourselves (e.g. snapshot restores);
+        keep normal construction or ``model_validate`` for external input.
+        Table models are built through ``__init__`` so SQLAlchemy instrumentation
+        is set up (SQLModel does not validate table models on init); other models
+        use ``model_construct``.
+
+        Args:
+            **data: Field values for the new instance
+
+        Returns:
+            Model instance with only the provided fields marked as set
+        """
+        obj = cls(**data) if cls.model_config.get("table") else cls.model_construct(**data)
+        object.__setattr__(obj, "__pydantic_fields_set__", set(data))
+        return obj
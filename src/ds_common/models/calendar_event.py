@@ -1,7 +1,7 @@
 from typing import Literal
 from uuid import UUID
 
-from sqlalchemy import ARRAY, JSON, Column, String
+from sqlalchemy import ARRAY, JSON, Column, Index, String
 from sqlalchemy.dialects import postgresql
 from sqlmodel import Field
 
@@ -19,6 +19,10 @@ class CalendarEvent(BaseSQLModel, table=True):
     """
 
     __tablename__ = "calendar_events"
+    __table_args__ = (
+        # Serves get_by_faction's array containment (@>) filter
+        Index("ix_calendar_events_affected_factions", "affected_factions", postgresql_using="gin"),
+    )
 
     name: str = Field(max_length=255, description="Event name")
     event_type: str = Field(
@@ -55,7 +59,7 @@ class CalendarEvent(BaseSQLModel, table=True):
     faction_specific: bool = Field(default=False, description="Whether this is faction-specific")
     affected_factions: list[str] = Field(
         default_factory=list,
-        sa_column=Column(ARRAY(String)),
+        sa_column=Column(postgresql.ARRAY(String)),
         description="Factions that celebrate this event",
     )
 
@@ -3,7 +3,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import JSON, DateTime
+from sqlalchemy import JSON, DateTime, Index, text
 from sqlmodel import Column, Field, Relationship
 
 from ds_common.models.base_model import BaseSQLModel
@@ -29,6 +29,8 @@ class Character(BaseSQLModel, table=True):
     """
 
     __tablename__ = "characters"
+    # Backs case-insensitive name lookups (get_by_field with case_sensitive=False)
+    __table_args__ = (Index("ix_characters_name_lower", text("lower(name)")),)
 
     name: str = Field(unique=True, index=True, description="Character name")
     gender: str | None = Field(
@@ -97,7 +99,10 @@ class Character(BaseSQLModel, table=True):
             "primaryjoin": "Player.active_character_id == Character.id",
         },
     )
-    character_class: Optional["CharacterClass"] = Relationship()
+    # Many-to-one and read by the resource calculations, so join it into every load
+    character_class: Optional["CharacterClass"] = Relationship(
+        sa_relationship_kwargs={"lazy": "joined"}
+    )
     game_sessions: list["GameSession"] = Relationship(
         back_populates="characters",
         link_model=GameSessionCharacter,
@@ -1,22 +1,13 @@
 from datetime import datetime
 from uuid import UUID
 
+from pgvector.sqlalchemy import Vector
 from sqlalchemy import JSON, Column, DateTime, Float, String
 from sqlalchemy.dialects import postgresql
 from sqlmodel import Field
 
 from ds_common.models.base_model import BaseSQLModel
 
-try:
-    from pgvector.sqlalchemy import Vector
-except ImportError:
-    # Fallback if pgvector is not installed yet
-    from sqlalchemy import ARRAY as SQLArray
-    from sqlalchemy import Float as SQLFloat
-
-    def Vector(dim: int) -> type[SQLArray[SQLFloat]]:  # noqa: ARG001
-        return SQLArray(SQLFloat)
-
 
 class EpisodeMemory(BaseSQLModel, table=True):
     """
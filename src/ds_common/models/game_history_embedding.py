@@ -1,21 +1,12 @@
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
+from pgvector.sqlalchemy import Vector
 from sqlalchemy import JSON, Column
 from sqlmodel import Field, Relationship
 
 from ds_common.models.base_model import BaseSQLModel
 
-try:
-    from pgvector.sqlalchemy import Vector
-except ImportError:
-    # Fallback if pgvector is not installed yet
-    from sqlalchemy import ARRAY, Float
-
-    def Vector(dim: int) -> type[ARRAY[Float]]:  # noqa: ARG001
-        return ARRAY(Float)
-
-
 if TYPE_CHECKING:
     from ds_common.models.game_session import GameSession
 
@@ -89,10 +89,6 @@ class RequestGenerateNPC(BaseModel):
     location: str
 
 
-class RequestGetCharacter(BaseModel):
-    character: Character
-
-
 class RequestGetCharacterPurse(BaseModel):
     character: Character
     currency: CURRENCY_TYPES
@@ -104,12 +100,6 @@ class RequestAddCredits(BaseModel):
     currency: CURRENCY_TYPES
 
 
-class RequestRemoveCredits(BaseModel):
-    character: Character
-    amount: int
-    currency: CURRENCY_TYPES
-
-
 class ResponseCharacterCredits(BaseModel):
     character: Character
     credits: int
@@ -156,14 +146,6 @@ class RequestSwapEquipment(BaseModel):
     location: EQUIPMENT_EQUIP_LOCATION
 
 
-class RequestAddEquipment(BaseModel):
-    character: Character
-    item_name: str
-    item_quantity: int
-    location: EQUIPMENT_EQUIP_LOCATION
-    item_type: INVENTORY_ADD_REASON
-
-
 class RequestRemoveEquipment(BaseModel):
     character: Character
     item_name: str
@@ -1,26 +1,39 @@
-from datetime import UTC, datetime
+from datetime import datetime
+from typing import ClassVar, Self
+from uuid import UUID
 
-from sqlalchemy import DateTime
+from pydantic import model_validator
+from sqlalchemy import DateTime, Index, func, text
 from sqlmodel import Field
 
-from ds_common.models.base_model import BaseSQLModel
+from ds_common.models.base_model import DEFERRED_BUILD_CONFIG, BaseSQLModel
+
+# Fixed primary key of the singleton settings row
+DEFAULT_GAME_SETTINGS_ID = UUID("00000000-0000-0000-0000-000000000001")
 
 
 class GameSettings(BaseSQLModel, table=True):
     """
-    Game settings model
+    Game settings model (singleton, one row at the fixed default ID)
     """
 
     __tablename__ = "game_settings"
+    __table_args__ = (Index("uq_game_settings_singleton", text("(true)"), unique=True),)
+    # Read game_epoch_start's server default back in the INSERT's RETURNING, since
+    # create() does not refresh the row
+    __mapper_args__: ClassVar[dict] = {"eager_defaults": True}
+    model_config = DEFERRED_BUILD_CONFIG
 
-    max_characters_per_player: int = Field(default=3, description="Max characters per player")
-    max_game_sessions: int = Field(default=50, description="Max game sessions")
-    max_players_per_game_session: int = Field(default=4, description="Max players per game session")
+    max_characters_per_player: int = Field(default=3, description="Max characters per player", ge=1)
+    max_game_sessions: int = Field(default=50, description="Max game sessions", ge=0)
+    max_players_per_game_session: int = Field(
+        default=4, description="Max players per game session", ge=1
+    )
     max_game_session_idle_duration: int = Field(
-        default=30, description="Max game session idle duration in minutes"
+        default=30, description="Max game session idle duration in minutes", ge=1
     )
     game_channel_slowmode_delay: int = Field(
-        default=5, description="Game channel slowmode delay in seconds"
+        default=5, description="Game channel slowmode delay in seconds", ge=0, le=21600
     )
 
     # Game time settings
@@ -28,15 +41,17 @@ class GameSettings(BaseSQLModel, table=True):
     game_time_multiplier: float = Field(
         default=0.5,
         description="How fast game time advances (1 real minute = X game hours). Default 0.5 = 1 real hour = 1 game day",
+        gt=0,
     )
-    game_hours_per_day: int = Field(default=30, description="Hours per game day")
-    game_days_per_year: int = Field(default=400, description="Days per game year")
-    game_day_start_hour: int = Field(default=0, description="Hour when day begins")
-    game_night_start_hour: int = Field(default=15, description="Hour when night begins")
+    game_hours_per_day: int = Field(default=30, description="Hours per game day", ge=1)
+    game_days_per_year: int = Field(default=400, description="Days per game year", ge=1)
+    game_day_start_hour: int = Field(default=0, description="Hour when day begins", ge=0)
+    game_night_start_hour: int = Field(default=15, description="Hour when night begins", ge=0)
     game_epoch_start: datetime | None = Field(
-        default_factory=lambda: datetime.now(UTC),
+        default=None,
         sa_type=DateTime(timezone=True),
-        description="When game time epoch started (UTC)",
+        sa_column_kwargs={"server_default": func.now()},
+        description="When game time epoch started (UTC), set by the database on insert",
     )
     game_time_persistence_interval_minutes: int = Field(
         default=5,
@@ -46,44 +61,74 @@ class GameSettings(BaseSQLModel, table=True):
 
     # Character stat generation settings
     character_stats_pool_min: int = Field(
-        default=60, description="Minimum total stat pool for character generation"
+        default=60, description="Minimum total stat pool for character generation", ge=0
     )
     character_stats_pool_max: int = Field(
-        default=80, description="Maximum total stat pool for character generation"
+        default=80, description="Maximum total stat pool for character generation", ge=0
     )
     character_stats_primary_weight: float = Field(
-        default=2.5, description="Weight multiplier for primary (class) stats"
+        default=2.5, description="Weight multiplier for primary (class) stats", ge=0
     )
     character_stats_secondary_weight: float = Field(
-        default=1.0, description="Weight multiplier for secondary (non-class) stats"
+        default=1.0, description="Weight multiplier for secondary (non-class) stats", ge=0
+    )
+    character_stats_luck_min: int = Field(default=1, description="Minimum luck stat value", ge=1)
+    character_stats_luck_max: int = Field(default=10, description="Maximum luck stat value", ge=1)
+    character_stats_stat_min: int = Field(default=1, description="Minimum value for any stat", ge=1)
+    character_stats_stat_max: int = Field(
+        default=20, description="Maximum value for any stat", ge=1
     )
-    character_stats_luck_min: int = Field(default=1, description="Minimum luck stat value")
-    character_stats_luck_max: int = Field(default=10, description="Maximum luck stat value")
-    character_stats_stat_min: int = Field(default=1, description="Minimum value for any stat")
-    character_stats_stat_max: int = Field(default=20, description="Maximum value for any stat")
     character_stats_allocation_variance: int = Field(
-        default=2, description="Variance in point allocation (±variance points)"
+        default=2, description="Variance in point allocation (±variance points)", ge=0
     )
     character_stats_max_rerolls: int = Field(
-        default=5, description="Maximum number of stat re-rolls allowed during character creation"
+        default=5,
+        description="Maximum number of stat re-rolls allowed during character creation",
+        ge=0,
     )
 
     # Memory compression settings
     memory_max_memories: int = Field(
-        default=12, description="Maximum number of memories to include in compressed context"
+        default=12, description="Maximum number of memories to include in compressed context", ge=1
     )
     memory_max_recent_memories: int = Field(
-        default=8, description="Maximum number of recent memories to keep detailed (not compressed)"
+        default=8,
+        description="Maximum number of recent memories to keep detailed (not compressed)",
+        ge=0,
     )
     memory_importance_threshold: float = Field(
-        default=0.3, description="Minimum importance score (0.0-1.0) for filtering memories"
+        default=0.3,
+        description="Minimum importance score (0.0-1.0) for filtering memories",
+        ge=0.0,
+        le=1.0,
     )
     memory_recent_cutoff_minutes: int = Field(
-        default=30, description="Minutes back to consider memories as 'recent' (kept detailed)"
+        default=30,
+        description="Minutes back to consider memories as 'recent' (kept detailed)",
+        ge=0,
     )
     memory_description_truncate_length: int = Field(
-        default=400, description="Maximum length for memory descriptions before truncation"
+        default=400, description="Maximum length for memory descriptions before truncation", ge=1
     )
     memory_environmental_items_lookback_minutes: int = Field(
-        default=30, description="Minutes back to look for environmental items in GM responses"
+        default=30, description="Minutes back to look for environmental items in GM responses", ge=0
     )
+
+    @model_validator(mode="after")
+    def _check_ranges(self) -> Self:
+        """Check the cross-field invariants that per-field bounds cannot express."""
+        ranges = (
+            ("character_stats_pool", self.character_stats_pool_min, self.character_stats_pool_max),
+            ("character_stats_luck", self.character_stats_luck_min, self.character_stats_luck_max),
+            ("character_stats_stat", self.character_stats_stat_min, self.character_stats_stat_max),
+        )
+        for name, low, high in ranges:
+            if low > high:
+                raise ValueError(f"{name}_min ({low}) must not exceed {name}_max ({high})")
+        if max(self.game_day_start_hour, self.game_night_start_hour) >= self.game_hours_per_day:
+            raise ValueError(
+                "game_day_start_hour and game_night_start_hour must be < game_hours_per_day"
+            )
+        if self.memory_max_recent_memories > self.memory_max_memories:
+            raise ValueError("memory_max_recent_memories must not exceed memory_max_memories")
+        return self
@@ -1,30 +1,119 @@
-from datetime import UTC, datetime
-from typing import Literal
+from dataclasses import dataclass
+from datetime import datetime
+from enum import IntEnum, StrEnum
+from functools import cached_property
+from typing import Any, ClassVar
 
-from sqlalchemy import JSON, Column, DateTime
+from sqlalchemy import Column, DateTime, Index, func, text
 from sqlmodel import Field
 
-from ds_common.models.base_model import BaseSQLModel
+from ds_common.models.base_model import DEFERRED_BUILD_CONFIG, JSONB_ORJSON, BaseSQLModel
 
-# Type aliases for type checking (not used in SQLModel fields)
-Season = Literal["SPRING", "SUMMER", "FALL", "WINTER"]
-DayOfWeek = Literal["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]
+
+class SeasonName(StrEnum):
+    """Season name enumeration (stored in GameTime.season)"""
+
+    SPRING = "SPRING"
+    SUMMER = "SUMMER"
+    FALL = "FALL"
+    WINTER = "WINTER"
+
+
+class DayOfWeek(StrEnum):
+    """Day of week enumeration"""
+
+    MONDAY = "MONDAY"
+    TUESDAY = "TUESDAY"
+    WEDNESDAY = "WEDNESDAY"
+    THURSDAY = "THURSDAY"
+    FRIDAY = "FRIDAY"
+    SATURDAY = "SATURDAY"
+    SUNDAY = "SUNDAY"
+
+
+class Season(IntEnum):
+    """Season enumeration, in calendar order (usable as a tuple index)"""
+
+    SPRING = 0
+    SUMMER = 1
+    FALL = 2
+    WINTER = 3
+
+
+@dataclass(slots=True, frozen=True)
+class GameTimeConfig:
+    """
+    Parsed, read-only view of GameTime.game_time_config.
+
+    Per-season tuples are indexed by Season. Day/night hours are None when the season has
+    no override, in which case GameSettings base hours apply.
+    """
+
+    months_per_year: int
+    days_per_month: int
+    season_days: tuple[int, int, int, int]
+    season_day_start: tuple[int | None, int | None, int | None, int | None]
+    season_night_start: tuple[int | None, int | None, int | None, int | None]
+
+    @classmethod
+    def from_dict(cls, config: dict[str, Any]) -> "GameTimeConfig":
+        """
+        Parse a game_time_config dict, filling in defaults for missing keys.
+
+        Args:
+            config: Raw game_time_config value
+
+        Returns:
+            GameTimeConfig instance
+        """
+        season_days = config.get("season_days") or {}
+        day_night = config.get("seasonal_day_night") or {}
+        return cls(
+            months_per_year=config.get("months_per_year", 20),
+            days_per_month=config.get("days_per_month", 20),
+            season_days=tuple(season_days.get(s.name, 100) for s in Season),
+            season_day_start=tuple(day_night.get(s.name, {}).get("day_start") for s in Season),
+            season_night_start=tuple(day_night.get(s.name, {}).get("night_start") for s in Season),
+        )
+
+    def season_for_day(self, year_day: int) -> Season:
+        """
+        Get the season a day of the year falls in.
+
+        Args:
+            year_day: Day of year (1-based)
+
+        Returns:
+            Season containing that day
+        """
+        cumulative = 0
+        for season in (Season.SPRING, Season.SUMMER, Season.FALL):
+            cumulative += self.season_days[season]
+            if year_day <= cumulative:
+                return season
+        return Season.WINTER
 
 
 class GameTime(BaseSQLModel, table=True):
     """
     Game time model - singleton table for tracking current game world time.
 
-    Only one record should exist in this table.
+    Only one record can exist in this table (unique index on a constant).
     """
 
     __tablename__ = "game_time"
+    __table_args__ = (Index("uq_game_time_singleton", text("(true)"), unique=True),)
+    # Read current_game_time's server default back in the INSERT's RETURNING, since
+    # create() does not refresh the row
+    __mapper_args__: ClassVar[dict] = {"eager_defaults": True}
+    model_config = DEFERRED_BUILD_CONFIG
 
     # Current game time fields
-    current_game_time: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
+    current_game_time: datetime | None = Field(
+        default=None,
         sa_type=DateTime(timezone=True),
-        description="Current game world time (real datetime, UTC)",
+        sa_column_kwargs={"server_default": func.now()},
+        description="Current game world time (real datetime, UTC), set by the database on insert",
     )
     game_year: int = Field(default=1, description="Current game year")
     year_day: int = Field(default=1, description="Day of year (1-400, 1-based)")
@@ -33,8 +122,8 @@ class GameTime(BaseSQLModel, table=True):
     cycle_year: int | None = Field(default=None, description="Year in the 12-year cycle (1-12)")
     game_hour: int = Field(default=0, description="Hour of day (0-29 for 30-hour days)")
     game_minute: int = Field(default=0, description="Minute of hour (0-59)")
-    season: str | None = Field(default="SPRING", description="Current season")
-    day_of_week: str | None = Field(default="MONDAY", description="Day of week")
+    season: SeasonName | None = Field(default=SeasonName.SPRING, description="Current season")
+    day_of_week: DayOfWeek | None = Field(default=DayOfWeek.MONDAY, description="Day of week")
     is_daytime: bool = Field(default=True, description="Whether it's currently daytime")
 
     # Note: time_multiplier and epoch_start have been moved to GameSettings
@@ -62,6 +151,16 @@ class GameTime(BaseSQLModel, table=True):
                 "WINTER": {"day_start": 0, "night_start": 12},  # Shorter days in winter
             },
         },
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Game time configuration (non-duplicated fields only)",
     )
+
+    @cached_property
+    def parsed_config(self) -> GameTimeConfig:
+        """
+        game_time_config parsed once per loaded row.
+
+        The config is read-only in practice; code that replaces game_time_config on a live
+        instance should reload the row rather than rely on this cache.
+        """
+        return GameTimeConfig.from_dict(self.game_time_config or {})
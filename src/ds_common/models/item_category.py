@@ -19,5 +19,8 @@ class ItemCategory(BaseSQLModel, table=True):
     description: str = Field(description="Category description")
     emoji: str = Field(description="Category emoji")
 
-    # Relationships
-    item_templates: list["ItemTemplate"] = Relationship(back_populates="category")
+    # Relationships (load explicitly with selectinload; lazy loads raise)
+    item_templates: list["ItemTemplate"] = Relationship(
+        back_populates="category",
+        sa_relationship_kwargs={"lazy": "raise_on_sql", "passive_deletes": True},
+    )
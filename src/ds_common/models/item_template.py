@@ -1,15 +1,28 @@
+from enum import StrEnum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import JSON
+from sqlalchemy import Index, text
 from sqlmodel import Column, Field, Relationship
 
-from ds_common.models.base_model import BaseSQLModel
+from ds_common.models.base_model import DEFERRED_BUILD_CONFIG, JSONB_ORJSON, BaseSQLModel
+from ds_common.models.item_template_modifier import ItemModifierKind
 from ds_common.models.junction_tables import CharacterClassStartingEquipment
 
 if TYPE_CHECKING:
     from ds_common.models.character_class import CharacterClass
     from ds_common.models.item_category import ItemCategory
+    from ds_common.models.item_template_modifier import ItemTemplateModifier
+
+
+class ItemRarity(StrEnum):
+    """Item rarity enumeration, from most to least common"""
+
+    COMMON = "common"
+    UNCOMMON = "uncommon"
+    RARE = "rare"
+    EPIC = "epic"
+    LEGENDARY = "legendary"
 
 
 class ItemTemplate(BaseSQLModel, table=True):
@@ -18,57 +31,26 @@ class ItemTemplate(BaseSQLModel, table=True):
     """
 
     __tablename__ = "item_templates"
+    __table_args__ = (
+        # Covers category listings (name/rarity/value) with index-only scans
+        Index(
+            "ix_items_by_category", "category_id", postgresql_include=["name", "rarity", "value"]
+        ),
+        # Backs case-insensitive name lookups (get_by_field with case_sensitive=False)
+        Index("ix_item_templates_name_lower", text("lower(name)")),
+    )
+    model_config = DEFERRED_BUILD_CONFIG
 
     name: str = Field(unique=True, index=True, description="Item template name")
     description: str = Field(description="Item template description")
     category_id: UUID = Field(foreign_key="item_categories.id", description="Item category")
     equippable_slots: list[str] = Field(
         default_factory=list,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="List of equipment slots this item can be equipped to",
     )
-    rarity: str = Field(
-        default="common",
-        description="Item rarity: common, uncommon, rare, epic, legendary",
-    )
+    rarity: ItemRarity = Field(default=ItemRarity.COMMON, description="Item rarity")
     value: int = Field(default=0, description="Item value in credits")
-
-    # Effect properties (JSON dicts)
-    stat_bonuses: dict[str, float] = Field(
-        default_factory=dict,
-        sa_column=Column(JSON),
-        description="Stat bonuses (e.g., {'STR': 5.0, 'DEX': 2.0})",
-    )
-    stat_multipliers: dict[str, float] = Field(
-        default_factory=dict,
-        sa_column=Column(JSON),
-        description="Stat multipliers (e.g., {'INT': 1.2})",
-    )
-    resource_bonuses: dict[str, float] = Field(
-        default_factory=dict,
-        sa_column=Column(JSON),
-        description="Max resource bonuses (e.g., {'max_health': 20.0, 'max_stamina': 10.0})",
-    )
-    resource_regeneration_modifiers: dict[str, dict[str, float]] = Field(
-        default_factory=dict,
-        sa_column=Column(JSON),
-        description="Resource regeneration modifiers (e.g., {'health': {'bonus': 0.5, 'multiplier': 1.2}})",
-    )
-    damage_bonuses: dict[str, float] = Field(
-        default_factory=dict,
-        sa_column=Column(JSON),
-        description="Damage type bonuses (e.g., {'physical': 10.0, 'tech': 5.0})",
-    )
-    damage_multipliers: dict[str, float] = Field(
-        default_factory=dict,
-        sa_column=Column(JSON),
-        description="Damage type multipliers (e.g., {'physical': 1.15})",
-    )
-    healing_bonuses: dict[str, float] = Field(
-        default_factory=dict,
-        sa_column=Column(JSON),
-        description="Healing bonuses (e.g., {'heal_amount': 5.0})",
-    )
     inventory_slots_bonus: int = Field(
         default=0,
         description="Additional inventory slots provided by this item",
@@ -80,3 +62,56 @@ class ItemTemplate(BaseSQLModel, table=True):
         back_populates="starting_equipment",
         link_model=CharacterClassStartingEquipment,
     )
+    modifiers: list["ItemTemplateModifier"] = Relationship(
+        back_populates="item_template",
+        sa_relationship_kwargs={"lazy": "selectin", "cascade": "all, delete-orphan"},
+    )
+
+    # Effect views over modifiers, keyed by target (e.g., {'STR': 5.0, 'DEX': 2.0})
+    def _modifier_values(
+        self, kind: ItemModifierKind, attr: str, neutral: float
+    ) -> dict[str, float]:
+        return {
+            m.target: getattr(m, attr)
+            for m in self.modifiers
+            if m.kind == kind and getattr(m, attr) != neutral
+        }
+
+    @property
+    def stat_bonuses(self) -> dict[str, float]:
+        """Stat bonuses (e.g., {'STR': 5.0, 'DEX': 2.0})"""
+        return self._modifier_values(ItemModifierKind.STAT, "bonus", 0.0)
+
+    @property
+    def stat_multipliers(self) -> dict[str, float]:
+        """Stat multipliers (e.g., {'INT': 1.2})"""
+        return self._modifier_values(ItemModifierKind.STAT, "multiplier", 1.0)
+
+    @property
+    def resource_bonuses(self) -> dict[str, float]:
+        """Max resource bonuses (e.g., {'max_health': 20.0, 'max_stamina': 10.0})"""
+        return self._modifier_values(ItemModifierKind.RESOURCE, "bonus", 0.0)
+
+    @property
+    def resource_regeneration_modifiers(self) -> dict[str, dict[str, float]]:
+        """Resource regeneration modifiers (e.g., {'health': {'bonus': 0.5, 'multiplier': 1.2}})"""
+        return {
+            m.target: {"bonus": m.bonus, "multiplier": m.multiplier}
+            for m in self.modifiers
+            if m.kind == ItemModifierKind.RESOURCE_REGENERATION
+        }
+
+    @property
+    def damage_bonuses(self) -> dict[str, float]:
+        """Damage type bonuses (e.g., {'physical': 10.0, 'tech': 5.0})"""
+        return self._modifier_values(ItemModifierKind.DAMAGE, "bonus", 0.0)
+
+    @property
+    def damage_multipliers(self) -> dict[str, float]:
+        """Damage type multipliers (e.g., {'physical': 1.15})"""
+        return self._modifier_values(ItemModifierKind.DAMAGE, "multiplier", 1.0)
+
+    @property
+    def healing_bonuses(self) -> dict[str, float]:
+        """Healing bonuses (e.g., {'heal_amount': 5.0})"""
+        return self._modifier_values(ItemModifierKind.HEALING, "bonus", 0.0)
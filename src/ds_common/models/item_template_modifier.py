@@ -0,0 +1,81 @@
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlmodel import Field, Relationship, SQLModel
+
+if TYPE_CHECKING:
+    from ds_common.models.item_template import ItemTemplate
+
+
+class ItemModifierKind(StrEnum):
+    """Item modifier kind enumeration"""
+
+    STAT = "stat"
+    RESOURCE = "resource"
+    RESOURCE_REGENERATION = "resource_regeneration"
+    DAMAGE = "damage"
+    HEALING = "healing"
+
+
+class ItemTemplateModifier(SQLModel, table=True):
+    """
+    Numeric effect of an item template on a single target.
+
+    One row per (template, kind, target) replaces the per-kind JSON dicts that used to live
+    on ItemTemplate, so equipment totals can be summed in SQL.
+    """
+
+    __tablename__ = "item_template_modifiers"
+
+    item_template_id: UUID = Field(primary_key=True, foreign_key="item_templates.id")
+    kind: ItemModifierKind = Field(primary_key=True, description="Modifier kind")
+    target: str = Field(
+        primary_key=True,
+        description="Stat, resource, damage type or healing key (e.g., 'STR', 'max_health')",
+    )
+    bonus: float = Field(default=0.0, description="Flat bonus added to the target")
+    multiplier: float = Field(default=1.0, description="Multiplier applied to the target")
+
+    # Relationships
+    item_template: "ItemTemplate" = Relationship(back_populates="modifiers")
+
+    @classmethod
+    def from_effects(cls, effects: dict[str, Any]) -> list["ItemTemplateModifier"]:
+        """
+        Build modifier rows from the legacy effect dicts used by seed data.
+
+        Args:
+            effects: Mapping containing any of stat_bonuses, stat_multipliers, resource_bonuses,
+                resource_regeneration_modifiers, damage_bonuses, damage_multipliers and
+                healing_bonuses
+
+        Returns:
+            List of ItemTemplateModifier rows, one per (kind, target)
+        """
+        rows: dict[tuple[ItemModifierKind, str], ItemTemplateModifier] = {}
+
+        def _row(kind: ItemModifierKind, target: str) -> ItemTemplateModifier:
+            key = (kind, target)
+            if key not in rows:
+                rows[key] = cls(kind=kind, target=target)
+            return rows[key]
+
+        for target, bonus in (effects.get("stat_bonuses") or {}).items():
+            _row(ItemModifierKind.STAT, target).bonus = float(bonus)
+        for target, multiplier in (effects.get("stat_multipliers") or {}).items():
+            _row(ItemModifierKind.STAT, target).multiplier = float(multiplier)
+        for target, bonus in (effects.get("resource_bonuses") or {}).items():
+            _row(ItemModifierKind.RESOURCE, target).bonus = float(bonus)
+        for target, mods in (effects.get("resource_regeneration_modifiers") or {}).items():
+            row = _row(ItemModifierKind.RESOURCE_REGENERATION, target)
+            row.bonus = float(mods.get("bonus", 0.0))
+            row.multiplier = float(mods.get("multiplier", 1.0))
+        for target, bonus in (effects.get("damage_bonuses") or {}).items():
+            _row(ItemModifierKind.DAMAGE, target).bonus = float(bonus)
+        for target, multiplier in (effects.get("damage_multipliers") or {}).items():
+            _row(ItemModifierKind.DAMAGE, target).multiplier = float(multiplier)
+        for target, bonus in (effects.get("healing_bonuses") or {}).items():
+            _row(ItemModifierKind.HEALING, target).bonus = float(bonus)
+
+        return list(rows.values())
@@ -6,7 +6,7 @@ These tables replace SurrealDB graph relationships with relational many-to-many
 
 from uuid import UUID
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import ForeignKeyConstraint
 from sqlmodel import Field, SQLModel
 
 
@@ -19,7 +19,7 @@ class PlayerCharacter(SQLModel, table=True):
     __tablename__ = "player_characters"
 
     player_id: UUID = Field(primary_key=True, foreign_key="players.id")
-    character_id: UUID = Field(primary_key=True, foreign_key="characters.id")
+    character_id: UUID = Field(primary_key=True, foreign_key="characters.id", index=True)
 
 
 class GameSessionPlayer(SQLModel, table=True):
@@ -31,7 +31,7 @@ class GameSessionPlayer(SQLModel, table=True):
     __tablename__ = "game_session_players"
 
     game_session_id: UUID = Field(primary_key=True, foreign_key="game_sessions.id")
-    player_id: UUID = Field(primary_key=True, foreign_key="players.id")
+    player_id: UUID = Field(primary_key=True, foreign_key="players.id", index=True)
 
 
 class GameSessionCharacter(SQLModel, table=True):
@@ -43,7 +43,7 @@ class GameSessionCharacter(SQLModel, table=True):
     __tablename__ = "game_session_characters"
 
     game_session_id: UUID = Field(primary_key=True, foreign_key="game_sessions.id")
-    character_id: UUID = Field(primary_key=True, foreign_key="characters.id")
+    character_id: UUID = Field(primary_key=True, foreign_key="characters.id", index=True)
 
 
 class CharacterClassStat(SQLModel, table=True):
@@ -55,7 +55,7 @@ class CharacterClassStat(SQLModel, table=True):
     __tablename__ = "character_class_stats"
 
     character_class_id: UUID = Field(primary_key=True, foreign_key="character_classes.id")
-    character_stat_id: UUID = Field(primary_key=True, foreign_key="character_stats.id")
+    character_stat_id: UUID = Field(primary_key=True, foreign_key="character_stats.id", index=True)
 
 
 class CharacterQuest(SQLModel, table=True):
@@ -63,26 +63,44 @@ class CharacterQuest(SQLModel, table=True):
     Junction table for character-quest relationship.
     Replaces SurrealDB: has_quest
 
-    Tracks items given to the character when accepting the quest.
-    These items will be removed if the quest is abandoned or the session ends.
+    Items given to the character when accepting the quest are tracked in
+    CharacterQuestItem and removed if the quest is abandoned or the session ends.
     """
 
     __tablename__ = "character_quests"
 
     character_id: UUID = Field(primary_key=True, foreign_key="characters.id")
-    quest_id: UUID = Field(primary_key=True, foreign_key="quests.id")
-    items_given: list[dict] = Field(
-        default_factory=list,
-        sa_column=Column(JSON),
-        description="Items given to character when accepting this quest. Format: [{'name': 'Item Name', 'quantity': 1, 'instance_id': '...'}]",
-    )
+    quest_id: UUID = Field(primary_key=True, foreign_key="quests.id", index=True)
     session_id: UUID | None = Field(
         default=None,
         foreign_key="game_sessions.id",
+        index=True,
         description="Session ID when quest was accepted. Used for cleanup when session ends.",
     )
 
 
+class CharacterQuestItem(SQLModel, table=True):
+    """
+    Item given to a character when accepting a quest.
+    Rows are deleted with their CharacterQuest (ON DELETE CASCADE).
+    """
+
+    __tablename__ = "character_quest_items"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["character_id", "quest_id"],
+            ["character_quests.character_id", "character_quests.quest_id"],
+            ondelete="CASCADE",
+        ),
+    )
+
+    character_id: UUID = Field(primary_key=True)
+    quest_id: UUID = Field(primary_key=True)
+    instance_id: str = Field(primary_key=True, description="Inventory item instance ID")
+    name: str = Field(description="Item name (fallback match when instance IDs were merged)")
+    quantity: int = Field(default=1, description="Quantity given")
+
+
 class EncounterCharacter(SQLModel, table=True):
     """
     Junction table for encounter-character relationship.
@@ -91,7 +109,7 @@ class EncounterCharacter(SQLModel, table=True):
     __tablename__ = "encounter_characters"
 
     encounter_id: UUID = Field(primary_key=True, foreign_key="encounters.id")
-    character_id: UUID = Field(primary_key=True, foreign_key="characters.id")
+    character_id: UUID = Field(primary_key=True, foreign_key="characters.id", index=True)
 
 
 class EncounterNPC(SQLModel, table=True):
@@ -102,7 +120,7 @@ class EncounterNPC(SQLModel, table=True):
     __tablename__ = "encounter_npcs"
 
     encounter_id: UUID = Field(primary_key=True, foreign_key="encounters.id")
-    npc_id: UUID = Field(primary_key=True, foreign_key="npcs.id")
+    npc_id: UUID = Field(primary_key=True, foreign_key="npcs.id", index=True)
 
 
 class CharacterClassStartingEquipment(SQLModel, table=True):
@@ -114,6 +132,6 @@ class CharacterClassStartingEquipment(SQLModel, table=True):
     __tablename__ = "character_class_starting_equipment"
 
     character_class_id: UUID = Field(primary_key=True, foreign_key="character_classes.id")
-    item_template_id: UUID = Field(primary_key=True, foreign_key="item_templates.id")
+    item_template_id: UUID = Field(primary_key=True, foreign_key="item_templates.id", index=True)
     equipment_slot: str = Field(description="Slot to auto-equip this item to")
     quantity: int = Field(default=1, description="Quantity of this item to give")
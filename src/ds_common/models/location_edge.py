@@ -6,10 +6,10 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import JSON, Column, UniqueConstraint
+from sqlalchemy import Column, Index, UniqueConstraint
 from sqlmodel import Field, Relationship
 
-from ds_common.models.base_model import BaseSQLModel
+from ds_common.models.base_model import DEFERRED_BUILD_CONFIG, JSONB_ORJSON, BaseSQLModel
 
 if TYPE_CHECKING:
     from ds_common.models.location_node import LocationNode
@@ -27,13 +27,20 @@ class LocationEdge(BaseSQLModel, table=True):
         UniqueConstraint(
             "from_location_id", "to_location_id", "edge_type", name="uq_location_edge"
         ),
+        # uq_location_edge already covers outgoing lookups; this covers incoming ones
+        Index(
+            "ix_edges_to", "to_location_id", postgresql_include=["from_location_id", "edge_type"]
+        ),
     )
+    model_config = DEFERRED_BUILD_CONFIG
 
     from_location_id: UUID = Field(
-        foreign_key="location_nodes.id", description="Source location node ID"
+        foreign_key="location_nodes.id", ondelete="CASCADE", description="Source location node ID"
     )
     to_location_id: UUID = Field(
-        foreign_key="location_nodes.id", description="Destination location node ID"
+        foreign_key="location_nodes.id",
+        ondelete="CASCADE",
+        description="Destination location node ID",
     )
     edge_type: str = Field(description="Edge type: DIRECT, REQUIRES_TRAVEL, SECRET, CONDITIONAL")
     travel_method: str | None = Field(
@@ -44,7 +51,7 @@ class LocationEdge(BaseSQLModel, table=True):
     )
     requirements: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Travel requirements: {credits: int, items: [], permissions: []}",
     )
     narrative_description: str | None = Field(
@@ -52,7 +59,7 @@ class LocationEdge(BaseSQLModel, table=True):
     )
     conditions: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Route conditions: {time_of_day: str, weather: str, etc.}",
     )
     discovered_by: UUID | None = Field(
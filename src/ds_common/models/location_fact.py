@@ -4,10 +4,10 @@ Location fact model for storing geography facts, travel requirements, and locati
 
 from uuid import UUID
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import Column, Index, text
 from sqlmodel import Field
 
-from ds_common.models.base_model import BaseSQLModel
+from ds_common.models.base_model import DEFERRED_BUILD_CONFIG, JSONB_ORJSON, BaseSQLModel
 
 
 class LocationFact(BaseSQLModel, table=True):
@@ -18,6 +18,9 @@ class LocationFact(BaseSQLModel, table=True):
     """
 
     __tablename__ = "location_facts"
+    # Backs case-insensitive lookups by location name
+    __table_args__ = (Index("ix_location_facts_location_name_lower", text("lower(location_name)")),)
+    model_config = DEFERRED_BUILD_CONFIG
 
     location_name: str = Field(
         index=True, max_length=255, description="Location name (city, district, sector, etc.)"
@@ -27,28 +30,28 @@ class LocationFact(BaseSQLModel, table=True):
     # Facts about the location
     facts: list[str] = Field(
         default_factory=list,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="List of established facts about this location",
     )
 
     # Geography relationships
     connections: dict = Field(
         default_factory=dict,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Location connections: {direct: [], requires_travel: [], not_connected: []}",
     )
 
     # Travel requirements
     travel_requirements: dict = Field(
         default_factory=dict,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Travel requirements: {from_location: {method: str, time: str, requirements: []}}",
     )
 
     # Physical properties
     physical_properties: dict = Field(
         default_factory=dict,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Physical properties: {distance: str, accessibility: str, elevation: str, etc.}",
     )
 
@@ -60,6 +63,6 @@ class LocationFact(BaseSQLModel, table=True):
     # Constraints
     constraints: dict = Field(
         default_factory=dict,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Constraints: {cannot_reach_by: [], requires: [], forbidden_actions: []}",
     )
@@ -6,10 +6,10 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import Column, Index, text
 from sqlmodel import Field, Relationship
 
-from ds_common.models.base_model import BaseSQLModel
+from ds_common.models.base_model import DEFERRED_BUILD_CONFIG, JSONB_ORJSON, BaseSQLModel
 
 if TYPE_CHECKING:
     from ds_common.models.location_edge import LocationEdge
@@ -24,18 +24,21 @@ class LocationNode(BaseSQLModel, table=True):
     """
 
     __tablename__ = "location_nodes"
+    # Backs case-insensitive lookups by location name
+    __table_args__ = (Index("ix_location_nodes_location_name_lower", text("lower(location_name)")),)
+    model_config = DEFERRED_BUILD_CONFIG
 
     location_name: str = Field(unique=True, index=True, max_length=255, description="Location name")
     location_type: str = Field(description="Location type: CITY, DISTRICT, SECTOR, POI, CUSTOM")
     description: str | None = Field(default=None, description="Rich narrative description")
     atmosphere: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Sensory details: {sights: [], sounds: [], smells: []}",
     )
     physical_properties: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Physical properties: {distance: str, elevation: str, accessibility: str}",
     )
     theme: str | None = Field(
@@ -43,7 +46,7 @@ class LocationNode(BaseSQLModel, table=True):
     )
     character_associations: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Character associations: {nearby_npcs: [], factions: [], npc_relationships: []}",
     )
     location_fact_id: UUID | None = Field(
@@ -52,6 +55,7 @@ class LocationNode(BaseSQLModel, table=True):
     parent_location_id: UUID | None = Field(
         default=None,
         foreign_key="location_nodes.id",
+        ondelete="SET NULL",
         description="Parent location node ID (for POIs within cities)",
     )
     discovered_by: UUID | None = Field(
@@ -68,7 +72,7 @@ class LocationNode(BaseSQLModel, table=True):
         description="Game session where this location was discovered",
     )
 
-    # Relationships
+    # Relationships (collections must be loaded explicitly with selectinload; lazy loads raise)
     location_fact: "LocationFact" = Relationship()
     parent_location: "LocationNode" = Relationship(
         back_populates="child_locations",
@@ -81,17 +85,23 @@ class LocationNode(BaseSQLModel, table=True):
         back_populates="parent_location",
         sa_relationship_kwargs={
             "foreign_keys": "[LocationNode.parent_location_id]",
+            "lazy": "raise_on_sql",
+            "passive_deletes": True,
         },
     )
     outgoing_edges: list["LocationEdge"] = Relationship(
         back_populates="from_location",
         sa_relationship_kwargs={
             "foreign_keys": "[LocationEdge.from_location_id]",
+            "lazy": "raise_on_sql",
+            "passive_deletes": True,
         },
     )
     incoming_edges: list["LocationEdge"] = Relationship(
         back_populates="to_location",
         sa_relationship_kwargs={
             "foreign_keys": "[LocationEdge.to_location_id]",
+            "lazy": "raise_on_sql",
+            "passive_deletes": True,
         },
     )
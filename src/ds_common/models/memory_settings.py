@@ -1,3 +1,4 @@
+from sqlalchemy import Index, text
 from sqlmodel import Field
 
 from ds_common.models.base_model import BaseSQLModel
@@ -7,10 +8,11 @@ class MemorySettings(BaseSQLModel, table=True):
     """
     Memory settings model for configurable expiration times and cleanup settings.
 
-    Singleton pattern - only one settings record should exist.
+    Singleton pattern - only one settings record can exist.
     """
 
     __tablename__ = "memory_settings"
+    __table_args__ = (Index("uq_memory_settings_singleton", text("(true)"), unique=True),)
 
     session_memory_expiration_hours: int = Field(
         default=4,
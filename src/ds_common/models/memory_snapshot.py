@@ -1,13 +1,26 @@
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Literal
+from enum import StrEnum
+from typing import ClassVar
 from uuid import UUID
 
-from sqlalchemy import JSON, BigInteger, Column, DateTime
+from sqlalchemy import BigInteger, Column, DateTime
+from sqlalchemy.orm import deferred
 from sqlmodel import Field
 
-from ds_common.models.base_model import BaseSQLModel
+from ds_common.models.base_model import DEFERRED_BUILD_CONFIG, JSONB_ORJSON, BaseSQLModel
 
-SnapshotType = Literal["world_change", "episode_promotion"]  # Used for type hints only
+
+class SnapshotType(StrEnum):
+    """Snapshot type enumeration"""
+
+    WORLD_CHANGE = "world_change"
+    EPISODE_PROMOTION = "episode_promotion"
+
+
+# Snapshot payloads can be large and list views never read them, so the column is deferred;
+# use MemorySnapshotRepository.get_with_data when the payload is needed.
+_SNAPSHOT_DATA_COLUMN = Column("snapshot_data", JSONB_ORJSON)
 
 
 class MemorySnapshot(BaseSQLModel, table=True):
@@ -18,13 +31,15 @@ class MemorySnapshot(BaseSQLModel, table=True):
     """
 
     __tablename__ = "memory_snapshots"
+    __mapper_args__: ClassVar[dict] = {
+        "properties": {"snapshot_data": deferred(_SNAPSHOT_DATA_COLUMN)}
+    }
+    model_config = DEFERRED_BUILD_CONFIG
 
-    snapshot_type: str = Field(
-        description="Type of snapshot"
-    )  # SnapshotType = Literal["world_change", "episode_promotion"]
+    snapshot_type: SnapshotType = Field(description="Type of snapshot")
     snapshot_data: dict = Field(
-        sa_column=Column(JSON),
-        description="Full snapshot data as JSONB",
+        sa_column=_SNAPSHOT_DATA_COLUMN,
+        description="Full snapshot data as JSONB (deferred)",
     )
     world_memory_id: UUID | None = Field(
         default=None, index=True, description="World memory ID this snapshot protects"
@@ -45,3 +60,19 @@ class MemorySnapshot(BaseSQLModel, table=True):
         sa_column=Column(BigInteger()),
         description="Discord user ID who performed the unwind",
     )
+
+
+@dataclass(slots=True, frozen=True)
+class MemorySnapshotSummary:
+    """
+    Read-only snapshot row for list views, built from plain column tuples.
+
+    Field order matches MemorySnapshotRepository.get_snapshot_summaries' select.
+    """
+
+    id: UUID
+    snapshot_type: SnapshotType
+    created_reason: str
+    world_memory_id: UUID | None
+    created_at: datetime
+    unwound_at: datetime | None
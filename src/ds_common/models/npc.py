@@ -1,22 +1,31 @@
 import random
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from itertools import pairwise
+from typing import TYPE_CHECKING, TypedDict
 
-from sqlalchemy import JSON, DateTime
+from sqlalchemy import DateTime
 from sqlmodel import Column, Field, Relationship
 
-from ds_common.combat import (
-    calculate_max_armor,
-    calculate_max_health,
-    calculate_max_stamina,
-    calculate_max_tech_power,
-)
-from ds_common.models.base_model import BaseSQLModel
+from ds_common.combat import calculate_max_resources
+from ds_common.models.base_model import JSONB_ORJSON, BaseSQLModel
 from ds_common.models.junction_tables import EncounterNPC
 
 if TYPE_CHECKING:
     from ds_common.models.encounter import Encounter
 
+_STAT_KEYS = ("CHA", "DEX", "INT", "LUK", "PER", "STR")
+
+
+class NPCSpec(TypedDict):
+    """Descriptive fields for an NPC to generate; the rest are rolled."""
+
+    name: str
+    race: str
+    background: str
+    profession: str
+    faction: str | None
+    location: str | None
+
 
 class NPC(BaseSQLModel, table=True):
     """
@@ -35,12 +44,12 @@ class NPC(BaseSQLModel, table=True):
     credits: int = Field(description="NPC credits")
     stats: dict[str, int] = Field(
         default_factory=dict,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="NPC stats",
     )
     effects: dict[str, int] = Field(
         default_factory=dict,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="NPC effects",
     )
     renown: int = Field(description="NPC renown")
@@ -73,7 +82,7 @@ class NPC(BaseSQLModel, table=True):
     )
 
     @classmethod
-    async def generate_npc(
+    def generate_npc(
         cls,
         name: str,
         race: str,
@@ -82,50 +91,73 @@ class NPC(BaseSQLModel, table=True):
         faction: str | None,
         location: str | None,
     ) -> "NPC":
-        level = random.randint(1, 100)
-        credits = random.randint(1, 100) * level
-
-        max_total_stats = 100 * (level * 1.2)
-
-        stats = {}
-        # Generate stats, with a maximum of max_stats
-        for stat in ["CHA", "DEX", "INT", "LUK", "PER", "STR"]:
-            max_stat_value = int(max_total_stats / 6)
-            stat_value = random.randint(1, max_stat_value if max_stat_value > 0 else 1)
-            max_total_stats -= stat_value
-
-            stats[stat] = stat_value
-
-        npc = cls(
-            name=name,
-            race=race,
-            background=background,
-            profession=profession,
-            faction=faction,
-            location=location,
-            level=level,
-            credits=credits,
-            stats=stats,
-            effects={},
-            renown=0,
-            shadow_level=0,
-            created_at=datetime.now(UTC),
-            last_active=datetime.now(UTC),
+        npcs = cls.generate_npcs(
+            [
+                NPCSpec(
+                    name=name,
+                    race=race,
+                    background=background,
+                    profession=profession,
+                    faction=faction,
+                    location=location,
+                )
+            ]
         )
+        return npcs[0]
 
-        # Initialize combat resources (NPCs don't have character classes)
-        npc.max_health = calculate_max_health(npc, None)
-        npc.max_stamina = calculate_max_stamina(npc, None)
-        npc.max_tech_power = calculate_max_tech_power(npc, None)
-        npc.max_armor = calculate_max_armor(npc, None)
-
-        # Set current resources to max
-        npc.current_health = npc.max_health
-        npc.current_stamina = npc.max_stamina
-        npc.current_tech_power = npc.max_tech_power
-        npc.current_armor = npc.max_armor
-
-        # Set last_resource_update
-        npc.last_resource_update = datetime.now(UTC)
-
-        return npc
+    @classmethod
+    def generate_npcs(cls, specs: list[NPCSpec]) -> list["NPC"]:
+        """
+        Generate a batch of NPCs with random level, credits and stats.
+
+        All NPCs in the batch share one creation timestamp.
+
+        Args:
+            specs: Descriptive fields for each NPC to generate
+
+        Returns:
+            Generated NPCs (not persisted), in the same order as specs
+        """
+        now = datetime.now(UTC)
+        npcs = []
+        for spec in specs:
+            level = random.randint(1, 100)
+            credits = random.randint(1, 100) * level
+
+            max_total_stats = int(100 * (level * 1.2))
+
+            # Split the stat budget uniformly at random (a flat Dirichlet over integers):
+            # five distinct cut points in one draw give six parts of at least 1 each
+            cuts = sorted(random.sample(range(1, max_total_stats), len(_STAT_KEYS) - 1))
+            bounds = [0, *cuts, max_total_stats]
+            stats = dict(zip(_STAT_KEYS, (b - a for a, b in pairwise(bounds)), strict=True))
+
+            npc = cls(
+                **spec,
+                level=level,
+                credits=credits,
+                stats=stats,
+                effects={},
+                renown=0,
+                shadow_level=0,
+                created_at=now,
+                updated_at=now,
+                last_active=now,
+                last_resource_update=now,
+            )
+
+            # Initialize combat resources (NPCs don't have character classes)
+            resources = calculate_max_resources(npc, None)
+            npc.max_health, npc.max_stamina, npc.max_tech_power, npc.max_armor = resources
+
+            # Set current resources to max
+            (
+                npc.current_health,
+                npc.current_stamina,
+                npc.current_tech_power,
+                npc.current_armor,
+            ) = resources
+
+            npcs.append(npc)
+
+        return npcs
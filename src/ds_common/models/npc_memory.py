@@ -1,20 +1,11 @@
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import JSON, Column
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import Column, Index, text
 from sqlmodel import Field, Relationship
 
-from ds_common.models.base_model import BaseSQLModel
-
-try:
-    from pgvector.sqlalchemy import Vector
-except ImportError:
-    # Fallback if pgvector is not installed yet
-    from sqlalchemy import ARRAY, Float
-
-    def Vector(dim: int) -> type[ARRAY[Float]]:  # noqa: ARG001
-        return ARRAY(Float)
-
+from ds_common.models.base_model import JSONB_ORJSON, BaseSQLModel
 
 if TYPE_CHECKING:
     from ds_common.models.npc import NPC
@@ -28,16 +19,31 @@ class NPCMemory(BaseSQLModel, table=True):
     """
 
     __tablename__ = "npc_memories"
+    __table_args__ = (
+        Index(
+            "idx_npc_memory_embedding",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 12, "ef_construction": 24},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+        # Shortlist index for two-stage search (see NPCMemoryRepository.search_similar)
+        Index(
+            "idx_npc_memory_embedding_bq",
+            text("(binary_quantize(embedding)::bit(768)) bit_hamming_ops"),
+            postgresql_using="hnsw",
+        ),
+    )
 
     npc_id: UUID = Field(foreign_key="npcs.id", index=True, description="NPC ID")
     memory_text: str = Field(description="The memory text content")
     embedding: list[float] = Field(
-        sa_column=Column(Vector(768)),
-        description="Vector embedding of the memory (768 dimensions - matches nomic-embed-text)",
+        sa_column=Column(HALFVEC(768)),
+        description="Half-precision embedding of the memory (768 dimensions - matches nomic-embed-text)",
     )
     meta_data: dict[str, str] | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Additional metadata about the memory",
     )
 
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
@@ -65,15 +66,30 @@ class Player(BaseSQLModel, table=True):
 
     @classmethod
     def from_member(
-        cls, member: Member | User, is_active: bool = True, is_banned: bool = False
+        cls,
+        member: Member | User,
+        is_active: bool = True,
+        is_banned: bool = False,
+        now: datetime | None = None,
     ) -> "Player":
+        now = now or datetime.now(UTC)
         return cls(
             discord_id=member.id,
             global_name=member.global_name,
             display_name=member.display_name,
             display_avatar=member.display_avatar.url,
-            joined_at=datetime.now(UTC),
-            last_active_at=datetime.now(UTC),
+            joined_at=now,
+            last_active_at=now,
             is_active=is_active,
             is_banned=is_banned,
+            created_at=now,
+            updated_at=now,
         )
+
+    @classmethod
+    def from_members(
+        cls, members: Iterable[Member | User], is_active: bool = True, is_banned: bool = False
+    ) -> list["Player"]:
+        """Build players for many members (e.g. a guild sync) sharing one timestamp."""
+        now = datetime.now(UTC)
+        return [cls.from_member(member, is_active, is_banned, now=now) for member in members]
@@ -2,11 +2,11 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Literal, Optional
 from uuid import UUID
 
-from sqlalchemy import JSON, Column, DateTime, Float, String
+from sqlalchemy import Column, DateTime, Float, Index, String, text
 from sqlalchemy.dialects import postgresql
 from sqlmodel import Field, Relationship
 
-from ds_common.models.base_model import BaseSQLModel
+from ds_common.models.base_model import JSONB_ORJSON, BaseSQLModel
 
 if TYPE_CHECKING:
     from ds_common.models.character import Character
@@ -24,6 +24,21 @@ class SessionMemory(BaseSQLModel, table=True):
     """
 
     __tablename__ = "session_memories"
+    __table_args__ = (
+        # Unprocessed rows are a small slice of the table; processing reads them by session
+        Index(
+            "ix_session_memories_unprocessed",
+            "session_id",
+            "timestamp",
+            postgresql_where=text("processed = false"),
+        ),
+        # Cleanup only deletes processed rows that have an expiry
+        Index(
+            "ix_session_memories_expiry",
+            "expires_at",
+            postgresql_where=text("processed = true AND expires_at IS NOT NULL"),
+        ),
+    )
 
     session_id: UUID = Field(
         foreign_key="game_sessions.id", index=True, description="Game session ID"
@@ -37,7 +52,7 @@ class SessionMemory(BaseSQLModel, table=True):
         default=None, description="Type of memory"
     )  # MemoryType = Literal["dialogue", "action", "observation"]
     content: dict = Field(
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Event content as JSONB",
     )
     participants: "list[UUID]" = Field(  # type: ignore[valid-type]
@@ -70,7 +85,7 @@ class SessionMemory(BaseSQLModel, table=True):
         description="When this memory expires (UTC)",
     )
     processed: bool = Field(
-        default=False, index=True, description="Whether this has been processed into an episode"
+        default=False, description="Whether this has been processed into an episode"
     )
 
     # Relationships
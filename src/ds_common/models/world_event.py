@@ -2,11 +2,16 @@ from datetime import datetime
 from typing import Literal
 from uuid import UUID
 
-from sqlalchemy import ARRAY, JSON, Column, DateTime, String
+from sqlalchemy import ARRAY, Column, DateTime, String
 from sqlalchemy.dialects import postgresql
 from sqlmodel import Field
 
-from ds_common.models.base_model import BaseSQLModel
+from ds_common.models.base_model import (
+    DEFERRED_BUILD_CONFIG,
+    JSONB_ORJSON,
+    BaseSQLModel,
+    allowed_values_validator,
+)
 
 # Type aliases for type checking (not used in SQLModel fields)
 EventType = Literal["LONG_RUNNING", "CALENDAR", "TRIGGERED", "RECURRING"]
@@ -23,6 +28,7 @@ class WorldEvent(BaseSQLModel, table=True):
     """
 
     __tablename__ = "world_events"
+    model_config = DEFERRED_BUILD_CONFIG
 
     event_type: str = Field(
         description="Type of event"
@@ -35,10 +41,10 @@ class WorldEvent(BaseSQLModel, table=True):
 
     # Conditions
     start_conditions: dict | None = Field(
-        default=None, sa_column=Column(JSON), description="Conditions for event to start"
+        default=None, sa_column=Column(JSONB_ORJSON), description="Conditions for event to start"
     )
     end_conditions: dict | None = Field(
-        default=None, sa_column=Column(JSON), description="Conditions for event to end"
+        default=None, sa_column=Column(JSONB_ORJSON), description="Conditions for event to end"
     )
 
     # Timing (real time OR game time)
@@ -54,24 +60,24 @@ class WorldEvent(BaseSQLModel, table=True):
     )
     start_game_time: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Game time start: {year, day, hour} (optional)",
     )
     end_game_time: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Game time end: {year, day, hour} (optional)",
     )
 
     # Recurrence
     recurrence_pattern: dict | None = Field(
-        default=None, sa_column=Column(JSON), description="Recurrence pattern if recurring"
+        default=None, sa_column=Column(JSONB_ORJSON), description="Recurrence pattern if recurring"
     )
 
     # Regional scope
     regional_scope: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Regional scope: {locations: [], factions: [], districts: []}",
     )
 
@@ -94,3 +100,11 @@ class WorldEvent(BaseSQLModel, table=True):
         sa_column=Column(ARRAY(String)),
         description="Factions affected by this event",
     )
+
+    _check_allowed_values = allowed_values_validator(
+        {
+            "event_type": EventType,
+            "status": EventStatus,
+            "impact_level": ImpactLevel,
+        }
+    )
@@ -2,11 +2,16 @@ from datetime import datetime
 from typing import Literal
 from uuid import UUID
 
-from sqlalchemy import ARRAY, JSON, Column, DateTime
+from sqlalchemy import ARRAY, Column, DateTime, Index
 from sqlalchemy.dialects import postgresql
 from sqlmodel import Field
 
-from ds_common.models.base_model import BaseSQLModel
+from ds_common.models.base_model import (
+    DEFERRED_BUILD_CONFIG,
+    JSONB_ORJSON,
+    BaseSQLModel,
+    allowed_values_validator,
+)
 
 # Type aliases for type checking (not used in SQLModel fields)
 ItemType = Literal["UNIQUE", "QUEST_GOAL", "COLLECTIBLE", "ARTIFACT", "FACTION_RELIC"]
@@ -21,6 +26,11 @@ class WorldItem(BaseSQLModel, table=True):
     """
 
     __tablename__ = "world_items"
+    __table_args__ = (
+        # Array containment lookups (see WorldItemRepository.get_by_quest)
+        Index("ix_world_items_quest_goals", "quest_goals", postgresql_using="gin"),
+    )
+    model_config = DEFERRED_BUILD_CONFIG
 
     name: str = Field(max_length=255, description="Item name")
     description: str | None = Field(default=None, description="Item description")
@@ -33,7 +43,7 @@ class WorldItem(BaseSQLModel, table=True):
 
     # Collection
     collection_condition: dict | None = Field(
-        default=None, sa_column=Column(JSON), description="Conditions for collection"
+        default=None, sa_column=Column(JSONB_ORJSON), description="Conditions for collection"
     )
     collected_by: UUID | None = Field(
         default=None, foreign_key="characters.id", description="Character who collected it"
@@ -45,7 +55,7 @@ class WorldItem(BaseSQLModel, table=True):
     )
     collected_at_game_time: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Game time when collected: {year, day, hour}",
     )
     collection_session_id: UUID | None = Field(
@@ -55,7 +65,7 @@ class WorldItem(BaseSQLModel, table=True):
     # Quest integration
     quest_goals: list[UUID] = Field(
         default_factory=list,
-        sa_column=Column(ARRAY(postgresql.UUID(as_uuid=True))),
+        sa_column=Column(postgresql.ARRAY(postgresql.UUID(as_uuid=True))),
         description="Quest IDs that require this item",
     )
 
@@ -63,7 +73,7 @@ class WorldItem(BaseSQLModel, table=True):
     location_hint: str | None = Field(default=None, description="Hint about item location")
     regional_availability: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Regional availability: {regions: [], locations: []}",
     )
     faction_origin: str | None = Field(
@@ -76,3 +86,10 @@ class WorldItem(BaseSQLModel, table=True):
         sa_column=Column(ARRAY(postgresql.UUID(as_uuid=True))),
         description="World memory IDs related to this item",
     )
+
+    _check_allowed_values = allowed_values_validator(
+        {
+            "item_type": ItemType,
+            "status": ItemStatus,
+        }
+    )
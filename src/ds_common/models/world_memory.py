@@ -1,26 +1,24 @@
 from typing import Literal
 from uuid import UUID
 
-from sqlalchemy import JSON, Column, String
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import Column, Index, String, text
 from sqlalchemy.dialects import postgresql
 from sqlmodel import Field
 
-from ds_common.models.base_model import BaseSQLModel
-
-try:
-    from pgvector.sqlalchemy import Vector
-except ImportError:
-    # Fallback if pgvector is not installed yet
-    from sqlalchemy import ARRAY as SQLArray
-    from sqlalchemy import Float as SQLFloat
-
-    def Vector(dim: int) -> type[SQLArray[SQLFloat]]:  # noqa: ARG001
-        return SQLArray(SQLFloat)
-
+from ds_common.models.base_model import (
+    DEFERRED_BUILD_CONFIG,
+    JSONB_ORJSON,
+    BaseSQLModel,
+    allowed_values_validator,
+)
 
 MemoryCategory = Literal["event", "character", "location", "faction"]
 ImpactLevel = Literal["minor", "moderate", "major", "world_changing"]
 
+# Impact levels that warrant a memory snapshot before promotion
+HIGH_IMPACT_LEVELS: frozenset[str] = frozenset({"major", "world_changing"})
+
 
 class WorldMemory(BaseSQLModel, table=True):
     """
@@ -30,6 +28,23 @@ class WorldMemory(BaseSQLModel, table=True):
     """
 
     __tablename__ = "world_memories"
+    __table_args__ = (
+        Index(
+            "idx_world_embedding",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+        # Shortlist index for two-stage search (see WorldMemoryRepository.semantic_search);
+        # partial because retrieval and lore checks only search public memories
+        Index(
+            "idx_world_embedding_bq_public",
+            text("(binary_quantize(embedding)::bit(768)) bit_hamming_ops"),
+            postgresql_using="hnsw",
+            postgresql_where=text("is_public"),
+        ),
+    )
+    model_config = DEFERRED_BUILD_CONFIG
 
     memory_category: str | None = Field(
         default=None, description="Category of world memory"
@@ -43,7 +58,7 @@ class WorldMemory(BaseSQLModel, table=True):
 
     related_entities: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Related entities as {characters: [], locations: [], factions: []}",
     )
     source_episodes: "list[UUID]" = Field(  # type: ignore[valid-type]
@@ -59,8 +74,8 @@ class WorldMemory(BaseSQLModel, table=True):
 
     embedding: list[float] | None = Field(
         default=None,
-        sa_column=Column(Vector(768)),
-        description="Vector embedding for semantic search (768 dimensions - matches nomic-embed-text)",
+        sa_column=Column(HALFVEC(768)),
+        description="Half-precision embedding for semantic search (768 dimensions - matches nomic-embed-text)",
     )
     tags: list[str] = Field(
         default_factory=list,
@@ -73,11 +88,11 @@ class WorldMemory(BaseSQLModel, table=True):
 
     # Discovery system
     is_public: bool = Field(
-        default=True, index=True, description="Whether this memory is publicly discoverable"
+        default=True, description="Whether this memory is publicly discoverable"
     )
     discovery_requirements: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Requirements for discovering this memory",
     )
 
@@ -90,11 +105,18 @@ class WorldMemory(BaseSQLModel, table=True):
     )
     regional_context: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Regional context: {city, district, sector, factions}",
     )
     game_time_context: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB_ORJSON),
         description="Game time when memory was created: {year, day, hour, season}",
     )
+
+    _check_allowed_values = allowed_values_validator(
+        {
+            "memory_category": MemoryCategory,
+            "impact_level": ImpactLevel,
+        }
+    )
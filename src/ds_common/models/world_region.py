@@ -1,11 +1,16 @@
 from typing import Literal
 from uuid import UUID
 
-from sqlalchemy import ARRAY, JSON, Column, String
+from sqlalchemy import ARRAY, Column, String
 from sqlalchemy.dialects import postgresql
 from sqlmodel import Field
 
-from ds_common.models.base_model import BaseSQLModel
+from ds_common.models.base_model import (
+    DEFERRED_BUILD_CONFIG,
+    JSONB_ORJSON,
+    BaseSQLModel,
+    allowed_values_validator,
+)
 
 # Type alias for type checking (not used in SQLModel fields)
 RegionType = Literal["CITY", "DISTRICT", "SECTOR", "FACTION_TERRITORY", "CUSTOM"]
@@ -19,6 +24,7 @@ class WorldRegion(BaseSQLModel, table=True):
     """
 
     __tablename__ = "world_regions"
+    model_config = DEFERRED_BUILD_CONFIG
 
     name: str = Field(max_length=255, description="Region name")
     region_type: str = Field(
@@ -51,7 +57,7 @@ class WorldRegion(BaseSQLModel, table=True):
 
     # Custom boundaries
     custom_boundaries: dict | None = Field(
-        default=None, sa_column=Column(JSON), description="Custom boundary definitions"
+        default=None, sa_column=Column(JSONB_ORJSON), description="Custom boundary definitions"
     )
 
     # Active elements
@@ -63,5 +69,9 @@ class WorldRegion(BaseSQLModel, table=True):
 
     # Regional variations
     regional_variations: dict | None = Field(
-        default=None, sa_column=Column(JSON), description="Regional variations and properties"
+        default=None,
+        sa_column=Column(JSONB_ORJSON),
+        description="Regional variations and properties",
     )
+
+    _check_allowed_values = allowed_values_validator({"region_type": RegionType})
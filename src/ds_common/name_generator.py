@@ -1,7 +1,64 @@
 import random
+import string
 from enum import Enum
+from math import lcm
 from typing import ClassVar
 
+# Bound once; still driven by the module-level generator, so random.seed() applies
+_choices = random.choices
+_randrange = random.randrange
+
+# Per-letter (adjectives, nouns) pairs for one theme
+type LetterPools = tuple[tuple[tuple[str, ...], tuple[str, ...]], ...]
+
+
+def _build_letter_pools(
+    adjectives: dict[str, list[str]], nouns: dict[str, list[str]]
+) -> LetterPools:
+    """
+    Flatten adjective and noun dictionaries into per-letter word pools.
+
+    Every letter must have both adjectives and nouns, so each letter stays
+    equally likely and any pool can be picked without a fallback.
+
+    Args:
+        adjectives: Adjectives keyed by first letter
+        nouns: Nouns keyed by first letter
+
+    Returns:
+        Tuple of (adjectives, nouns) tuples, one per letter
+
+    Raises:
+        ValueError: If a letter has no adjectives or no nouns
+    """
+    missing = [
+        letter
+        for letter in string.ascii_lowercase
+        if not adjectives.get(letter) or not nouns.get(letter)
+    ]
+    if missing:
+        raise ValueError(f"Name word lists have no entries for letters: {', '.join(missing)}")
+
+    return tuple(
+        (tuple(adjectives[letter]), tuple(nouns[letter])) for letter in string.ascii_lowercase
+    )
+
+
+def _pool_stride(pools: LetterPools) -> int:
+    """
+    Size of the per-letter slot used to pick a letter and word pair in one draw.
+
+    Each letter's adjective/noun pair count divides the stride, so reducing a
+    slot offset modulo that count keeps every pair equally likely.
+
+    Args:
+        pools: Per-letter word pools for one theme
+
+    Returns:
+        Least common multiple of the pair counts of all letters
+    """
+    return lcm(*(len(adjectives) * len(nouns) for adjectives, nouns in pools))
+
 
 class Theme(str, Enum):
     """Available name generation themes."""
@@ -424,6 +481,15 @@ class NameGenerator:
         "z": ["zigzag", "zone", "zenith", "zephyr", "zero", "zinc", "zorro"],
     }
 
+    _letter_pools: ClassVar[dict[Theme, LetterPools]] = {
+        Theme.CYBERPUNK: _build_letter_pools(cyberpunk_adjectives, cyberpunk_nouns),
+        Theme.FANTASY: _build_letter_pools(fantasy_adjectives, fantasy_nouns),
+        Theme.WESTERN: _build_letter_pools(western_adjectives, western_nouns),
+    }
+    _pool_strides: ClassVar[dict[Theme, int]] = {
+        theme: _pool_stride(pools) for theme, pools in _letter_pools.items()
+    }
+
     # Backward compatibility properties
     @property
     def adjectives(self) -> dict[str, list[str]]:
@@ -435,24 +501,6 @@ class NameGenerator:
         """Backward compatibility: returns cyberpunk nouns."""
         return self.cyberpunk_nouns
 
-    @staticmethod
-    def _get_word_lists(theme: Theme) -> tuple[dict[str, list[str]], dict[str, list[str]]]:
-        """
-        Get adjective and noun dictionaries for a given theme.
-
-        Args:
-            theme: Theme to get word lists for
-
-        Returns:
-            Tuple of (adjectives_dict, nouns_dict)
-        """
-        if theme == Theme.FANTASY:
-            return NameGenerator.fantasy_adjectives, NameGenerator.fantasy_nouns
-        elif theme == Theme.WESTERN:
-            return NameGenerator.western_adjectives, NameGenerator.western_nouns
-        else:  # Default to CYBERPUNK
-            return NameGenerator.cyberpunk_adjectives, NameGenerator.cyberpunk_nouns
-
     @staticmethod
     def generate_name(theme: Theme = Theme.CYBERPUNK) -> str:
         """
@@ -464,24 +512,14 @@ class NameGenerator:
         Returns:
             Generated name in format "adjective-noun"
         """
-        adjectives, nouns = NameGenerator._get_word_lists(theme)
-
-        # Choose a random letter for alliteration
-        letter = random.choice(list("abcdefghijklmnopqrstuvwxyz"))
+        pools = NameGenerator._letter_pools[theme]
+        stride = NameGenerator._pool_strides[theme]
 
-        # Check if the letter has both adjectives and nouns available
-        if (
-            letter in adjectives
-            and letter in nouns
-            and adjectives[letter]
-            and nouns[letter]
-        ):
-            adj = random.choice(adjectives[letter])
-            noun = random.choice(nouns[letter])
-            return f"{adj}-{noun}"
-
-        # Fallback in case a letter has no entries
-        return NameGenerator.generate_name(theme)
+        # One draw picks the alliteration letter and its adjective/noun pair
+        letter_index, offset = divmod(_randrange(len(pools) * stride), stride)
+        adjectives, nouns = pools[letter_index]
+        adj_index, noun_index = divmod(offset % (len(adjectives) * len(nouns)), len(nouns))
+        return f"{adjectives[adj_index]}-{nouns[noun_index]}"
 
     @staticmethod
     def generate_cyberpunk_channel_name() -> str:
@@ -527,4 +565,22 @@ class NameGenerator:
         Returns:
             List of generated names
         """
-        return [NameGenerator.generate_name(theme) for _ in range(count)]
+        pools = NameGenerator._letter_pools[theme]
+
+        # Pick every letter in one call, then draw each letter's words in bulk
+        positions_by_pool: dict[int, list[int]] = {}
+        for position, pool_index in enumerate(_choices(range(len(pools)), k=count)):
+            positions_by_pool.setdefault(pool_index, []).append(position)
+
+        names = [""] * count
+        for pool_index, positions in positions_by_pool.items():
+            adjectives, nouns = pools[pool_index]
+            k = len(positions)
+            for position, adj, noun in zip(
+                positions,
+                _choices(adjectives, k=k),
+                _choices(nouns, k=k),
+                strict=True,
+            ):
+                names[position] = f"{adj}-{noun}"
+        return names
@@ -1,18 +1,85 @@
+import copy
 import logging
-from collections.abc import Awaitable, Callable
-from datetime import UTC
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from datetime import UTC, datetime
+from enum import Enum
+from functools import lru_cache
 from typing import Any, TypeVar
 from uuid import UUID
 
+from pgvector.sqlalchemy import BIT, HALFVEC, SPARSEVEC, Vector
+from sqlalchemy import JSON, Table, bindparam, delete, func, inspect
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 from sqlmodel import select
+from sqlmodel.sql.expression import SelectOfScalar
 
 from ds_common.models.base_model import BaseSQLModel
-from ds_discord_bot.postgres_manager import PostgresManager
+from ds_discord_bot.postgres_manager import PostgresManager, json_serializer
 
 T = TypeVar("T", bound=BaseSQLModel)
 R = TypeVar("R")
 
+# Batches of at least this many rows are written with COPY rather than INSERTs
+COPY_THRESHOLD = 100
+
+# pgvector column types asyncpg has no COPY codec for; tables using them insert via the ORM
+NO_COPY_CODEC_TYPES = (Vector, HALFVEC, BIT, SPARSEVEC)
+
+# Rows fetched per round trip when streaming a table with iter_all
+STREAM_BATCH_SIZE = 1000
+
+
+def _copy_value(value: Any, column_type: Any) -> Any:
+    """Convert an attribute value into what asyncpg's COPY encoder expects."""
+    if value is None:
+        return None
+    if isinstance(column_type, JSON):
+        return json_serializer(value)
+    if isinstance(column_type, SAEnum) and isinstance(value, Enum):
+        # Enum columns store member names; enums in plain String columns keep their value
+        return value.name
+    return value
+
+
+def _supports_copy(table: Table) -> bool:
+    """Whether every column of a table can be written through asyncpg's COPY."""
+    return not any(isinstance(column.type, NO_COPY_CODEC_TYPES) for column in table.columns)
+
+
+@lru_cache(maxsize=256)
+def _get_by_field_stmt(model_class: type, field: str, case_insensitive: bool) -> SelectOfScalar:
+    """
+    Build the get_by_field query once per model, field and case mode.
+
+    The value is left as a ``value`` bind parameter, so the same statement is
+    reused across calls and hits SQLAlchemy's compiled cache. Case-insensitive
+    statements expect the value already lowercased.
+
+    Args:
+        model_class: SQLModel class to select
+        field: Field name to filter on
+        case_insensitive: Whether to compare lowercased values
+
+    Returns:
+        Select statement expecting a ``value`` parameter
+
+    Raises:
+        ValueError: If the field does not exist on the model
+    """
+    if field not in model_class.model_fields:
+        raise ValueError(f"Field {field} not found in model {model_class}")
+
+    field_attr = getattr(model_class, field)
+    value = bindparam("value")
+    if case_insensitive:
+        # The caller lowercases the value, so only the column side is lower(),
+        # matching the lower(column) expression indexes
+        return select(model_class).where(func.lower(field_attr) == value)
+    return select(model_class).where(field_attr == value)
+
 
 class BaseRepository[T]:
     """
@@ -33,16 +100,17 @@ class BaseRepository[T]:
             postgres_manager: PostgreSQL manager for database sessions
             model_class: The SQLModel class this repository manages
         """
-        self.logger: logging.Logger = logging.getLogger(__name__)
+        # Named after the concrete repository's module, so subclasses share it
+        self.logger: logging.Logger = logging.getLogger(type(self).__module__)
         self.postgres_manager: PostgresManager = postgres_manager
         self.model_class: type[T] = model_class
 
-    async def _with_session(
+    def _with_session(
         self,
         func: Callable[[AsyncSession], Awaitable[R]],
         session: AsyncSession | None = None,
         read_only: bool = False,
-    ) -> R:
+    ) -> Awaitable[R]:
         """
         Execute a function with either the provided session or a new one.
 
@@ -51,19 +119,49 @@ class BaseRepository[T]:
         - If session is None, create a new session from postgres_manager
         - If read_only is True, use read replica if available
 
+        It is a plain function returning the awaitable, so calls that pass a
+        session await func directly without an extra coroutine frame.
+
         Args:
             func: Async function that takes an AsyncSession and returns a result
             session: Optional database session to use
             read_only: If True and session is None, use read replica for read operations
 
         Returns:
-            Result from the function execution
+            Awaitable resolving to the result of the function
         """
         if session:
-            return await func(session)
+            return func(session)
+        return self._with_new_session(func, read_only)
+
+    async def _with_new_session(
+        self, func: Callable[[AsyncSession], Awaitable[R]], read_only: bool
+    ) -> R:
+        """Run a function in a session opened for the call."""
         async with self.postgres_manager.get_session(read_only=read_only) as sess:
             return await func(sess)
 
+    def _detached_copy(self, model: T) -> T:
+        """
+        Copy a persisted model into a detached instance that shares no state with it.
+
+        The copy keeps the row's identity with no pending changes, so it can be
+        modified and passed to update() like an instance loaded by an earlier session.
+
+        Args:
+            model: Persisted model instance to copy
+
+        Returns:
+            Detached copy of the model
+        """
+        values = {
+            attr.key: copy.deepcopy(getattr(model, attr.key))
+            for attr in inspect(self.model_class).column_attrs
+        }
+        detached = self.model_class.construct_trusted(**values)
+        make_transient_to_detached(detached)
+        return detached
+
     async def get_by_field(
         self,
         field: str,
@@ -85,30 +183,20 @@ class BaseRepository[T]:
         Returns:
             Model instance or None if not found
         """
-        if field not in self.model_class.model_fields:
-            raise ValueError(f"Field {field} not found in model {self.model_class}")
+        # Case-insensitive matching only applies to strings, as lower() needs text
+        case_insensitive = not case_sensitive and isinstance(value, str)
+        stmt = _get_by_field_stmt(self.model_class, field, case_insensitive)
+        if case_insensitive:
+            value = value.lower()
 
-        field_attr = getattr(self.model_class, field)
-
-        if case_sensitive:
-            stmt = select(self.model_class).where(field_attr == value)
-        else:
-            # For case-insensitive search, use ILIKE for strings
-            if isinstance(value, str):
-                from sqlalchemy import func
-
-                stmt = select(self.model_class).where(func.lower(field_attr) == func.lower(value))
-            else:
-                stmt = select(self.model_class).where(field_attr == value)
-
-        self.logger.debug(f"Query: {stmt}")
+        self.logger.debug("Query: %s", stmt)
 
         async def _execute(sess: AsyncSession):
-            result = await sess.execute(stmt)
+            result = await sess.execute(stmt, {"value": value})
             return result.scalar_one_or_none()
 
         result = await self._with_session(_execute, session, read_only=read_only)
-        self.logger.debug(f"Result: {result}")
+        self.logger.debug("Result: %s", result)
         return result
 
     async def get_by_id(
@@ -128,13 +216,13 @@ class BaseRepository[T]:
         if isinstance(id, str):
             id = UUID(id)
 
-        self.logger.debug(f"Getting {self.model_class.__name__} by id: {id}")
+        self.logger.debug("Getting %s by id: %s", self.model_class.__name__, id)
 
         async def _execute(sess: AsyncSession):
             return await sess.get(self.model_class, id)
 
         result = await self._with_session(_execute, session, read_only=read_only)
-        self.logger.debug(f"Result: {result}")
+        self.logger.debug("Result: %s", result)
         return result
 
     async def get_all(self, session: AsyncSession | None = None, read_only: bool = True) -> list[T]:
@@ -148,7 +236,7 @@ class BaseRepository[T]:
         Returns:
             List of model instances
         """
-        self.logger.debug(f"Getting all {self.model_class.__name__}")
+        self.logger.debug("Getting all %s", self.model_class.__name__)
 
         stmt = select(self.model_class)
 
@@ -157,9 +245,69 @@ class BaseRepository[T]:
             return list(result.scalars().all())
 
         result = await self._with_session(_execute, session, read_only=read_only)
-        self.logger.debug(f"Result: {len(result)} records found")
+        self.logger.debug("Result: %d records found", len(result))
+        return result
+
+    async def get_all_ordered_by(
+        self, field: str, session: AsyncSession | None = None, read_only: bool = True
+    ) -> list[T]:
+        """
+        Get all models, sorted ascending by a field in the database.
+
+        Args:
+            field: Field name to order by
+            session: Optional database session
+            read_only: If True and session is None, use read replica for read operations
+
+        Returns:
+            List of model instances in field order
+        """
+        if field not in self.model_class.model_fields:
+            raise ValueError(f"Field {field} not found in model {self.model_class}")
+
+        stmt = select(self.model_class).order_by(getattr(self.model_class, field))
+
+        async def _execute(sess: AsyncSession):
+            result = await sess.execute(stmt)
+            return list(result.scalars().all())
+
+        result = await self._with_session(_execute, session, read_only=read_only)
+        self.logger.debug("Result: %d records found", len(result))
         return result
 
+    async def iter_all(
+        self,
+        session: AsyncSession | None = None,
+        read_only: bool = True,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncGenerator[T]:
+        """
+        Stream all models from a server-side cursor, batch_size rows at a time.
+
+        Unlike get_all, only one batch is held in memory. The session stays open
+        until iteration finishes, so wrap early exits in contextlib.aclosing and
+        avoid awaiting slow work inside the loop.
+
+        Args:
+            session: Optional database session
+            read_only: If True and session is None, use read replica for read operations
+            batch_size: Rows to fetch per round trip
+
+        Yields:
+            Model instances
+        """
+        self.logger.debug("Streaming all %s", self.model_class.__name__)
+
+        stmt = select(self.model_class).execution_options(yield_per=batch_size)
+
+        if session:
+            async for model in await session.stream_scalars(stmt):
+                yield model
+            return
+        async with self.postgres_manager.get_session(read_only=read_only) as sess:
+            async for model in await sess.stream_scalars(stmt):
+                yield model
+
     async def create(self, model: T, session: AsyncSession | None = None) -> T:
         """
         Create a new model.
@@ -173,13 +321,64 @@ class BaseRepository[T]:
         """
 
         async def _execute(sess: AsyncSession):
+            # Server defaults come back through the INSERT's RETURNING (eager_defaults
+            # "auto"), and sessions keep attributes on commit, so no refresh is needed
             sess.add(model)
             await sess.commit()
-            await sess.refresh(model)
             return model
 
         result = await self._with_session(_execute, session)
-        self.logger.debug(f"Created {self.model_class.__name__} {result.id}")
+        self.logger.debug("Created %s %s", self.model_class.__name__, result.id)
+        return result
+
+    async def create_many(self, models: list[T], session: AsyncSession | None = None) -> list[T]:
+        """
+        Create many models in one transaction.
+
+        Batches of COPY_THRESHOLD or more rows go through PostgreSQL COPY, which
+        skips the ORM: the models are returned as built, without server defaults
+        and not attached to the session. Smaller batches and tables with pgvector
+        columns (no asyncpg COPY codec) use a normal ORM insert.
+
+        Args:
+            models: Model instances to create
+            session: Optional database session
+
+        Returns:
+            The created model instances
+        """
+        if not models:
+            return []
+
+        table = self.model_class.__table__
+        mapper = inspect(self.model_class)
+        columns = list(table.columns)
+        use_copy = len(models) >= COPY_THRESHOLD and _supports_copy(table)
+
+        async def _execute(sess: AsyncSession):
+            if not use_copy:
+                sess.add_all(models)
+                await sess.commit()
+                return models
+
+            keys = [mapper.get_property_by_column(column).key for column in columns]
+            records = [
+                tuple(
+                    _copy_value(getattr(model, key), column.type)
+                    for key, column in zip(keys, columns, strict=True)
+                )
+                for model in models
+            ]
+            connection = await sess.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                table.name, records=records, columns=[column.name for column in columns]
+            )
+            await sess.commit()
+            return models
+
+        result = await self._with_session(_execute, session)
+        self.logger.debug("Created %d %s records", len(result), self.model_class.__name__)
         return result
 
     async def update(self, model: T, session: AsyncSession | None = None) -> T:
@@ -196,23 +395,23 @@ class BaseRepository[T]:
 
         async def _execute(sess: AsyncSession):
             # Update updated_at timestamp
-            from datetime import datetime
-
             model.updated_at = datetime.now(UTC)
 
             sess.add(model)
             await sess.commit()
-            await sess.refresh(model)
             return model
 
         result = await self._with_session(_execute, session)
-        self.logger.debug(f"Updated {self.model_class.__name__} {result.id}")
+        self.logger.debug("Updated %s %s", self.model_class.__name__, result.id)
         return result
 
     async def upsert(self, model: T, session: AsyncSession | None = None) -> T:
         """
         Insert or update a model (upsert).
 
+        Runs a single INSERT ... ON CONFLICT (id) DO UPDATE, so there is no
+        window between looking the row up and writing it.
+
         Args:
             model: Model instance to upsert
             session: Optional database session
@@ -220,16 +419,37 @@ class BaseRepository[T]:
         Returns:
             Upserted model instance
         """
-        if model.id:
-            existing = await self.get_by_id(model.id, session=session)
-            if existing:
-                # Update existing
-                for key, value in model.model_dump(exclude={"id", "created_at"}).items():
-                    setattr(existing, key, value)
-                return await self.update(existing, session=session)
+        table = self.model_class.__table__
+        mapper = inspect(self.model_class)
+        model.updated_at = datetime.now(UTC)
+
+        values = {}
+        for column in table.columns:
+            value = getattr(model, mapper.get_property_by_column(column).key)
+            # As with an ORM insert, unset columns with server defaults are left to the database
+            if value is None and column.server_default is not None:
+                continue
+            values[column] = value
+
+        stmt = pg_insert(self.model_class).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={
+                column.name: stmt.excluded[column.name]
+                for column in values
+                if column.name not in ("id", "created_at")
+            },
+        ).returning(self.model_class)
 
-        # Create new
-        return await self.create(model, session=session)
+        async def _execute(sess: AsyncSession):
+            result = await sess.execute(stmt, execution_options={"populate_existing": True})
+            upserted = result.scalar_one()
+            await sess.commit()
+            return upserted
+
+        result = await self._with_session(_execute, session)
+        self.logger.debug("Upserted %s %s", self.model_class.__name__, result.id)
+        return result
 
     async def delete(self, id: UUID | str, session: AsyncSession | None = None) -> None:
         """
@@ -247,8 +467,61 @@ class BaseRepository[T]:
             if model:
                 await sess.delete(model)
                 await sess.commit()
-                self.logger.debug(f"Deleted {self.model_class.__name__} {id}")
+                self.logger.debug("Deleted %s %s", self.model_class.__name__, id)
             else:
-                self.logger.warning(f"{self.model_class.__name__} {id} not found for deletion")
+                self.logger.warning("%s %s not found for deletion", self.model_class.__name__, id)
 
         await self._with_session(_execute, session)
+
+    async def delete_many(self, ids: list[UUID], session: AsyncSession | None = None) -> int:
+        """
+        Delete many models by ID in one statement and transaction.
+
+        Rows are removed with a bulk DELETE, so ORM-level cascades and delete
+        events do not run; use delete for models that rely on them.
+
+        Args:
+            ids: IDs of the models to delete
+            session: Optional database session
+
+        Returns:
+            Number of rows deleted
+        """
+        if not ids:
+            return 0
+
+        stmt = delete(self.model_class).where(self.model_class.id.in_(ids))
+
+        async def _execute(sess: AsyncSession) -> int:
+            result = await sess.execute(stmt, execution_options={"synchronize_session": False})
+            await sess.commit()
+            return result.rowcount
+
+        deleted = await self._with_session(_execute, session)
+        self.logger.debug("Deleted %d %s records", deleted, self.model_class.__name__)
+        return deleted
+
+    async def delete_all(self, session: AsyncSession | None = None) -> int:
+        """
+        Delete every model of this type in one statement and transaction.
+
+        Like delete_many, this is a bulk DELETE: no rows are loaded and ORM-level
+        cascades and delete events do not run.
+
+        Args:
+            session: Optional database session
+
+        Returns:
+            Number of rows deleted
+        """
+
+        async def _execute(sess: AsyncSession) -> int:
+            result = await sess.execute(
+                delete(self.model_class), execution_options={"synchronize_session": False}
+            )
+            await sess.commit()
+            return result.rowcount
+
+        deleted = await self._with_session(_execute, session)
+        self.logger.debug("Deleted all %d %s records", deleted, self.model_class.__name__)
+        return deleted
@@ -1,5 +1,3 @@
-import logging
-
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -15,7 +13,6 @@ class CalendarEventRepository(BaseRepository[CalendarEvent]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, CalendarEvent)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def get_by_type(
         self, event_type: CalendarEventType, session: AsyncSession | None = None
@@ -69,11 +66,13 @@ class CalendarEventRepository(BaseRepository[CalendarEvent]):
         Returns:
             List of CalendarEvent instances
         """
-        stmt = select(CalendarEvent).where(CalendarEvent.faction_specific == True)  # noqa: E712
+        stmt = select(CalendarEvent).where(
+            CalendarEvent.faction_specific == True,  # noqa: E712
+            CalendarEvent.affected_factions.contains([faction]),
+        )
 
         async def _execute(sess: AsyncSession):
             result = await sess.execute(stmt)
-            events = list(result.scalars().all())
-            return [e for e in events if faction in e.affected_factions]
+            return list(result.scalars().all())
 
-        return await self._with_session(_execute, session)
+        return await self._with_session(_execute, session, read_only=True)
@@ -2,8 +2,6 @@
 Repository for CalendarMonth model.
 """
 
-import logging
-
 from ds_common.models.calendar_month import CalendarMonth
 from ds_common.repository.base_repository import BaseRepository
 from ds_discord_bot.postgres_manager import PostgresManager
@@ -16,7 +14,6 @@ class CalendarMonthRepository(BaseRepository[CalendarMonth]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, CalendarMonth)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def get_by_month_number(self, month_number: int) -> CalendarMonth | None:
         """
@@ -37,5 +34,4 @@ class CalendarMonthRepository(BaseRepository[CalendarMonth]):
         Returns:
             List of CalendarMonth instances
         """
-        all_months = await self.get_all()
-        return sorted(all_months, key=lambda m: m.month_number)
+        return await self.get_all_ordered_by("month_number")
@@ -2,8 +2,6 @@
 Repository for CalendarYearCycle model.
 """
 
-import logging
-
 from ds_common.models.calendar_year_cycle import CalendarYearCycle
 from ds_common.repository.base_repository import BaseRepository
 from ds_discord_bot.postgres_manager import PostgresManager
@@ -16,7 +14,6 @@ class CalendarYearCycleRepository(BaseRepository[CalendarYearCycle]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, CalendarYearCycle)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def get_by_cycle_year(self, cycle_year: int) -> CalendarYearCycle | None:
         """
@@ -37,5 +34,4 @@ class CalendarYearCycleRepository(BaseRepository[CalendarYearCycle]):
         Returns:
             List of CalendarYearCycle instances
         """
-        all_cycles = await self.get_all()
-        return sorted(all_cycles, key=lambda c: c.cycle_year)
+        return await self.get_all_ordered_by("cycle_year")
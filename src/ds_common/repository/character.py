@@ -1,13 +1,16 @@
 import logging
+import os
 from datetime import UTC, datetime
+from uuid import UUID
 
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlmodel import select
 
 from ds_common.combat import (
-    calculate_max_armor,
-    calculate_max_health,
-    calculate_max_stamina,
-    calculate_max_tech_power,
+    calculate_max_resources,
     catch_up_restoration,
 )
 from ds_common.combat.experience_service import (
@@ -23,6 +26,10 @@ from ds_common.models.player import Player
 from ds_common.repository.base_repository import BaseRepository
 from ds_discord_bot.postgres_manager import PostgresManager
 
+# Make relationships a Character query did not ask for raise instead of lazy loading,
+# so tests and CI catch an implicit per-row SELECT; off in production
+STRICT_LOAD = os.getenv("DS_STRICT_LOAD", "").lower() in ("1", "true")
+
 
 class CharacterRepository(BaseRepository[Character]):
     """
@@ -31,7 +38,6 @@ class CharacterRepository(BaseRepository[Character]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, Character)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def update(
         self, model: Character, session: AsyncSession | None = None, silent: bool = False
@@ -48,24 +54,97 @@ class CharacterRepository(BaseRepository[Character]):
             Updated Character instance
         """
         if silent:
-            # Temporarily disable the base repository's logger to suppress debug messages
-            base_logger = logging.getLogger("ds_common.repository.base_repository")
-            original_level = base_logger.level
-            base_logger.setLevel(logging.WARNING)
+            # Temporarily raise this repository's log level to suppress debug messages
+            original_level = self.logger.level
+            self.logger.setLevel(logging.WARNING)
             try:
                 result = await super().update(model, session=session)
             finally:
-                base_logger.setLevel(original_level)
+                self.logger.setLevel(original_level)
             return result
         result = await super().update(model, session=session)
         return result
 
+    @staticmethod
+    def _loader_options(*options: ORMOption) -> tuple[ORMOption, ...]:
+        """
+        Loader options for a Character select.
+
+        The class is always joined in, as the mapper does by default; with
+        DS_STRICT_LOAD set every relationship not named in options raises on access.
+
+        Args:
+            *options: Loader options for the other relationships to populate
+
+        Returns:
+            Options to pass to the select
+        """
+        loaders = (joinedload(Character.character_class), *options)
+        if STRICT_LOAD:
+            return (*loaders, raiseload("*"))
+        return loaders
+
+    async def get_by_id(
+        self, id: UUID | str, session: AsyncSession | None = None, read_only: bool = True
+    ) -> Character | None:
+        """
+        Get a character by ID, applying the repository's loader options.
+
+        Args:
+            id: UUID or string UUID
+            session: Optional database session
+            read_only: If True and session is None, use read replica for read operations
+
+        Returns:
+            Character instance or None if not found
+        """
+        if isinstance(id, str):
+            id = UUID(id)
+
+        self.logger.debug("Getting Character by id: %s", id)
+
+        async def _execute(sess: AsyncSession):
+            return await sess.get(Character, id, options=self._loader_options())
+
+        return await self._with_session(_execute, session, read_only=read_only)
+
+    @classmethod
+    async def _load_with(
+        cls, sess: AsyncSession, character: Character, *options: ORMOption
+    ) -> Character | None:
+        """
+        Reload a character with the given relationships eagerly loaded.
+
+        One SELECT replaces the get-then-refresh pair. populate_existing makes the
+        load overwrite a copy already in the session, as refresh did.
+
+        Args:
+            sess: Database session to load in
+            character: Character to reload
+            *options: Loader options for the relationships to populate besides the class
+
+        Returns:
+            The session's Character instance or None if it no longer exists
+        """
+        stmt = (
+            select(Character)
+            .where(Character.id == character.id)
+            .options(*cls._loader_options(*options))
+            .execution_options(populate_existing=True)
+        )
+        result = await sess.execute(stmt)
+        return result.unique().scalar_one_or_none()
+
     async def get_character_class(
         self, character: Character, session: AsyncSession | None = None
     ) -> CharacterClass | None:
         """
         Get the character class for a character.
 
+        Characters loaded from the database arrive with their class joined in, so
+        that copy is returned without a query while it still matches
+        character_class_id.
+
         Args:
             character: Character instance
             session: Optional database session
@@ -73,16 +152,15 @@ class CharacterRepository(BaseRepository[Character]):
         Returns:
             CharacterClass instance or None
         """
+        if "character_class" not in inspect(character).unloaded:
+            loaded_class = character.character_class
+            loaded_id = loaded_class.id if loaded_class else None
+            if loaded_id == character.character_class_id:
+                return loaded_class
 
         async def _execute(sess: AsyncSession):
-            if session:
-                await sess.refresh(character, ["character_class"])
-                return character.character_class
-            fresh_character = await sess.get(Character, character.id)
-            if not fresh_character:
-                return None
-            await sess.refresh(fresh_character, ["character_class"])
-            return fresh_character.character_class
+            fresh_character = await self._load_with(sess, character)
+            return fresh_character.character_class if fresh_character else None
 
         return await self._with_session(_execute, session, read_only=True)
 
@@ -113,7 +191,7 @@ class CharacterRepository(BaseRepository[Character]):
             await sess.commit()
 
         await self._with_session(_execute, session, read_only=False)
-        self.logger.debug(f"Character class set: {character_class}")
+        self.logger.debug("Character class set: %s", character_class)
 
     async def get_player(
         self, character: Character, session: AsyncSession | None = None
@@ -132,14 +210,9 @@ class CharacterRepository(BaseRepository[Character]):
         """
 
         async def _execute(sess: AsyncSession):
-            if session:
-                await sess.refresh(character, ["players"])
-                players = character.players or []
-                return players[0] if players else None
-            fresh_character = await sess.get(Character, character.id)
+            fresh_character = await self._load_with(sess, character, joinedload(Character.players))
             if not fresh_character:
                 return None
-            await sess.refresh(fresh_character, ["players"])
             players = fresh_character.players or []
             return players[0] if players else None
 
@@ -160,19 +233,52 @@ class CharacterRepository(BaseRepository[Character]):
         """
 
         async def _execute(sess: AsyncSession):
-            if session:
-                await sess.refresh(character, ["game_sessions"])
-                game_sessions = character.game_sessions or []
-            else:
-                fresh_character = await sess.get(Character, character.id)
-                if not fresh_character:
-                    return None
-                await sess.refresh(fresh_character, ["game_sessions"])
-                game_sessions = fresh_character.game_sessions or []
+            fresh_character = await self._load_with(
+                sess, character, joinedload(Character.game_sessions)
+            )
+            if not fresh_character:
+                return None
+            game_sessions = fresh_character.game_sessions or []
             return game_sessions[0] if game_sessions else None
 
         return await self._with_session(_execute, session, read_only=True)
 
+    async def get_related(
+        self, character: Character, session: AsyncSession | None = None
+    ) -> tuple[CharacterClass | None, Player | None, GameSession | None]:
+        """
+        Get the character class, owning player and game session in one query.
+
+        Use this instead of calling get_character_class, get_player and
+        get_game_session back to back, which costs a round trip each.
+
+        Args:
+            character: Character instance
+            session: Optional database session
+
+        Returns:
+            Tuple of (character class, player, game session), each None if unset
+        """
+
+        async def _execute(sess: AsyncSession):
+            fresh_character = await self._load_with(
+                sess,
+                character,
+                joinedload(Character.players),
+                joinedload(Character.game_sessions),
+            )
+            if not fresh_character:
+                return None, None, None
+            players = fresh_character.players or []
+            game_sessions = fresh_character.game_sessions or []
+            return (
+                fresh_character.character_class,
+                players[0] if players else None,
+                game_sessions[0] if game_sessions else None,
+            )
+
+        return await self._with_session(_execute, session, read_only=True)
+
     async def initialize_combat_resources(
         self, character: Character, session: AsyncSession | None = None
     ) -> Character:
@@ -187,32 +293,23 @@ class CharacterRepository(BaseRepository[Character]):
         Returns:
             Updated Character instance
         """
-        from ds_common.equipment.effect_calculator import (
-            _get_equipped_item_templates,
-            calculate_resource_bonuses,
-        )
+        from ds_common.equipment.effect_calculator import sum_equipped_bonuses
+        from ds_common.models.item_template_modifier import ItemModifierKind
 
         character_class = await self.get_character_class(character, session=session)
 
-        # Get equipped item templates
-        equipped_templates = await _get_equipped_item_templates(character, self.postgres_manager)
-
-        # Calculate equipment resource bonuses
-        equipment_resource_bonuses = calculate_resource_bonuses(character, equipped_templates)
+        # Sum equipment resource bonuses in the database
+        equipment_resource_bonuses = await sum_equipped_bonuses(
+            character, ItemModifierKind.RESOURCE, self.postgres_manager
+        )
 
         # Calculate max resources with equipment bonuses
-        character.max_health = calculate_max_health(
-            character, character_class, equipment_resource_bonuses
-        )
-        character.max_stamina = calculate_max_stamina(
-            character, character_class, equipment_resource_bonuses
-        )
-        character.max_tech_power = calculate_max_tech_power(
-            character, character_class, equipment_resource_bonuses
-        )
-        character.max_armor = calculate_max_armor(
-            character, character_class, equipment_resource_bonuses
-        )
+        (
+            character.max_health,
+            character.max_stamina,
+            character.max_tech_power,
+            character.max_armor,
+        ) = calculate_max_resources(character, character_class, equipment_resource_bonuses)
 
         # Set current resources to max if not already set
         if character.current_health == 0.0:
@@ -489,32 +586,23 @@ class CharacterRepository(BaseRepository[Character]):
         Returns:
             Updated Character instance with recalculated resources
         """
-        from ds_common.equipment.effect_calculator import (
-            _get_equipped_item_templates,
-            calculate_resource_bonuses,
-        )
+        from ds_common.equipment.effect_calculator import sum_equipped_bonuses
+        from ds_common.models.item_template_modifier import ItemModifierKind
 
         character_class = await self.get_character_class(character, session=session)
 
-        # Get equipped item templates
-        equipped_templates = await _get_equipped_item_templates(character, self.postgres_manager)
-
-        # Calculate equipment resource bonuses
-        equipment_resource_bonuses = calculate_resource_bonuses(character, equipped_templates)
+        # Sum equipment resource bonuses in the database
+        equipment_resource_bonuses = await sum_equipped_bonuses(
+            character, ItemModifierKind.RESOURCE, self.postgres_manager
+        )
 
         # Recalculate max resources with equipment bonuses
-        character.max_health = calculate_max_health(
-            character, character_class, equipment_resource_bonuses
-        )
-        character.max_stamina = calculate_max_stamina(
-            character, character_class, equipment_resource_bonuses
-        )
-        character.max_tech_power = calculate_max_tech_power(
-            character, character_class, equipment_resource_bonuses
-        )
-        character.max_armor = calculate_max_armor(
-            character, character_class, equipment_resource_bonuses
-        )
+        (
+            character.max_health,
+            character.max_stamina,
+            character.max_tech_power,
+            character.max_armor,
+        ) = calculate_max_resources(character, character_class, equipment_resource_bonuses)
 
         # Cap current resources at new max values
         character.current_health = min(character.current_health, character.max_health)
@@ -1,5 +1,3 @@
-import logging
-
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ds_common.models.character_class import CharacterClass
@@ -15,7 +13,6 @@ class CharacterClassRepository(BaseRepository[CharacterClass]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, CharacterClass)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def get_stats(
         self, character_class: CharacterClass, session: AsyncSession | None = None
@@ -2,7 +2,6 @@
 Repository for Encounter model.
 """
 
-import logging
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,7 +20,6 @@ class EncounterRepository(BaseRepository[Encounter]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, Encounter)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def get_active_encounter(
         self, game_session: GameSession, session: AsyncSession | None = None
@@ -30,7 +30,7 @@ class EpisodeMemoryRepository(BaseRepository[EpisodeMemory]):
         Returns:
             List of episode memories
         """
-        self.logger.debug(f"Getting episodes for characters {character_ids}")
+        self.logger.debug("Getting episodes for characters %s", character_ids)
 
         async def _execute(sess: AsyncSession):
             # Use array overlap operator to find episodes with any of these characters
@@ -62,7 +62,7 @@ class EpisodeMemoryRepository(BaseRepository[EpisodeMemory]):
         Returns:
             List of episode memories
         """
-        self.logger.debug(f"Getting episodes for locations {location_ids}")
+        self.logger.debug("Getting episodes for locations %s", location_ids)
 
         async def _execute(sess: AsyncSession):
             stmt = (
@@ -1,5 +1,3 @@
-import logging
-
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -15,7 +13,6 @@ class GameHistoryEmbeddingRepository(BaseRepository[GameHistoryEmbedding]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, GameHistoryEmbedding)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def store_history(
         self,
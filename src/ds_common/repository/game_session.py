@@ -1,7 +1,7 @@
-import logging
 from datetime import UTC, datetime
 
 import discord
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -23,7 +23,6 @@ class GameSessionRepository(BaseRepository[GameSession]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, GameSession)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def from_channel(
         self, channel: discord.TextChannel | discord.VoiceChannel
@@ -46,13 +45,23 @@ class GameSessionRepository(BaseRepository[GameSession]):
         """
         Update the last active timestamp for a game session.
 
+        Issues a single UPDATE by session name; a channel without a session is a no-op.
+
         Args:
             channel: Discord channel
         """
-        game_session = await self.from_channel(channel)
-        if game_session:
-            game_session.updated_at = datetime.now(UTC)
-            await self.update(game_session)
+        channel_name = clean_channel_name(channel.name)
+
+        async def _execute(sess: AsyncSession):
+            stmt = (
+                update(GameSession)
+                .where(GameSession.name == channel_name)
+                .values(updated_at=datetime.now(UTC))
+            )
+            await sess.execute(stmt)
+            await sess.commit()
+
+        await self._with_session(_execute)
 
     async def add_player(
         self, player: Player, game_session: GameSession, session: AsyncSession | None = None
@@ -82,7 +91,7 @@ class GameSessionRepository(BaseRepository[GameSession]):
             await sess.commit()
 
         await self._with_session(_execute, session)
-        self.logger.debug(f"Player {player.id} added to game session {game_session.id}")
+        self.logger.debug("Player %s added to game session %s", player.id, game_session.id)
 
     async def remove_player(
         self, player: Player, game_session: GameSession, session: AsyncSession | None = None
@@ -113,7 +122,7 @@ class GameSessionRepository(BaseRepository[GameSession]):
         players = await self.players(game_session)
         if not players:
             await self.delete(game_session.id)
-            self.logger.debug(f"Deleted empty game session {game_session.id}")
+            self.logger.debug("Deleted empty game session %s", game_session.id)
 
     async def add_character(
         self, character: Character, game_session: GameSession, session: AsyncSession | None = None
@@ -145,7 +154,7 @@ class GameSessionRepository(BaseRepository[GameSession]):
             await sess.commit()
 
         await self._with_session(_execute, session)
-        self.logger.debug(f"Character {character.id} added to game session {game_session.id}")
+        self.logger.debug("Character %s added to game session %s", character.id, game_session.id)
 
     async def remove_character(
         self, character: Character, game_session: GameSession, session: AsyncSession | None = None
@@ -1,7 +1,4 @@
-import logging
-from uuid import UUID
-
-from ds_common.models.game_settings import GameSettings
+from ds_common.models.game_settings import DEFAULT_GAME_SETTINGS_ID, GameSettings
 from ds_common.repository.base_repository import BaseRepository
 from ds_discord_bot.postgres_manager import PostgresManager
 
@@ -13,7 +10,6 @@ class GameSettingsRepository(BaseRepository[GameSettings]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, GameSettings)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def get_settings(self) -> GameSettings:
         """
@@ -24,9 +20,7 @@ class GameSettingsRepository(BaseRepository[GameSettings]):
         Returns:
             GameSettings instance
         """
-        # Using a fixed UUID for the default settings
-        default_id = UUID("00000000-0000-0000-0000-000000000001")
-        existing = await self.get_by_id(default_id)
+        existing = await self.get_by_id(DEFAULT_GAME_SETTINGS_ID)
         if existing:
             return existing
 
@@ -41,12 +35,10 @@ class GameSettingsRepository(BaseRepository[GameSettings]):
             GameSettings instance
         """
         # Try to get existing default settings
-        # Using a fixed UUID for the default settings
-        default_id = UUID("00000000-0000-0000-0000-000000000001")
-        existing = await self.get_by_id(default_id)
+        existing = await self.get_by_id(DEFAULT_GAME_SETTINGS_ID)
         if existing:
             return existing
 
         # Create new default settings
-        game_settings = GameSettings(id=default_id)
+        game_settings = GameSettings(id=DEFAULT_GAME_SETTINGS_ID)
         return await self.create(game_settings)
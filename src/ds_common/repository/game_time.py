@@ -1,30 +1,49 @@
-import logging
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
 
 from ds_common.models.game_time import GameTime
-from ds_common.repository.base_repository import BaseRepository
+from ds_common.repository.singleton_repository import SingletonRepository
 from ds_discord_bot.postgres_manager import PostgresManager
 
 
-class GameTimeRepository(BaseRepository[GameTime]):
+class GameTimeRepository(SingletonRepository[GameTime]):
     """
     Repository for GameTime model (singleton pattern).
+
+    The row is cached process-wide (see SingletonRepository); the bot is the only
+    writer.
     """
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, GameTime)
-        self.logger: logging.Logger = logging.getLogger(__name__)
+
+    def _detached_copy(self, model: GameTime) -> GameTime:
+        """Copy the row, sharing its parsed config so it is not rebuilt on every read."""
+        detached = super()._detached_copy(model)
+        # GameTimeConfig is frozen, and parsed_config is already documented as stale
+        # once game_time_config is replaced on a live instance
+        detached.__dict__["parsed_config"] = model.parsed_config
+        return detached
 
     async def get_game_time(self) -> GameTime | None:
         """
         Get the current game time record (singleton).
 
         Returns:
-            GameTime instance or None if not initialized
+            GameTime instance, detached and owned by the caller, or None if not initialized
         """
-        all_times = await self.get_all()
-        if all_times:
-            return all_times[0]
-        return None
+        cached = self._get_cached()
+        if cached is not None:
+            return cached
+
+        async def _execute(sess: AsyncSession):
+            result = await sess.execute(select(GameTime).limit(1))
+            return result.scalar_one_or_none()
+
+        game_time = await self._with_session(_execute, read_only=True)
+        if game_time is not None:
+            self._cache(game_time, session=None)
+        return game_time
 
     async def initialize_game_time(self) -> GameTime:
         """
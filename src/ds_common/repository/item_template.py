@@ -1,4 +1,12 @@
+from collections import Counter
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ds_common.models.item_category import ItemCategory
 from ds_common.models.item_template import ItemTemplate
+from ds_common.models.item_template_modifier import ItemModifierKind, ItemTemplateModifier
 from ds_common.repository.base_repository import BaseRepository
 from ds_discord_bot.postgres_manager import PostgresManager
 
@@ -10,3 +18,81 @@ class ItemTemplateRepository(BaseRepository[ItemTemplate]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, ItemTemplate)
+
+    async def get_names_by_category(
+        self,
+        category_names: list[str],
+        rarities: list[str],
+        session: AsyncSession | None = None,
+    ) -> list[str]:
+        """
+        Get names of item templates in the given categories and rarities.
+
+        Args:
+            category_names: Item category names to include
+            rarities: Rarities to include (e.g., ['common', 'uncommon'])
+            session: Optional database session
+
+        Returns:
+            List of item template names
+        """
+
+        async def _execute(sess: AsyncSession) -> list[str]:
+            stmt = (
+                select(ItemTemplate.name)
+                .join(ItemCategory, ItemCategory.id == ItemTemplate.category_id)
+                .where(ItemCategory.name.in_(category_names), ItemTemplate.rarity.in_(rarities))
+            )
+            result = await sess.execute(stmt)
+            return list(result.scalars().all())
+
+        return await self._with_session(_execute, session, read_only=True)
+
+    async def sum_modifier_bonuses(
+        self,
+        item_template_ids: list[UUID],
+        kind: ItemModifierKind,
+        session: AsyncSession | None = None,
+    ) -> dict[str, float]:
+        """
+        Sum modifier bonuses of one kind across item templates.
+
+        Bonuses are summed per template in SQL; a template listed more than once
+        (e.g. two of the same ring equipped) counts once per occurrence.
+
+        Args:
+            item_template_ids: Item template IDs to aggregate, one per equipped item
+            kind: Modifier kind to sum (e.g., ItemModifierKind.RESOURCE)
+            session: Optional database session
+
+        Returns:
+            Dictionary mapping target to total bonus (e.g., {'max_health': 30.0})
+        """
+        if not item_template_ids:
+            return {}
+
+        counts = Counter(item_template_ids)
+
+        async def _execute(sess: AsyncSession):
+            stmt = (
+                select(
+                    ItemTemplateModifier.item_template_id,
+                    ItemTemplateModifier.target,
+                    func.sum(ItemTemplateModifier.bonus),
+                )
+                .where(
+                    ItemTemplateModifier.item_template_id.in_(counts),
+                    ItemTemplateModifier.kind == kind,
+                    ItemTemplateModifier.bonus != 0,
+                )
+                .group_by(ItemTemplateModifier.item_template_id, ItemTemplateModifier.target)
+            )
+            result = await sess.execute(stmt)
+            return result.all()
+
+        bonuses: dict[str, float] = {}
+        for item_template_id, target, total in await self._with_session(
+            _execute, session, read_only=True
+        ):
+            bonuses[target] = bonuses.get(target, 0.0) + float(total) * counts[item_template_id]
+        return bonuses
@@ -2,7 +2,6 @@
 Repository for LocationEdge model.
 """
 
-import logging
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,7 +19,6 @@ class LocationEdgeRepository(BaseRepository[LocationEdge]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, LocationEdge)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def get_outgoing_edges(
         self, from_location_id: UUID, session: AsyncSession | None = None
@@ -2,8 +2,6 @@
 Repository for LocationFact model.
 """
 
-import logging
-
 from ds_common.models.location_fact import LocationFact
 from ds_common.repository.base_repository import BaseRepository
 from ds_discord_bot.postgres_manager import PostgresManager
@@ -16,7 +14,6 @@ class LocationFactRepository(BaseRepository[LocationFact]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, LocationFact)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def get_by_location_name(
         self, location_name: str, case_sensitive: bool = False
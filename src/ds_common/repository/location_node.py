@@ -2,7 +2,6 @@
 Repository for LocationNode model.
 """
 
-import logging
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,7 +19,6 @@ class LocationNodeRepository(BaseRepository[LocationNode]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, LocationNode)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def get_by_location_name(
         self, location_name: str, case_sensitive: bool = False, session: AsyncSession | None = None
@@ -2,12 +2,16 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ds_common.models.memory_settings import MemorySettings
-from ds_common.repository.base_repository import BaseRepository
+from ds_common.repository.singleton_repository import SingletonRepository
 from ds_discord_bot.postgres_manager import PostgresManager
 
 
-class MemorySettingsRepository(BaseRepository[MemorySettings]):
-    """Repository for memory settings operations (singleton pattern)."""
+class MemorySettingsRepository(SingletonRepository[MemorySettings]):
+    """
+    Repository for memory settings operations (singleton pattern).
+
+    The row is cached process-wide (see SingletonRepository).
+    """
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, MemorySettings)
@@ -25,8 +29,12 @@ class MemorySettingsRepository(BaseRepository[MemorySettings]):
             session: Optional database session
 
         Returns:
-            Memory settings instance
+            Memory settings instance, detached and owned by the caller
         """
+        cached = self._get_cached()
+        if cached is not None:
+            return cached
+
         self.logger.debug("Getting memory settings")
 
         async def _execute(sess: AsyncSession):
@@ -44,7 +52,11 @@ class MemorySettingsRepository(BaseRepository[MemorySettings]):
 
             return settings
 
-        return await self._with_session(_execute, session)
+        settings = await self._with_session(_execute, session)
+        # A caller's session may still roll back, so only cache reads from our own
+        if session is None:
+            self._cache(settings, session)
+        return settings
 
     async def update_settings(
         self,
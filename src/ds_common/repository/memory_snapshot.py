@@ -3,8 +3,9 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
-from ds_common.models.memory_snapshot import MemorySnapshot
+from ds_common.models.memory_snapshot import MemorySnapshot, MemorySnapshotSummary
 from ds_common.repository.base_repository import BaseRepository
 from ds_discord_bot.postgres_manager import PostgresManager
 
@@ -32,6 +33,30 @@ class MemorySnapshotRepository(BaseRepository[MemorySnapshot]):
         """
         return await self.create(snapshot, session)
 
+    async def get_with_data(
+        self,
+        snapshot_id: UUID,
+        session: AsyncSession | None = None,
+    ) -> MemorySnapshot | None:
+        """
+        Get a snapshot by ID including its (deferred) snapshot_data payload.
+
+        Args:
+            snapshot_id: Snapshot ID
+            session: Optional database session
+
+        Returns:
+            Snapshot with snapshot_data loaded, or None if not found
+        """
+        self.logger.debug("Getting snapshot %s with data", snapshot_id)
+
+        async def _execute(sess: AsyncSession):
+            return await sess.get(
+                MemorySnapshot, snapshot_id, options=[undefer(MemorySnapshot.snapshot_data)]
+            )
+
+        return await self._with_session(_execute, session, read_only=True)
+
     async def get_snapshots_for_world_memory(
         self,
         world_memory_id: UUID,
@@ -49,7 +74,7 @@ class MemorySnapshotRepository(BaseRepository[MemorySnapshot]):
         Returns:
             List of snapshots
         """
-        self.logger.debug(f"Getting snapshots for world memory {world_memory_id}")
+        self.logger.debug("Getting snapshots for world memory %s", world_memory_id)
 
         async def _execute(sess: AsyncSession):
             stmt = select(MemorySnapshot).where(MemorySnapshot.world_memory_id == world_memory_id)
@@ -98,6 +123,51 @@ class MemorySnapshotRepository(BaseRepository[MemorySnapshot]):
 
         return await self._with_session(_execute, session)
 
+    async def get_snapshot_summaries(
+        self,
+        unwound: bool | None = None,
+        world_memory_id: UUID | None = None,
+        limit: int | None = None,
+        session: AsyncSession | None = None,
+    ) -> list[MemorySnapshotSummary]:
+        """
+        Get lightweight snapshot summaries, newest first, without loading model instances.
+
+        Args:
+            unwound: Filter by unwound status (None = all)
+            world_memory_id: Optional world memory ID to filter by
+            limit: Maximum number of results
+            session: Optional database session
+
+        Returns:
+            List of snapshot summaries
+        """
+        self.logger.debug("Getting snapshot summaries")
+
+        async def _execute(sess: AsyncSession):
+            stmt = select(
+                MemorySnapshot.id,
+                MemorySnapshot.snapshot_type,
+                MemorySnapshot.created_reason,
+                MemorySnapshot.world_memory_id,
+                MemorySnapshot.created_at,
+                MemorySnapshot.unwound_at,
+            )
+            if world_memory_id is not None:
+                stmt = stmt.where(MemorySnapshot.world_memory_id == world_memory_id)
+            if unwound is not None:
+                if unwound:
+                    stmt = stmt.where(MemorySnapshot.unwound_at.isnot(None))
+                else:
+                    stmt = stmt.where(MemorySnapshot.unwound_at.is_(None))
+            stmt = stmt.order_by(MemorySnapshot.created_at.desc())
+            if limit:
+                stmt = stmt.limit(limit)
+            result = await sess.execute(stmt)
+            return [MemorySnapshotSummary(*row) for row in result.all()]
+
+        return await self._with_session(_execute, session, read_only=True)
+
     async def get_unwound_snapshots(
         self,
         session: AsyncSession | None = None,
@@ -130,7 +200,7 @@ class MemorySnapshotRepository(BaseRepository[MemorySnapshot]):
         Returns:
             Updated snapshot
         """
-        self.logger.debug(f"Marking snapshot {snapshot_id} as unwound")
+        self.logger.debug("Marking snapshot %s as unwound", snapshot_id)
 
         async def _execute(sess: AsyncSession):
             snapshot = await sess.get(MemorySnapshot, snapshot_id)
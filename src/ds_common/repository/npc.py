@@ -2,7 +2,7 @@
 Repository for NPC model.
 """
 
-import logging
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ds_common.metrics.service import get_metrics_service
 from ds_common.models.npc import NPC
@@ -17,7 +17,6 @@ class NPCRepository(BaseRepository[NPC]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, NPC)
-        self.logger: logging.Logger = logging.getLogger(__name__)
         self.metrics = get_metrics_service()
 
     async def create(self, model: NPC, session=None):
@@ -34,3 +33,14 @@ class NPCRepository(BaseRepository[NPC]):
         self.metrics.record_world_state_change("npc", "created")
         
         return created_npc
+
+    async def create_many(
+        self, models: list[NPC], session: AsyncSession | None = None
+    ) -> list[NPC]:
+        """Create NPCs in bulk and log/metric the world state change."""
+        created_npcs = await super().create_many(models, session)
+
+        self.logger.info(f"World state change: {len(created_npcs)} NPCs created")
+        self.metrics.record_world_state_change("npc", "created", count=len(created_npcs))
+
+        return created_npcs
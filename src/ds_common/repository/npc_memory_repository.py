@@ -1,10 +1,17 @@
-import logging
-
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import cast
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from ds_common.models.npc_memory import NPCMemory
 from ds_common.repository.base_repository import BaseRepository
+from ds_common.repository.vector_search import (
+    BQ_SHORTLIST_SIZE,
+    HNSW_EF_SEARCH,
+    SET_EF_SEARCH,
+    SET_ITERATIVE_SCAN,
+    binary_quantize,
+)
 from ds_discord_bot.postgres_manager import PostgresManager
 
 
@@ -15,7 +22,6 @@ class NPCMemoryRepository(BaseRepository[NPCMemory]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, NPCMemory)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def store_memory(
         self,
@@ -31,7 +37,7 @@ class NPCMemoryRepository(BaseRepository[NPCMemory]):
         Args:
             npc_id: NPC UUID
             memory_text: The memory text content
-            embedding: Vector embedding (1536 dimensions)
+            embedding: Vector embedding (768 dimensions, stored as halfvec)
             metadata: Optional metadata dictionary
             session: Optional database session
 
@@ -51,15 +57,22 @@ class NPCMemoryRepository(BaseRepository[NPCMemory]):
         query_embedding: list[float],
         npc_id: str | None = None,
         limit: int = 10,
+        shortlist_size: int | None = BQ_SHORTLIST_SIZE,
         session: AsyncSession | None = None,
     ) -> list[tuple[NPCMemory, float]]:
         """
         Search for similar memories using vector similarity.
 
+        By default this is two-stage: a Hamming-distance shortlist from the
+        binary-quantized index, re-ranked by exact cosine distance. Filtering by
+        NPC turns on iterative index scans, so an NPC whose memories are far from
+        the global nearest neighbours still gets results.
+
         Args:
-            query_embedding: Query vector embedding (1536 dimensions)
+            query_embedding: Query vector embedding (768 dimensions)
             npc_id: Optional NPC ID to filter by
             limit: Maximum number of results
+            shortlist_size: Candidates to re-rank, or None to search the halfvec index directly
             session: Optional database session
 
         Returns:
@@ -67,24 +80,33 @@ class NPCMemoryRepository(BaseRepository[NPCMemory]):
         """
 
         async def _execute(sess: AsyncSession):
-            # Use pgvector cosine distance operator (<->)
+            # Use pgvector cosine distance operator (<=>)
             # Lower distance = more similar
-            # Note: This requires pgvector extension and proper column type
-            from pgvector.sqlalchemy import Vector
-            from sqlalchemy import cast
-
-            # Cast query embedding to Vector type for comparison
-            query_vec = cast(query_embedding, Vector(768))
-
-            stmt = select(
-                NPCMemory,
-                (NPCMemory.embedding.op("<->")(query_vec)).label("distance"),
-            )
-
+            distance = NPCMemory.embedding.cosine_distance(query_embedding).label("distance")
+            stmt = select(NPCMemory, distance)
+
+            if shortlist_size is None:
+                ef_search = HNSW_EF_SEARCH
+                if npc_id:
+                    stmt = stmt.where(NPCMemory.npc_id == npc_id)
+            else:
+                # HNSW returns at most ef_search rows, so it must cover the shortlist
+                ef_search = max(HNSW_EF_SEARCH, shortlist_size)
+                query_bits = binary_quantize(cast(query_embedding, HALFVEC(768)))
+                shortlist = select(NPCMemory.id).order_by(
+                    binary_quantize(NPCMemory.embedding).op("<~>")(query_bits)
+                )
+                if npc_id:
+                    shortlist = shortlist.where(NPCMemory.npc_id == npc_id)
+                shortlist = shortlist.limit(shortlist_size).cte("shortlist")
+                stmt = stmt.join(shortlist, shortlist.c.id == NPCMemory.id)
+
+            await sess.execute(SET_EF_SEARCH, {"value": str(ef_search)})
             if npc_id:
-                stmt = stmt.where(NPCMemory.npc_id == npc_id)
-
-            stmt = stmt.order_by("distance").limit(limit)
+                # The shortlist is re-ranked by exact distance, so its order can be relaxed
+                scan_order = "strict_order" if shortlist_size is None else "relaxed_order"
+                await sess.execute(SET_ITERATIVE_SCAN, {"value": scan_order})
+            stmt = stmt.order_by(distance).limit(limit)
 
             result = await sess.execute(stmt)
             return [(row[0], row[1]) for row in result.all()]
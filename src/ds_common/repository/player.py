@@ -1,5 +1,6 @@
-import logging
+from datetime import UTC, datetime
 
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -18,7 +19,6 @@ class PlayerRepository(BaseRepository[Player]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, Player)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def get_by_discord_id(
         self, discord_id: int, session: AsyncSession | None = None
@@ -35,6 +35,37 @@ class PlayerRepository(BaseRepository[Player]):
         """
         return await self.get_by_field("discord_id", discord_id, session=session, read_only=True)
 
+    async def set_activity(
+        self, player: Player, is_active: bool, session: AsyncSession | None = None
+    ) -> Player:
+        """
+        Set a player's active flag and bump last_active_at with one targeted UPDATE.
+
+        Args:
+            player: Player instance (updated in place)
+            is_active: New active status
+            session: Optional database session
+
+        Returns:
+            The updated player instance
+        """
+        now = datetime.now(UTC)
+
+        async def _execute(sess: AsyncSession):
+            stmt = (
+                update(Player)
+                .where(Player.id == player.id)
+                .values(is_active=is_active, last_active_at=now, updated_at=now)
+            )
+            await sess.execute(stmt)
+            await sess.commit()
+
+        await self._with_session(_execute, session)
+        player.is_active = is_active
+        player.last_active_at = now
+        player.updated_at = now
+        return player
+
     async def get_characters(
         self, player: Player, session: AsyncSession | None = None
     ) -> list[Character]:
@@ -89,7 +120,7 @@ class PlayerRepository(BaseRepository[Player]):
             await sess.commit()
 
         await self._with_session(_execute, session)
-        self.logger.debug(f"Character added: {character} to player: {player}")
+        self.logger.debug("Character added: %s to player: %s", character, player)
 
     async def remove_character(
         self, player: Player, character: Character, session: AsyncSession | None = None
@@ -115,7 +146,7 @@ class PlayerRepository(BaseRepository[Player]):
                 await sess.commit()
 
         await self._with_session(_execute, session)
-        self.logger.debug(f"Deleted character: {character} from player: {player}")
+        self.logger.debug("Deleted character: %s from player: %s", character, player)
 
     async def get_active_character(
         self, player: Player, session: AsyncSession | None = None
@@ -169,7 +200,7 @@ class PlayerRepository(BaseRepository[Player]):
             await sess.commit()
 
         await self._with_session(_execute, session)
-        self.logger.debug(f"Active character set: {character} for player: {player}")
+        self.logger.debug("Active character set: %s for player: %s", character, player)
 
     async def get_game_session(
         self, player: Player, session: AsyncSession | None = None
@@ -1,12 +1,12 @@
-import logging
 from uuid import UUID
 
+from sqlalchemy import delete, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from ds_common.metrics.service import get_metrics_service
 from ds_common.models.character import Character
-from ds_common.models.junction_tables import CharacterQuest
+from ds_common.models.junction_tables import CharacterQuest, CharacterQuestItem
 from ds_common.models.quest import Quest
 from ds_common.repository.base_repository import BaseRepository
 from ds_discord_bot.postgres_manager import PostgresManager
@@ -19,7 +19,6 @@ class QuestRepository(BaseRepository[Quest]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, Quest)
-        self.logger: logging.Logger = logging.getLogger(__name__)
         self.metrics = get_metrics_service()
 
     async def create(self, model: Quest, session=None):
@@ -91,19 +90,32 @@ class QuestRepository(BaseRepository[Quest]):
             if result.scalar_one_or_none():
                 return  # Already exists
 
-            # Create junction table entry with items_given and session_id
+            # Create junction table entry with session_id, then the items given
             junction = CharacterQuest(
                 character_id=character.id,
                 quest_id=quest.id,
-                items_given=items_given or [],
                 session_id=session_id,
             )
             sess.add(junction)
+            await sess.flush()
+            sess.add_all(
+                CharacterQuestItem(
+                    character_id=character.id,
+                    quest_id=quest.id,
+                    instance_id=item["instance_id"],
+                    name=item["name"],
+                    quantity=item.get("quantity", 1),
+                )
+                for item in items_given or []
+            )
             await sess.commit()
 
         await self._with_session(_execute, session)
         self.logger.debug(
-            f"Character quest added: {quest} with {len(items_given or [])} items in session {session_id}"
+            "Character quest added: %s with %d items in session %s",
+            quest,
+            len(items_given or []),
+            session_id,
         )
 
     async def get_quests_by_session(
@@ -127,6 +139,60 @@ class QuestRepository(BaseRepository[Quest]):
 
         return await self._with_session(_execute, session, read_only=True)
 
+    async def take_session_quest_items(
+        self, session_id: UUID, session: AsyncSession | None = None
+    ) -> dict[UUID, list[dict]]:
+        """
+        Delete and return the items given with quests accepted in a session.
+
+        The CharacterQuest relationships themselves are left in place.
+
+        Args:
+            session_id: Game session ID
+            session: Optional database session
+
+        Returns:
+            Dictionary mapping character IDs to the item dictionaries given to them.
+            Format: {character_id: [{'name': 'Item Name', 'quantity': 1, 'instance_id': '...'}]}
+        """
+
+        async def _execute(sess: AsyncSession):
+            session_quests = select(CharacterQuest.character_id, CharacterQuest.quest_id).where(
+                CharacterQuest.session_id == session_id
+            )
+            stmt = (
+                delete(CharacterQuestItem)
+                .where(
+                    tuple_(CharacterQuestItem.character_id, CharacterQuestItem.quest_id).in_(
+                        session_quests
+                    )
+                )
+                .returning(
+                    CharacterQuestItem.character_id,
+                    CharacterQuestItem.name,
+                    CharacterQuestItem.quantity,
+                    CharacterQuestItem.instance_id,
+                )
+            )
+            result = await sess.execute(stmt)
+            rows = result.all()
+            await sess.commit()
+            return rows
+
+        items_by_character: dict[UUID, list[dict]] = {}
+        for character_id, name, quantity, instance_id in await self._with_session(
+            _execute, session
+        ):
+            items_by_character.setdefault(character_id, []).append(
+                {"name": name, "quantity": quantity, "instance_id": instance_id}
+            )
+        self.logger.debug(
+            "Took quest items for %d characters in session %s",
+            len(items_by_character),
+            session_id,
+        )
+        return items_by_character
+
     async def get_character_quest_items(
         self, character: Character, quest: Quest, session: AsyncSession | None = None
     ) -> list[dict]:
@@ -143,15 +209,15 @@ class QuestRepository(BaseRepository[Quest]):
         """
 
         async def _execute(sess: AsyncSession):
-            stmt = select(CharacterQuest).where(
-                CharacterQuest.character_id == character.id,
-                CharacterQuest.quest_id == quest.id,
+            stmt = select(CharacterQuestItem).where(
+                CharacterQuestItem.character_id == character.id,
+                CharacterQuestItem.quest_id == quest.id,
             )
             result = await sess.execute(stmt)
-            junction = result.scalar_one_or_none()
-            if junction:
-                return junction.items_given or []
-            return []
+            return [
+                {"name": item.name, "quantity": item.quantity, "instance_id": item.instance_id}
+                for item in result.scalars().all()
+            ]
 
         return await self._with_session(_execute, session, read_only=True)
 
@@ -171,22 +237,37 @@ class QuestRepository(BaseRepository[Quest]):
         """
 
         async def _execute(sess: AsyncSession):
-            # Find and remove the junction table entry
-            stmt = select(CharacterQuest).where(
-                CharacterQuest.character_id == character.id,
-                CharacterQuest.quest_id == quest.id,
+            # Remove the items first so they can be returned, then the junction table entry
+            stmt = (
+                delete(CharacterQuestItem)
+                .where(
+                    CharacterQuestItem.character_id == character.id,
+                    CharacterQuestItem.quest_id == quest.id,
+                )
+                .returning(
+                    CharacterQuestItem.name,
+                    CharacterQuestItem.quantity,
+                    CharacterQuestItem.instance_id,
+                )
             )
             result = await sess.execute(stmt)
-            junction = result.scalar_one_or_none()
-            items_to_remove = []
-            if junction:
-                items_to_remove = junction.items_given or []
-                await sess.delete(junction)
-                await sess.commit()
+            items_to_remove = [
+                {"name": name, "quantity": quantity, "instance_id": instance_id}
+                for name, quantity, instance_id in result.all()
+            ]
+            await sess.execute(
+                delete(CharacterQuest).where(
+                    CharacterQuest.character_id == character.id,
+                    CharacterQuest.quest_id == quest.id,
+                )
+            )
+            await sess.commit()
             return items_to_remove
 
         items_to_remove = await self._with_session(_execute, session)
         self.logger.debug(
-            f"Character quest removed: {quest}, returning {len(items_to_remove)} items for removal"
+            "Character quest removed: %s, returning %d items for removal",
+            quest,
+            len(items_to_remove),
         )
         return items_to_remove
@@ -1,5 +1,3 @@
-import logging
-
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -18,7 +16,6 @@ class RulesReactionRepository:
 
     def __init__(self, postgres_manager: PostgresManager):
         self.postgres_manager = postgres_manager
-        self.logger: logging.Logger = logging.getLogger(__name__)
         self._player_reaction_repo = BaseRepository(postgres_manager, PlayerRulesReaction)
 
     async def add_player_reaction(
@@ -90,7 +87,9 @@ class RulesReactionRepository:
             if reaction:
                 await sess.delete(reaction)
                 await sess.commit()
-                self.logger.debug(f"Removed reaction: player {player.id} to message {message_id}")
+                self.logger.debug(
+                    "Removed reaction: player %s to message %s", player.id, message_id
+                )
 
         await self._player_reaction_repo._with_session(_execute, session)
 
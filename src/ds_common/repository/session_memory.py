@@ -32,7 +32,7 @@ class SessionMemoryRepository(BaseRepository[SessionMemory]):
         Returns:
             List of session memories
         """
-        self.logger.debug(f"Getting session memories for session {session_id}")
+        self.logger.debug("Getting session memories for session %s", session_id)
 
         async def _execute(sess: AsyncSession):
             stmt = select(SessionMemory).where(SessionMemory.session_id == session_id)
@@ -82,7 +82,7 @@ class SessionMemoryRepository(BaseRepository[SessionMemory]):
             memory_ids: List of memory IDs to mark as processed
             session: Optional database session
         """
-        self.logger.debug(f"Marking {len(memory_ids)} session memories as processed")
+        self.logger.debug("Marking %d session memories as processed", len(memory_ids))
 
         async def _execute(sess: AsyncSession):
             stmt = select(SessionMemory).where(SessionMemory.id.in_(memory_ids))
@@ -0,0 +1,77 @@
+from typing import Any, ClassVar
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ds_common.repository.base_repository import BaseRepository, T
+
+
+class SingletonRepository(BaseRepository[T]):
+    """
+    Base repository for single-row tables whose row is cached process-wide.
+
+    The cache holds a private snapshot; callers get their own detached copy, so
+    changes they never save are not seen by other readers. The snapshot is only
+    refreshed from writes committed in the repository's own session. Writes made
+    in a caller's session drop it, since that transaction may still roll back.
+    """
+
+    # Snapshot of the row per model class
+    _snapshots: ClassVar[dict[type, Any]] = {}
+
+    def _get_cached(self) -> T | None:
+        """Return a caller-owned copy of the cached row, or None if nothing is cached."""
+        snapshot = self._snapshots.get(self.model_class)
+        return self._detached_copy(snapshot) if snapshot is not None else None
+
+    def _cache(self, model: T, session: AsyncSession | None) -> None:
+        """Cache a snapshot of a committed row; rows from a caller's session drop the cache."""
+        if session is None:
+            self._snapshots[self.model_class] = self._detached_copy(model)
+        else:
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drop the cached row."""
+        self._snapshots.pop(self.model_class, None)
+
+    async def create(self, model: T, session: AsyncSession | None = None) -> T:
+        """Create the row and cache a snapshot of it."""
+        created = await super().create(model, session)
+        self._cache(created, session)
+        return created
+
+    async def update(self, model: T, session: AsyncSession | None = None) -> T:
+        """Update the row and re-cache it; the cache is dropped if the write fails."""
+        try:
+            updated = await super().update(model, session)
+        except Exception:
+            self._invalidate()
+            raise
+        self._cache(updated, session)
+        return updated
+
+    async def upsert(self, model: T, session: AsyncSession | None = None) -> T:
+        """Upsert the row and re-cache it; the cache is dropped if the write fails."""
+        try:
+            upserted = await super().upsert(model, session)
+        except Exception:
+            self._invalidate()
+            raise
+        self._cache(upserted, session)
+        return upserted
+
+    async def delete(self, id: UUID | str, session: AsyncSession | None = None) -> None:
+        """Delete the row and drop the cache."""
+        self._invalidate()
+        await super().delete(id, session)
+
+    async def delete_many(self, ids: list[UUID], session: AsyncSession | None = None) -> int:
+        """Delete rows by ID and drop the cache."""
+        self._invalidate()
+        return await super().delete_many(ids, session)
+
+    async def delete_all(self, session: AsyncSession | None = None) -> int:
+        """Delete every row and drop the cache."""
+        self._invalidate()
+        return await super().delete_all(session)
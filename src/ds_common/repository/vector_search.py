@@ -0,0 +1,24 @@
+"""
+Shared pgvector search helpers for the memory repositories.
+"""
+
+from pgvector.sqlalchemy import BIT
+from sqlalchemy import cast, func, text
+
+# HNSW candidate list size for similarity search; higher trades speed for recall
+HNSW_EF_SEARCH = 40
+
+# Candidates taken from a binary-quantized index before exact cosine re-ranking
+BQ_SHORTLIST_SIZE = 200
+
+# Transaction-local equivalent of SET LOCAL, which cannot take bind parameters
+SET_EF_SEARCH = text("SELECT set_config('hnsw.ef_search', :value, true)")
+
+# Filtered searches keep walking the HNSW graph until enough rows pass the filter,
+# rather than filtering one ef_search-sized candidate list (pgvector 0.8+)
+SET_ITERATIVE_SCAN = text("SELECT set_config('hnsw.iterative_scan', :value, true)")
+
+
+def binary_quantize(embedding, dimensions: int = 768):
+    """SQL expression for the sign quantization of an embedding, one bit per dimension."""
+    return cast(func.binary_quantize(embedding), BIT(dimensions))
@@ -1,5 +1,3 @@
-import logging
-
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -15,7 +13,6 @@ class WorldEventRepository(BaseRepository[WorldEvent]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, WorldEvent)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def get_by_status(
         self, status: EventStatus, session: AsyncSession | None = None
@@ -1,4 +1,3 @@
-import logging
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,7 +15,6 @@ class WorldItemRepository(BaseRepository[WorldItem]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, WorldItem)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def get_by_status(
         self, status: ItemStatus, session: AsyncSession | None = None
@@ -85,5 +83,10 @@ class WorldItemRepository(BaseRepository[WorldItem]):
         Returns:
             List of WorldItem instances
         """
-        all_items = await self.get_all(session=session)
-        return [item for item in all_items if quest_id in item.quest_goals]
+        stmt = select(WorldItem).where(WorldItem.quest_goals.contains([quest_id]))
+
+        async def _execute(sess: AsyncSession):
+            result = await sess.execute(stmt)
+            return list(result.scalars().all())
+
+        return await self._with_session(_execute, session, read_only=True)
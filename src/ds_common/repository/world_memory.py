@@ -1,10 +1,18 @@
+from datetime import datetime
 from typing import Literal
 
-from sqlalchemy import select
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ds_common.models.world_memory import ImpactLevel, MemoryCategory, WorldMemory
 from ds_common.repository.base_repository import BaseRepository
+from ds_common.repository.vector_search import (
+    BQ_SHORTLIST_SIZE,
+    HNSW_EF_SEARCH,
+    SET_EF_SEARCH,
+    binary_quantize,
+)
 from ds_discord_bot.postgres_manager import PostgresManager
 
 
@@ -20,16 +28,23 @@ class WorldMemoryRepository(BaseRepository[WorldMemory]):
         limit: int = 10,
         is_public: bool | None = None,
         dimensions: int | None = None,
+        shortlist_size: int | None = BQ_SHORTLIST_SIZE,
         session: AsyncSession | None = None,
     ) -> list[tuple[WorldMemory, float]]:
         """
         Perform semantic search on world memories.
 
+        Public-only searches are two-stage by default: a Hamming-distance shortlist
+        from the partial binary-quantized index, re-ranked by exact cosine distance.
+        Other searches use the halfvec index directly.
+
         Args:
             query_embedding: Query vector embedding
             limit: Maximum number of results
             is_public: Filter by public status (None = all)
             dimensions: Embedding dimensions (defaults to len(query_embedding))
+            shortlist_size: Candidates to re-rank for public searches, or None to always
+                search the halfvec index directly
             session: Optional database session
 
         Returns:
@@ -39,30 +54,99 @@ class WorldMemoryRepository(BaseRepository[WorldMemory]):
         if dimensions is None:
             dimensions = len(query_embedding)
 
-        self.logger.debug(f"Performing semantic search with limit {limit}, dimensions {dimensions}")
+        self.logger.debug(
+            "Performing semantic search with limit %s, dimensions %s", limit, dimensions
+        )
 
         async def _execute(sess: AsyncSession):
-            # Use pgvector cosine distance operator (<->)
+            # Use pgvector cosine distance operator (<=>), served by the halfvec HNSW index
             # Lower distance = more similar
-            from pgvector.sqlalchemy import Vector
-            from sqlalchemy import cast
+            query_vec = cast(query_embedding, HALFVEC(dimensions))
+            distance = WorldMemory.embedding.cosine_distance(query_vec).label("distance")
+
+            stmt = select(WorldMemory, distance)
+
+            # The binary-quantized index only covers public memories
+            if shortlist_size is None or is_public is not True:
+                ef_search = HNSW_EF_SEARCH
+                if is_public is not None:
+                    stmt = stmt.where(WorldMemory.is_public == is_public)
+                stmt = stmt.where(WorldMemory.embedding.isnot(None))
+            else:
+                # HNSW returns at most ef_search rows, so it must cover the shortlist
+                ef_search = max(HNSW_EF_SEARCH, shortlist_size)
+                query_bits = binary_quantize(query_vec, dimensions)
+                shortlist = (
+                    select(WorldMemory.id)
+                    .where(WorldMemory.is_public, WorldMemory.embedding.isnot(None))
+                    .order_by(
+                        binary_quantize(WorldMemory.embedding, dimensions).op("<~>")(query_bits)
+                    )
+                )
+                shortlist = shortlist.limit(shortlist_size).cte("shortlist")
+                stmt = stmt.join(shortlist, shortlist.c.id == WorldMemory.id)
+
+            await sess.execute(SET_EF_SEARCH, {"value": str(ef_search)})
+            stmt = stmt.order_by(distance).limit(limit)
+            result = await sess.execute(stmt)
+            return [(row[0], row[1]) for row in result.all()]
+
+        return await self._with_session(_execute, session)
+
+    async def count_created_after(
+        self,
+        timestamp: datetime,
+        session: AsyncSession | None = None,
+    ) -> int:
+        """
+        Count world memories created after a point in time.
 
-            # Cast query embedding to Vector type with explicit dimensions
-            # This matches the pattern used in other repositories
-            query_vec = cast(query_embedding, Vector(dimensions))
+        Args:
+            timestamp: Only memories with a later created_at are counted
+            session: Optional database session
+
+        Returns:
+            Number of matching world memories
+        """
 
-            stmt = select(
-                WorldMemory,
-                (WorldMemory.embedding.op("<->")(query_vec)).label("distance"),
+        async def _execute(sess: AsyncSession) -> int:
+            stmt = (
+                select(func.count())
+                .select_from(WorldMemory)
+                .where(WorldMemory.created_at > timestamp)
             )
-            if is_public is not None:
-                stmt = stmt.where(WorldMemory.is_public == is_public)
-            stmt = stmt.where(WorldMemory.embedding.isnot(None))
-            stmt = stmt.order_by("distance").limit(limit)
             result = await sess.execute(stmt)
-            return [(row[0], row[1]) for row in result.all()]
+            return result.scalar_one()
 
-        return await self._with_session(_execute, session)
+        return await self._with_session(_execute, session, read_only=True)
+
+    async def get_public(
+        self,
+        limit: int = 10,
+        session: AsyncSession | None = None,
+    ) -> list[WorldMemory]:
+        """
+        Get the most recent public world memories.
+
+        Args:
+            limit: Maximum number of results
+            session: Optional database session
+
+        Returns:
+            List of public world memories, newest first
+        """
+
+        async def _execute(sess: AsyncSession):
+            stmt = (
+                select(WorldMemory)
+                .where(WorldMemory.is_public)
+                .order_by(WorldMemory.created_at.desc())
+                .limit(limit)
+            )
+            result = await sess.execute(stmt)
+            return list(result.scalars().all())
+
+        return await self._with_session(_execute, session, read_only=True)
 
     async def get_by_impact_level(
         self,
@@ -79,7 +163,7 @@ class WorldMemoryRepository(BaseRepository[WorldMemory]):
         Returns:
             List of world memories
         """
-        self.logger.debug(f"Getting world memories with impact level {impact_level}")
+        self.logger.debug("Getting world memories with impact level %s", impact_level)
 
         async def _execute(sess: AsyncSession):
             stmt = select(WorldMemory).where(WorldMemory.impact_level == impact_level)
@@ -103,7 +187,7 @@ class WorldMemoryRepository(BaseRepository[WorldMemory]):
         Returns:
             List of world memories
         """
-        self.logger.debug(f"Getting world memories with category {category}")
+        self.logger.debug("Getting world memories with category %s", category)
 
         async def _execute(sess: AsyncSession):
             stmt = select(WorldMemory).where(WorldMemory.memory_category == category)
@@ -129,7 +213,7 @@ class WorldMemoryRepository(BaseRepository[WorldMemory]):
         Returns:
             List of related world memories
         """
-        self.logger.debug(f"Getting world memories for {entity_type} {entity_ids}")
+        self.logger.debug("Getting world memories for %s %s", entity_type, entity_ids)
 
         async def _execute(sess: AsyncSession):
             # Use JSONB containment operator (@>)
@@ -1,4 +1,3 @@
-import logging
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,7 +15,6 @@ class WorldRegionRepository(BaseRepository[WorldRegion]):
 
     def __init__(self, postgres_manager: PostgresManager):
         super().__init__(postgres_manager, WorldRegion)
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     async def get_by_type(
         self, region_type: RegionType, session: AsyncSession | None = None
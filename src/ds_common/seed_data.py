@@ -17,6 +17,7 @@ from ds_common.models.character_stat import CharacterStat
 from ds_common.models.game_session import GameSession  # noqa: F401
 from ds_common.models.item_category import ItemCategory
 from ds_common.models.item_template import ItemTemplate
+from ds_common.models.item_template_modifier import ItemTemplateModifier
 from ds_common.models.player import Player  # noqa: F401
 from ds_common.models.quest import Quest  # noqa: F401
 
@@ -720,13 +721,7 @@ async def seed_item_templates(
             equippable_slots=template_data["equippable_slots"],
             rarity=template_data["rarity"],
             value=template_data["value"],
-            stat_bonuses=template_data["stat_bonuses"],
-            stat_multipliers=template_data["stat_multipliers"],
-            resource_bonuses=template_data["resource_bonuses"],
-            resource_regeneration_modifiers=template_data["resource_regeneration_modifiers"],
-            damage_bonuses=template_data["damage_bonuses"],
-            damage_multipliers=template_data["damage_multipliers"],
-            healing_bonuses=template_data["healing_bonuses"],
+            modifiers=ItemTemplateModifier.from_effects(template_data),
             inventory_slots_bonus=template_data["inventory_slots_bonus"],
             created_at=datetime.now(UTC),
             updated_at=datetime.now(UTC),
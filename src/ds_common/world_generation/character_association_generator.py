@@ -6,7 +6,7 @@ import random
 from uuid import UUID
 
 from ds_common.models.location_node import LocationNode
-from ds_common.models.npc import NPC
+from ds_common.models.npc import NPC, NPCSpec
 from ds_common.repository.npc import NPCRepository
 
 # Association types
@@ -89,29 +89,25 @@ class CharacterAssociationGenerator:
         weights = list(probabilities.values())
         return random.choices(types, weights=weights, k=1)[0]
 
-    async def create_npc_for_poi(
+    async def create_npcs_for_poi(
         self,
         location_node: LocationNode,
         poi_type: str,
-    ) -> tuple[NPC, dict]:
+        count: int = 1,
+    ) -> list[tuple[NPC, dict]]:
         """
-        Create an NPC associated with a POI.
+        Create NPCs associated with a POI.
 
         Args:
             location_node: Location node for the POI
             poi_type: Type of POI
+            count: Number of NPCs to create
 
         Returns:
-            Tuple of (created NPC, association dict)
+            List of (created NPC, association dict) tuples
         """
         from ds_common.name_generator import NameGenerator
 
-        # Generate NPC name
-        npc_name = NameGenerator.generate_cyberpunk_channel_name().replace("-", " ").title()
-
-        # Get association type
-        association_type = self._get_association_type(poi_type)
-
         # Determine profession based on association type and POI type
         professions = {
             "OWNER_OPERATOR": ["Shopkeeper", "Owner", "Manager", "Operator"],
@@ -120,11 +116,9 @@ class CharacterAssociationGenerator:
             "RESIDENT": ["Resident", "Tenant", "Local", "Inhabitant"],
             "FACTION_MEMBER": ["Member", "Agent", "Operative", "Enforcer"],
         }
-        profession = random.choice(professions.get(association_type, ["Citizen"]))
 
         # Determine race (random for now)
         races = ["Human", "Hedgehog", "Wolf", "Fox", "Raven", "Snake", "Bear"]
-        race = random.choice(races)
 
         # Determine background
         backgrounds = {
@@ -134,31 +128,61 @@ class CharacterAssociationGenerator:
             "RESIDENT": ["Resident", "Local", "Inhabitant"],
             "FACTION_MEMBER": ["Faction Member", "Gang Member", "Operative"],
         }
-        background = random.choice(backgrounds.get(association_type, ["Citizen"]))
-
-        # Create NPC using the generate_npc class method
-        npc = await NPC.generate_npc(
-            name=npc_name,
-            race=race,
-            background=background,
-            profession=profession,
-            faction=None,  # Will be set if faction POI
-            location=location_node.location_name,
-        )
-
-        created_npc = await self.npc_repository.create(npc)
-        
-        # Note: Logging and metrics are handled in NPCRepository.create()
-
-        # Create association dict
-        association = {
-            "npc_id": str(created_npc.id),
-            "npc_name": created_npc.name,
-            "association_type": association_type,
-            "poi_type": poi_type,
-        }
 
-        return created_npc, association
+        association_types = []
+        specs = []
+        for _ in range(count):
+            # Get association type
+            association_type = self._get_association_type(poi_type)
+            association_types.append(association_type)
+            # Generate NPC name
+            npc_name = NameGenerator.generate_cyberpunk_channel_name().replace("-", " ").title()
+            specs.append(
+                NPCSpec(
+                    name=npc_name,
+                    race=random.choice(races),
+                    background=random.choice(backgrounds.get(association_type, ["Citizen"])),
+                    profession=random.choice(professions.get(association_type, ["Citizen"])),
+                    faction=None,  # Will be set if faction POI
+                    location=location_node.location_name,
+                )
+            )
+
+        # Roll and insert all NPCs for this POI in one batch
+        npcs = NPC.generate_npcs(specs)
+        # Note: Logging and metrics are handled in NPCRepository.create_many()
+        created_npcs = await self.npc_repository.create_many(npcs)
+
+        results = []
+        for created_npc, association_type in zip(created_npcs, association_types, strict=True):
+            # Create association dict
+            association = {
+                "npc_id": str(created_npc.id),
+                "npc_name": created_npc.name,
+                "association_type": association_type,
+                "poi_type": poi_type,
+            }
+            results.append((created_npc, association))
+
+        return results
+
+    async def create_npc_for_poi(
+        self,
+        location_node: LocationNode,
+        poi_type: str,
+    ) -> tuple[NPC, dict]:
+        """
+        Create an NPC associated with a POI.
+
+        Args:
+            location_node: Location node for the POI
+            poi_type: Type of POI
+
+        Returns:
+            Tuple of (created NPC, association dict)
+        """
+        results = await self.create_npcs_for_poi(location_node, poi_type)
+        return results[0]
 
     async def generate_associations_for_pois(
         self, location_nodes: list[LocationNode], poi_types: list[str]
@@ -179,10 +203,8 @@ class CharacterAssociationGenerator:
             # Generate 1-3 NPCs per POI (weighted toward 1)
             num_npcs = random.choices([1, 2, 3], weights=[0.6, 0.3, 0.1], k=1)[0]
 
-            poi_associations = []
-            for _ in range(num_npcs):
-                npc, association = await self.create_npc_for_poi(location_node, poi_type)
-                poi_associations.append(association)
+            created = await self.create_npcs_for_poi(location_node, poi_type, num_npcs)
+            poi_associations = [association for _, association in created]
 
             associations[location_node.id] = {
                 "nearby_npcs": poi_associations,
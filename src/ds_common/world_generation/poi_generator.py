@@ -463,10 +463,8 @@ class POIGenerator:
             # Generate a name and extract a word from it
             name = NameGenerator.generate_cyberpunk_channel_name()
             # Use the noun part (after the hyphen) or the whole name
-            if "-" in name:
-                name_parts.append(name.split("-")[1].capitalize())
-            else:
-                name_parts.append(name.capitalize())
+            _, sep, noun = name.partition("-")
+            name_parts.append((noun if sep else name).capitalize())
 
         # Generate POIs
         for poi_type, count in poi_counts.items():
@@ -1679,6 +1679,7 @@ async def seed_calendar_months(postgres_manager: "PostgresManager") -> dict[int,
         },
     ]
 
+    new_months = []
     for month_data in CALENDAR_MONTHS:
         existing = await repo.get_by_month_number(month_data["month_number"])
         if existing:
@@ -1688,9 +1689,11 @@ async def seed_calendar_months(postgres_manager: "PostgresManager") -> dict[int,
             seeded_months[month_data["month_number"]] = existing
             continue
 
-        month = CalendarMonth(**month_data)
-        month = await repo.create(month)
-        seeded_months[month_data["month_number"]] = month
+        new_months.append(CalendarMonth(**month_data))
+
+    # Insert every missing month in one transaction rather than one per month
+    for month in await repo.create_many(new_months):
+        seeded_months[month.month_number] = month
         logger.debug(f"Seeded month {month.month_number}: {month.name}")
 
     logger.info(f"Seeded {len(seeded_months)} calendar months")
@@ -1826,6 +1829,7 @@ async def seed_calendar_year_cycle(
         },
     ]
 
+    new_cycles = []
     for cycle_data in CYCLE_YEARS:
         existing = await repo.get_by_cycle_year(cycle_data["cycle_year"])
         if existing:
@@ -1835,9 +1839,11 @@ async def seed_calendar_year_cycle(
             seeded_cycles[cycle_data["cycle_year"]] = existing
             continue
 
-        cycle = CalendarYearCycle(**cycle_data)
-        cycle = await repo.create(cycle)
-        seeded_cycles[cycle_data["cycle_year"]] = cycle
+        new_cycles.append(CalendarYearCycle(**cycle_data))
+
+    # Insert every missing cycle year in one transaction rather than one per year
+    for cycle in await repo.create_many(new_cycles):
+        seeded_cycles[cycle.cycle_year] = cycle
         logger.debug(f"Seeded cycle year {cycle.cycle_year}: {cycle.animal_name}")
 
     logger.info(f"Seeded {len(seeded_cycles)} calendar year cycles")
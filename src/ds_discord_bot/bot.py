@@ -312,13 +312,11 @@ class DSBot(commands.AutoShardedBot):
         Load game settings from database and wrap in RefreshableGameSettings
         for automatic lazy refreshing.
         """
-        from uuid import UUID
+        from ds_common.models.game_settings import DEFAULT_GAME_SETTINGS_ID
 
         self.logger.info("Loading game settings...")
         game_settings_repo = GameSettingsRepository(self.postgres_manager)
-        # Try to get default settings (UUID: 00000000-0000-0000-0000-000000000001)
-        default_id = UUID("00000000-0000-0000-0000-000000000001")
-        settings = await game_settings_repo.get_by_id(default_id)
+        settings = await game_settings_repo.get_by_id(DEFAULT_GAME_SETTINGS_ID)
 
         if not settings:
             self.logger.info("Game settings not found, creating default...")
@@ -166,15 +166,15 @@ class Admin(commands.Cog):
             snapshot_repo = MemorySnapshotRepository(self.postgres_manager)
 
             if recent:
-                snapshots = await snapshot_repo.get_all_snapshots(unwound=None, limit=10)
+                snapshots = await snapshot_repo.get_snapshot_summaries(limit=10)
             elif unwound_only:
-                snapshots = await snapshot_repo.get_unwound_snapshots()
+                snapshots = await snapshot_repo.get_snapshot_summaries(unwound=True)
             elif world_memory_id:
-                snapshots = await snapshot_repo.get_snapshots_for_world_memory(
-                    UUID(world_memory_id)
+                snapshots = await snapshot_repo.get_snapshot_summaries(
+                    world_memory_id=UUID(world_memory_id)
                 )
             else:
-                snapshots = await snapshot_repo.get_all_snapshots()
+                snapshots = await snapshot_repo.get_snapshot_summaries()
 
             if not snapshots:
                 await interaction.followup.send("No snapshots found.", ephemeral=True)
@@ -210,7 +210,7 @@ class Admin(commands.Cog):
 
         try:
             snapshot_repo = MemorySnapshotRepository(self.postgres_manager)
-            snapshot = await snapshot_repo.get_by_id(UUID(snapshot_id))
+            snapshot = await snapshot_repo.get_with_data(UUID(snapshot_id))
 
             if not snapshot:
                 await interaction.followup.send("Snapshot not found.", ephemeral=True)
@@ -407,31 +407,35 @@ class Admin(commands.Cog):
         await interaction.response.defer(ephemeral=True, thinking=True)
 
         try:
+            # Validate every argument before changing anything
+            if session_expiration is not None and session_expiration < 1:
+                await interaction.followup.send(
+                    "Session expiration must be at least 1 hour.", ephemeral=True
+                )
+                return
+
+            if episode_expiration is not None and episode_expiration < 1:
+                await interaction.followup.send(
+                    "Episode expiration must be at least 1 hour.", ephemeral=True
+                )
+                return
+
+            if snapshot_retention is not None and snapshot_retention < 1:
+                await interaction.followup.send(
+                    "Snapshot retention must be at least 1 day.", ephemeral=True
+                )
+                return
+
             settings_repo = MemorySettingsRepository(self.postgres_manager)
             settings = await settings_repo.get_settings()
 
             if session_expiration is not None:
-                if session_expiration < 1:
-                    await interaction.followup.send(
-                        "Session expiration must be at least 1 hour.", ephemeral=True
-                    )
-                    return
                 settings.session_memory_expiration_hours = session_expiration
 
             if episode_expiration is not None:
-                if episode_expiration < 1:
-                    await interaction.followup.send(
-                        "Episode expiration must be at least 1 hour.", ephemeral=True
-                    )
-                    return
                 settings.episode_memory_expiration_hours = episode_expiration
 
             if snapshot_retention is not None:
-                if snapshot_retention < 1:
-                    await interaction.followup.send(
-                        "Snapshot retention must be at least 1 day.", ephemeral=True
-                    )
-                    return
                 settings.snapshot_retention_days = snapshot_retention
 
             if auto_cleanup is not None:
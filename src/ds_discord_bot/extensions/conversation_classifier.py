@@ -90,7 +90,7 @@ class ConversationClassifierConfig:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassificationResult:
     """Result of conversation classification."""
 
@@ -81,7 +81,8 @@ async def add_character_quest(
         inventory = character.inventory if character.inventory else []
 
         for item_data in items:
-            item_name = item_data.get("name")
+            # character_quest_items.name is NOT NULL, and the agent may omit the name
+            item_name = item_data.get("name") or "Unknown Item"
             item_quantity = item_data.get("quantity", 1)
             item_type = item_data.get("type", "QUEST_ITEM")
 
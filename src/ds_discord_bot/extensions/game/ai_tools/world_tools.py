@@ -34,7 +34,7 @@ async def fetch_npc(
     print(
         f"!!! Selecting or creating NPC: {request.name}, {request.race}, {request.background}, {request.profession}, {request.faction}, {request.location}"
     )
-    npc = await NPC.generate_npc(
+    npc = NPC.generate_npc(
         request.name,
         request.race,
         request.background,
@@ -1739,6 +1739,19 @@ class MessageProcessor:
         if not gm_histories:
             return []
 
+        # Validate all rows in one pass; only fall back to per-row validation (skipping
+        # unreadable rows) if something in the batch fails
+        try:
+            return ModelMessagesTypeAdapter.validate_python(
+                [
+                    message
+                    for gm_history_model in gm_histories
+                    for message in gm_history_model.model_messages or []
+                ]
+            )
+        except Exception:
+            self.logger.warning("Batch history validation failed, validating rows individually")
+
         history = []
         for gm_history_model in gm_histories:
             try:
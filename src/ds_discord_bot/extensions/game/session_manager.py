@@ -95,59 +95,64 @@ class SessionManager:
             from ds_common.repository.quest import QuestRepository
 
             quest_repo = QuestRepository(self.postgres_manager)
+            quest_items_by_character = await quest_repo.take_session_quest_items(game_session.id)
             character_quests = await quest_repo.get_quests_by_session(game_session.id)
 
             character_repo = CharacterRepository(self.postgres_manager)
-            for char_quest in character_quests:
-                if char_quest.items_given:
-                    # Get character and remove quest items
-                    character = await character_repo.get_by_id(char_quest.character_id)
-                    if character and character.inventory:
-                        inventory = character.inventory
-                        updated_inventory = []
-                        items_removed = []
-
-                        for inv_item in inventory:
-                            item_removed = False
-                            for quest_item in char_quest.items_given:
-                                # Match by instance_id (preferred) or name
-                                if inv_item.get("instance_id") == quest_item.get("instance_id"):
-                                    items_removed.append(
-                                        {
-                                            "name": inv_item.get("name"),
-                                            "quantity": inv_item.get("quantity", 0),
-                                        }
-                                    )
-                                    item_removed = True
-                                    break
-                                if inv_item.get("name") == quest_item.get("name"):
-                                    # Reduce quantity
-                                    current_qty = inv_item.get("quantity", 0)
-                                    remove_qty = quest_item.get("quantity", 0)
-                                    new_qty = current_qty - remove_qty
-
-                                    if new_qty > 0:
-                                        inv_item["quantity"] = new_qty
-                                        updated_inventory.append(inv_item)
-                                    items_removed.append(
-                                        {
-                                            "name": inv_item.get("name"),
-                                            "quantity": min(current_qty, remove_qty),
-                                        }
-                                    )
-                                    item_removed = True
-                                    break
-
-                            if not item_removed:
-                                updated_inventory.append(inv_item)
-
-                        character.inventory = updated_inventory
-                        await character_repo.update(character)
-                        self.logger.info(
-                            f"Cleaned up {len(items_removed)} quest items from character {character.id} "
-                            f"when session {game_session.id} ended: {[item['name'] for item in items_removed]}"
+            for character_id, quest_items in quest_items_by_character.items():
+                # Get character and remove quest items
+                character = await character_repo.get_by_id(character_id)
+                if character and character.inventory:
+                    inventory = character.inventory
+                    updated_inventory = []
+                    items_removed = []
+
+                    # Items from several quests can share one merged stack, so total the
+                    # quantities per name and apply every quest's items in a single pass
+                    quest_instance_ids = {quest_item["instance_id"] for quest_item in quest_items}
+                    quest_quantities: dict[str, int] = {}
+                    for quest_item in quest_items:
+                        name = quest_item["name"]
+                        quest_quantities[name] = (
+                            quest_quantities.get(name, 0) + quest_item["quantity"]
+                        )
+
+                    for inv_item in inventory:
+                        # Match by instance_id (preferred) or name
+                        if inv_item.get("instance_id") in quest_instance_ids:
+                            items_removed.append(
+                                {
+                                    "name": inv_item.get("name"),
+                                    "quantity": inv_item.get("quantity", 0),
+                                }
+                            )
+                            continue
+                        remove_qty = quest_quantities.get(inv_item.get("name"))
+                        if remove_qty is None:
+                            updated_inventory.append(inv_item)
+                            continue
+
+                        # Reduce quantity
+                        current_qty = inv_item.get("quantity", 0)
+                        new_qty = current_qty - remove_qty
+
+                        if new_qty > 0:
+                            inv_item["quantity"] = new_qty
+                            updated_inventory.append(inv_item)
+                        items_removed.append(
+                            {
+                                "name": inv_item.get("name"),
+                                "quantity": min(current_qty, remove_qty),
+                            }
                         )
 
+                    character.inventory = updated_inventory
+                    await character_repo.update(character)
+                    self.logger.info(
+                        f"Cleaned up {len(items_removed)} quest items from character {character.id} "
+                        f"when session {game_session.id} ended: {[item['name'] for item in items_removed]}"
+                    )
+
             # 1. Delete session memory records
             stmt = select(SessionMemory).where(SessionMemory.session_id == game_session.id)
             result = await sess.execute(stmt)
@@ -1,5 +1,4 @@
 import logging
-from datetime import UTC, datetime
 
 import discord
 from discord import app_commands
@@ -44,9 +43,7 @@ class Moderation(commands.Cog):
             player_repo = PlayerRepository(self.postgres_manager)
             player = await player_repo.get_by_id(user.id)
             if player:
-                player.is_active = False
-                player.last_active_at = datetime.now(UTC)
-                await player_repo.upsert(player)
+                await player_repo.set_activity(player, is_active=False)
                 self.logger.debug("Deactivated player %s", player)
             await interaction.followup.send(f"Banned {user}")
         except discord.Forbidden:
@@ -63,9 +60,7 @@ class Moderation(commands.Cog):
             player_repo = PlayerRepository(self.postgres_manager)
             player = await player_repo.get_by_id(user.id)
             if player:
-                player.is_active = True
-                player.last_active_at = datetime.now(UTC)
-                await player_repo.upsert(player)
+                await player_repo.set_activity(player, is_active=True)
                 self.logger.debug("Activated player %s", player)
             await interaction.followup.send(f"Unbanned {user}")
         except discord.Forbidden:
@@ -6,10 +6,13 @@ from discord.ext import commands
 
 logger = logging.getLogger(__name__)
 
+# Leading emoji/symbol prefix on channel names, e.g. "🎲-neon-alley"
+_CHANNEL_PREFIX_RE = re.compile(r"^[^a-zA-Z0-9-]+-")
+
 
 def clean_channel_name(name: str) -> str:
     # If channel name starts with non-alphanumeric or - characters, remove them
-    return re.sub(r"^[^a-zA-Z0-9-]+-", "", name)
+    return _CHANNEL_PREFIX_RE.sub("", name, count=1)
 
 
 async def find_category(
@@ -36,7 +36,7 @@ class CharacterResetConfirmationView(View):
 
         # Check if character is in a game session
         character_repo = CharacterRepository(self.postgres_manager)
-        game_session = await character_repo.get_game_session(self.character)
+        character_class, _, game_session = await character_repo.get_related(self.character)
         if game_session:
             await interaction.followup.send(
                 "❌ You cannot reset a character while in a game session. "
@@ -45,9 +45,6 @@ class CharacterResetConfirmationView(View):
             )
             return
 
-        # Get character class
-        character_repo = CharacterRepository(self.postgres_manager)
-        character_class = await character_repo.get_character_class(self.character)
         if not character_class:
             await interaction.followup.send(
                 "❌ Character class not found. Cannot reset character.",
@@ -236,7 +233,7 @@ class CharacterResetStatsView(View):
                 return
 
             # Check if character is in a game session (double-check)
-            game_session = await character_repo.get_game_session(character)
+            character_class, _, game_session = await character_repo.get_related(character)
             if game_session:
                 await interaction.followup.send(
                     "❌ You cannot reset a character while in a game session. "
@@ -261,9 +258,6 @@ class CharacterResetStatsView(View):
             from ds_common.models.junction_tables import CharacterClassStartingEquipment
             from ds_common.repository.item_template import ItemTemplateRepository
 
-            # Get character class
-            character_class = await character_repo.get_character_class(character)
-
             if character_class:
                 template_repo = ItemTemplateRepository(self.postgres_manager)
 
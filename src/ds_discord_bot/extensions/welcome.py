@@ -99,9 +99,7 @@ class Welcome(commands.Cog):
                 await character_repo.delete(character.id)
                 self.logger.debug("Deleted character %s", character)
 
-            player.is_active = False
-            player.last_active_at = datetime.now(UTC)
-            await player_repo.upsert(player)
+            await player_repo.set_activity(player, is_active=False)
             self.logger.debug("Deactivated player %s", player)
 
         if self.bot.channel_bot_logs:
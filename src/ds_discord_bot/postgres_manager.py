@@ -3,7 +3,9 @@ import time
 import traceback
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 
@@ -13,6 +15,11 @@ import ds_common.models  # noqa: F401
 from ds_common.metrics.service import get_metrics_service
 
 
+def json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB column values with orjson (handles UUID and datetime natively)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class PostgresManager:
     """
     PostgreSQL connection manager with support for read replicas.
@@ -56,6 +63,8 @@ class PostgresManager:
             pool_size=pool_size,
             max_overflow=max_overflow,
             echo=echo,
+            json_serializer=json_serializer,
+            json_deserializer=orjson.loads,
             poolclass=NullPool if pool_size == 0 else None,
         )
 
@@ -73,6 +82,8 @@ class PostgresManager:
                 pool_size=read_replica_pool_size,
                 max_overflow=read_replica_max_overflow,
                 echo=echo,
+                json_serializer=json_serializer,
+                json_deserializer=orjson.loads,
                 poolclass=NullPool if read_replica_pool_size == 0 else None,
             )
             self.read_replica_session_maker = async_sessionmaker(
@@ -9,6 +9,7 @@ from ds_common.combat.resource_calculator import (
     calculate_max_stamina,
     calculate_max_tech_power,
     calculate_max_armor,
+    calculate_max_resources,
     ENFORCER_ID,
     TECH_WIZARD_ID,
     SMOOTH_TALKER_ID,
@@ -483,3 +484,37 @@ class TestAllClassesResourceCalculations:
         assert stamina == 90.0  # 75 + 15
         assert tech_power == 128.0  # 108 + 20
         assert armor == 42.0  # 32 + 10
+
+
+class TestCalculateMaxResources:
+    """Tests for calculate_max_resources function."""
+
+    @pytest.mark.parametrize(
+        "class_id", [None, ENFORCER_ID, TECH_WIZARD_ID, SMOOTH_TALKER_ID, SPY_ID, WILD_CARD_ID]
+    )
+    def test_matches_individual_calculations(self, class_id):
+        """Test that the combined result matches the per-resource functions."""
+        character = MagicMock()
+        character.stats = {"STR": 12, "DEX": 9, "INT": 15}
+        character.level = 4
+        character.character_class_id = class_id
+
+        equipment_bonuses = {"max_health": 5.0, "max_tech_power": 7.5}
+
+        result = calculate_max_resources(character, None, equipment_bonuses)
+
+        assert result == (
+            calculate_max_health(character, None, equipment_bonuses),
+            calculate_max_stamina(character, None, equipment_bonuses),
+            calculate_max_tech_power(character, None, equipment_bonuses),
+            calculate_max_armor(character, None, equipment_bonuses),
+        )
+
+    def test_handles_missing_stats_and_bonuses(self):
+        """Test that missing stats and no equipment default to level-only values."""
+        character = MagicMock()
+        character.stats = {}
+        character.level = 1
+        character.character_class_id = None
+
+        assert calculate_max_resources(character) == (10.0, 5.0, 8.0, 2.0)
@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import MagicMock
 
 from ds_common.equipment.effect_calculator import (
+    _get_equipped_item_template_ids,
     calculate_stat_bonuses,
     calculate_stat_multipliers,
     calculate_resource_bonuses,
@@ -412,3 +413,29 @@ class TestGetInventorySlotsBonus:
         result = get_inventory_slots_bonus(character, equipped_templates=[item1, item2])
 
         assert result == 3  # 5 + (-2)
+
+
+class TestGetEquippedItemTemplateIds:
+    """Tests for _get_equipped_item_template_ids function."""
+
+    def test_returns_one_id_per_equipped_item(self):
+        """Test that only equipped items count, and duplicates are kept."""
+        template_id = "0190b6a4-5f3c-7c1e-9a2b-3c4d5e6f7a8b"
+        character = MagicMock()
+        character.inventory = [
+            {"item_template_id": template_id, "equipped": True},
+            {"item_template_id": template_id, "equipment_slot": "ring_2"},
+            {"item_template_id": template_id, "equipped": False},
+            {"name": "Key", "equipped": True},
+        ]
+
+        result = _get_equipped_item_template_ids(character)
+
+        assert [str(item_id) for item_id in result] == [template_id, template_id]
+
+    def test_skips_malformed_ids(self):
+        """Test that template IDs that are not UUIDs are skipped."""
+        character = MagicMock()
+        character.inventory = [{"item_template_id": "not-a-uuid", "equipped": True}]
+
+        assert _get_equipped_item_template_ids(character) == []
@@ -0,0 +1,56 @@
+"""Tests for game time kernel functions."""
+
+from datetime import UTC, datetime, timedelta
+
+from ds_common.memory.game_time_kernel import derive_game_clock, elapsed_microseconds
+
+
+class TestElapsedMicroseconds:
+    """Tests for elapsed_microseconds function."""
+
+    def test_exact_microseconds(self):
+        """Test that elapsed time is returned as exact integer microseconds."""
+        epoch = datetime(2025, 1, 1, tzinfo=UTC)
+        now = epoch + timedelta(days=3, seconds=7, microseconds=11)
+
+        result = elapsed_microseconds(epoch, now)
+
+        assert result == (3 * 86_400 + 7) * 1_000_000 + 11
+
+    def test_negative_when_before_epoch(self):
+        """Test that times before the epoch give negative elapsed time."""
+        epoch = datetime(2025, 1, 1, tzinfo=UTC)
+
+        assert elapsed_microseconds(epoch, epoch - timedelta(seconds=1)) == -1_000_000
+
+
+class TestDeriveGameClock:
+    """Tests for derive_game_clock function.
+
+    One real second advances the game by `multiplier` game minutes.
+    """
+
+    def test_epoch_is_year_one_day_one(self):
+        """Test that zero elapsed time is the start of the first game day."""
+        assert derive_game_clock(0, 1.0, 30, 400) == (1, 1, 0, 0)
+
+    def test_minutes_and_hours(self):
+        """Test conversion of real seconds into game minutes and hours."""
+        # 90 real seconds at 1x = 90 game minutes = 1h 30m
+        assert derive_game_clock(90_000_000, 1.0, 30, 400) == (1, 1, 1, 30)
+
+    def test_multiplier_scales_game_time(self):
+        """Test that the multiplier scales elapsed game time."""
+        # 30 real seconds at 4x = 120 game minutes = 2h
+        assert derive_game_clock(30_000_000, 4.0, 30, 400) == (1, 1, 2, 0)
+
+    def test_day_and_year_rollover(self):
+        """Test rollover into the next day and year."""
+        minutes_per_day = 30 * 60
+        one_year_one_day = (400 + 1) * minutes_per_day * 1_000_000
+
+        assert derive_game_clock(one_year_one_day, 1.0, 30, 400) == (2, 2, 0, 0)
+
+    def test_partial_minutes_are_truncated(self):
+        """Test that partial game minutes are dropped."""
+        assert derive_game_clock(59_999_999, 1.0, 30, 400) == (1, 1, 0, 59)
@@ -0,0 +1,74 @@
+"""Tests for BaseRepository helpers that do not touch the database."""
+
+from enum import StrEnum
+
+from sqlalchemy import Enum, String, inspect
+
+import ds_common.models  # noqa: F401
+from ds_common.models.episode_memory import EpisodeMemory
+from ds_common.models.memory_settings import MemorySettings
+from ds_common.models.npc_memory import NPCMemory
+from ds_common.models.world_memory import WorldMemory
+from ds_common.repository.base_repository import BaseRepository, _copy_value, _supports_copy
+
+
+class TestDetachedCopy:
+    """Tests for BaseRepository._detached_copy."""
+
+    def test_copy_is_detached_with_same_identity(self):
+        """Test that the copy keeps the row identity with no pending changes."""
+        repo = BaseRepository(None, MemorySettings)
+        settings = MemorySettings(session_memory_expiration_hours=6)
+
+        copy = repo._detached_copy(settings)
+        state = inspect(copy)
+
+        assert copy is not settings
+        assert copy.id == settings.id
+        assert copy.session_memory_expiration_hours == 6
+        assert state.detached
+        assert not state.modified
+
+    def test_changes_to_copy_do_not_reach_original(self):
+        """Test that the copy can be changed without touching the original."""
+        repo = BaseRepository(None, MemorySettings)
+        settings = MemorySettings()
+
+        copy = repo._detached_copy(settings)
+        copy.session_memory_expiration_hours = 12
+
+        assert settings.session_memory_expiration_hours == 4
+        assert inspect(copy).modified
+
+
+class TestSupportsCopy:
+    """Tests for the COPY eligibility check used by create_many."""
+
+    def test_plain_table_uses_copy(self):
+        """Test that a table without pgvector columns can be copied."""
+        assert _supports_copy(MemorySettings.__table__)
+
+    def test_vector_table_uses_orm(self):
+        """Test that vector columns force the ORM insert path."""
+        assert not _supports_copy(EpisodeMemory.__table__)
+
+    def test_halfvec_tables_use_orm(self):
+        """Test that halfvec columns, which are not Vector subclasses, force the ORM path."""
+        assert not _supports_copy(NPCMemory.__table__)
+        assert not _supports_copy(WorldMemory.__table__)
+
+
+class _Status(StrEnum):
+    ACTIVE = "active"
+
+
+class TestCopyValue:
+    """Tests for converting attribute values for COPY."""
+
+    def test_enum_column_stores_member_name(self):
+        """Test that Enum columns get the member name, as the ORM writes them."""
+        assert _copy_value(_Status.ACTIVE, Enum(_Status)) == "ACTIVE"
+
+    def test_string_column_keeps_enum_value(self):
+        """Test that a str enum in a plain String column keeps its value."""
+        assert _copy_value(_Status.ACTIVE, String()) == "active"
@@ -0,0 +1,53 @@
+"""Tests for the Character repository's loader options."""
+
+import ds_common.models  # noqa: F401
+from ds_common.repository import character as character_repository
+from ds_common.repository.character import CharacterRepository
+
+
+def _strategies(options) -> list[tuple]:
+    """Flatten loader options into (path key, strategy) pairs."""
+    strategies = []
+    for option in options:
+        # Wildcards like raiseload("*") carry their strategy directly
+        loads = getattr(option, "context", None) or (option,)
+        strategies.extend((str(load.path), load.strategy) for load in loads)
+    return strategies
+
+
+class TestLoaderOptions:
+    """Tests for CharacterRepository._loader_options."""
+
+    def test_class_always_joined(self, monkeypatch):
+        """Test that the character class is joined in without strict loading."""
+        monkeypatch.setattr(character_repository, "STRICT_LOAD", False)
+
+        strategies = _strategies(CharacterRepository._loader_options())
+
+        assert len(strategies) == 1
+        assert "character_class" in strategies[0][0]
+        assert ("lazy", "joined") in strategies[0][1]
+
+    def test_strict_load_adds_raiseload(self, monkeypatch):
+        """Test that DS_STRICT_LOAD makes unnamed relationships raise on access."""
+        monkeypatch.setattr(character_repository, "STRICT_LOAD", True)
+
+        strategies = _strategies(CharacterRepository._loader_options())
+
+        assert ("lazy", "raise") in strategies[-1][1]
+        assert "character_class" in strategies[0][0]
+
+    def test_extra_options_kept_before_raiseload(self, monkeypatch):
+        """Test that requested relationships are loaded rather than raised."""
+        from sqlalchemy.orm import selectinload
+
+        from ds_common.models.character import Character
+
+        monkeypatch.setattr(character_repository, "STRICT_LOAD", True)
+
+        options = CharacterRepository._loader_options(selectinload(Character.players))
+        strategies = _strategies(options)
+
+        assert len(options) == 3
+        assert "players" in strategies[1][0]
+        assert ("lazy", "selectin") in strategies[1][1]
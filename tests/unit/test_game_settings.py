@@ -0,0 +1,33 @@
+"""Tests for GameSettings validation."""
+
+import pytest
+from pydantic import ValidationError
+
+from ds_common.models.game_settings import GameSettings
+
+
+class TestGameSettingsValidation:
+    """Tests for GameSettings field bounds and cross-field checks."""
+
+    def test_defaults_are_valid(self):
+        """Test that the default settings pass validation."""
+        settings = GameSettings.model_validate({})
+
+        assert settings.character_stats_luck_min <= settings.character_stats_luck_max
+
+    def test_field_bound_rejected(self):
+        """Test that a value outside a field's bounds is rejected."""
+        with pytest.raises(ValidationError):
+            GameSettings.model_validate({"memory_importance_threshold": 1.5})
+
+    def test_min_above_max_rejected(self):
+        """Test that a min setting above its max is rejected."""
+        with pytest.raises(ValidationError, match="character_stats_luck_min"):
+            GameSettings.model_validate(
+                {"character_stats_luck_min": 8, "character_stats_luck_max": 4}
+            )
+
+    def test_hour_outside_day_rejected(self):
+        """Test that day/night start hours must fall within a game day."""
+        with pytest.raises(ValidationError, match="game_hours_per_day"):
+            GameSettings.model_validate({"game_hours_per_day": 12, "game_night_start_hour": 15})
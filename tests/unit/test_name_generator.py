@@ -3,7 +3,7 @@
 import random
 import pytest
 
-from ds_common.name_generator import NameGenerator, Theme
+from ds_common.name_generator import NameGenerator, Theme, _build_letter_pools, _pool_stride
 
 
 class TestNameGenerator:
@@ -170,6 +170,18 @@ class TestNameGenerator:
             parts = name.split("-")
             assert len(parts) == 2
 
+    def test_generate_multiple_names_alliteration(self):
+        """Test that batch-generated names keep adjective and noun on the same letter."""
+        random.seed(7)
+
+        for name in NameGenerator.generate_multiple_names(200):
+            adj, noun = name.split("-")
+            assert adj[0] == noun[0], f"Expected alliteration in '{name}'"
+
+    def test_generate_multiple_names_zero_count(self):
+        """Test that requesting no names returns an empty list."""
+        assert NameGenerator.generate_multiple_names(0) == []
+
     def test_generate_multiple_names_with_fantasy_theme(self):
         """Test generating multiple fantasy names."""
         names = NameGenerator.generate_multiple_names(5, Theme.FANTASY)
@@ -231,6 +243,34 @@ class TestNameGenerator:
             assert letter in NameGenerator.western_nouns
             assert len(NameGenerator.western_nouns[letter]) > 0
 
+    def test_letter_pools_cover_every_theme_letter(self):
+        """Test that each theme has one precomputed pool per letter with matching words."""
+        for theme in Theme:
+            pools = NameGenerator._letter_pools[theme]
+            assert len(pools) == 26
+            for adjectives, nouns in pools:
+                assert adjectives
+                assert nouns
+                assert {word[0] for word in adjectives} == {word[0] for word in nouns}
+
+    def test_build_letter_pools_rejects_missing_letters(self):
+        """Test that word lists missing a letter fail at build time instead of per call."""
+        nouns = dict(NameGenerator.cyberpunk_nouns)
+        nouns["q"] = []
+
+        with pytest.raises(ValueError, match="q"):
+            _build_letter_pools(NameGenerator.cyberpunk_adjectives, nouns)
+
+    def test_pool_stride_is_divisible_by_every_pair_count(self):
+        """Test that uneven pools still get a stride every letter's pair count divides."""
+        pools = ((("a1", "a2"), ("n1", "n2", "n3")), (("b1",), ("m1", "m2", "m3", "m4")))
+
+        stride = _pool_stride(pools)
+
+        assert stride == 12
+        for adjectives, nouns in pools:
+            assert stride % (len(adjectives) * len(nouns)) == 0
+
     # Backward Compatibility Tests
     def test_adjectives_property_returns_cyberpunk(self):
         """Test that adjectives property returns cyberpunk adjectives for backward compatibility."""
@@ -0,0 +1,43 @@
+"""Tests for NPC generation."""
+
+from ds_common.models.npc import NPC, NPCSpec
+
+
+class TestGenerateNPC:
+    """Tests for NPC.generate_npc."""
+
+    def test_stats_split_full_budget(self):
+        """Test that stats are positive and sum to the level's stat budget."""
+        for _ in range(50):
+            npc = NPC.generate_npc("Vex", "Human", "Street", "Fixer", None, None)
+
+            assert set(npc.stats) == {"CHA", "DEX", "INT", "LUK", "PER", "STR"}
+            assert all(value >= 1 for value in npc.stats.values())
+            assert sum(npc.stats.values()) == int(100 * (npc.level * 1.2))
+
+    def test_resources_start_full(self):
+        """Test that generated NPCs start with full combat resources."""
+        npc = NPC.generate_npc("Vex", "Human", "Street", "Fixer", None, None)
+
+        assert npc.current_health == npc.max_health > 0
+        assert npc.current_stamina == npc.max_stamina
+
+    def test_batch_keeps_order_and_timestamp(self):
+        """Test that a batch keeps spec order and shares one creation timestamp."""
+        specs = [
+            NPCSpec(
+                name=f"NPC {i}",
+                race="Human",
+                background="Street",
+                profession="Fixer",
+                faction=None,
+                location="Docks",
+            )
+            for i in range(5)
+        ]
+
+        npcs = NPC.generate_npcs(specs)
+
+        assert [npc.name for npc in npcs] == [spec["name"] for spec in specs]
+        assert len({npc.created_at for npc in npcs}) == 1
+        assert all(npc.location == "Docks" for npc in npcs)
@@ -0,0 +1,55 @@
+"""Tests for the process-wide singleton row cache."""
+
+import pytest
+
+import ds_common.models  # noqa: F401
+from ds_common.models.game_time import GameTime
+from ds_common.models.memory_settings import MemorySettings
+from ds_common.repository.game_time import GameTimeRepository
+from ds_common.repository.memory_settings import MemorySettingsRepository
+from ds_common.repository.singleton_repository import SingletonRepository
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache(monkeypatch):
+    """Give every test its own snapshot cache."""
+    monkeypatch.setattr(SingletonRepository, "_snapshots", {})
+
+
+class TestSingletonCache:
+    """Tests for SingletonRepository snapshot handling."""
+
+    def test_reads_return_independent_copies(self):
+        """Test that changes to a returned row do not reach the cache."""
+        repo = MemorySettingsRepository(None)
+        repo._cache(MemorySettings(), session=None)
+
+        first = repo._get_cached()
+        first.session_memory_expiration_hours = 99
+
+        assert repo._get_cached().session_memory_expiration_hours == 4
+
+    def test_caller_session_drops_cache(self):
+        """Test that a write in a caller's session is not cached before it commits."""
+        repo = MemorySettingsRepository(None)
+        repo._cache(MemorySettings(), session=None)
+
+        repo._cache(MemorySettings(session_memory_expiration_hours=8), session=object())
+
+        assert repo._get_cached() is None
+
+    def test_caches_are_per_model(self):
+        """Test that each singleton table has its own snapshot."""
+        settings_repo = MemorySettingsRepository(None)
+        settings_repo._cache(MemorySettings(), session=None)
+
+        assert GameTimeRepository(None)._get_cached() is None
+        assert settings_repo._get_cached() is not None
+
+    def test_game_time_copies_share_parsed_config(self):
+        """Test that the parsed config is not rebuilt for every cached read."""
+        repo = GameTimeRepository(None)
+        game_time = GameTime()
+        repo._cache(game_time, session=None)
+
+        assert repo._get_cached().parsed_config is game_time.parsed_config
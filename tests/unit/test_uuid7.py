@@ -0,0 +1,32 @@
+"""Tests for UUIDv7 generation."""
+
+import time
+
+from ds_common.models.base_model import uuid7
+
+
+class TestUUID7:
+    """Tests for uuid7 function."""
+
+    def test_version_and_variant(self):
+        """Test that generated IDs are RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_embeds_current_millisecond_timestamp(self):
+        """Test that the leading 48 bits hold the creation time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after
+
+    def test_ids_sort_by_creation_time(self):
+        """Test that IDs from different milliseconds sort in creation order."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first < second
@@ -0,0 +1,33 @@
+"""Tests for world model field validation."""
+
+import pytest
+from pydantic import ValidationError
+
+from ds_common.models.world_event import WorldEvent
+from ds_common.models.world_item import WorldItem
+from ds_common.models.world_memory import WorldMemory
+
+
+class TestAllowedValueValidation:
+    """Tests for the Literal-backed allowed-value checks on world models."""
+
+    def test_valid_values_accepted(self):
+        """Test that values from the Literal aliases pass validation."""
+        event = WorldEvent.model_validate(
+            {"title": "Blackout", "event_type": "TRIGGERED", "impact_level": "major"}
+        )
+
+        assert event.status == "PLANNED"
+        assert event.impact_level == "major"
+
+    def test_unknown_value_rejected(self):
+        """Test that a value outside the Literal alias is rejected."""
+        with pytest.raises(ValidationError, match="item_type"):
+            WorldItem.model_validate({"name": "Relic", "item_type": "TRINKET"})
+
+    def test_optional_field_accepts_none(self):
+        """Test that optional constrained fields may be left unset."""
+        memory = WorldMemory.model_validate({"title": "Founding"})
+
+        assert memory.memory_category is None
+        assert memory.impact_level is None